@@ -8,12 +8,14 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
-"""Deepchecks."""
+"""Deepchecks.
+
+Subpackages and the objects exported by this module are imported lazily on first access, so importing deepchecks
+does not load the tabular stack and the plotting libraries until they are used.
+"""
+import importlib
 import os
-import sys
-import types
 import warnings
-from importlib._bootstrap import _init_module_attrs
 
 try:
     from importlib.metadata import version
@@ -27,18 +29,7 @@ except ImportError:
 # NOTE: it is here, before other import, in order to omit circular import error
 __version__ = version('deepchecks')
 
-import matplotlib
-import plotly.io as pio
-
 from deepchecks.analytics.anonymous_telemetry import validate_latest_version
-from deepchecks.core import (BaseCheck, BaseSuite, CheckFailure, CheckResult, Condition, ConditionCategory,
-                             ConditionResult, ModelOnlyBaseCheck, SingleDatasetBaseCheck, SuiteResult,
-                             TrainTestBaseCheck)
-# TODO: remove in further versions
-from deepchecks.tabular import (Context, Dataset, ModelComparisonCheck, ModelComparisonSuite, ModelOnlyCheck,
-                                SingleDatasetCheck, Suite, TrainTestCheck)
-from deepchecks.utils.ipython import is_notebook
-from deepchecks.utils.logger import get_verbosity, set_verbosity
 
 __all__ = [
     # core
@@ -68,21 +59,6 @@ __all__ = [
 ]
 
 
-# Matplotlib has multiple backends. If we are in a context that does not support GUI (For example, during unit tests)
-# we can't use a GUI backend. Thus we must use a non-GUI backend.
-if not is_notebook():
-    matplotlib.use('Agg')
-
-
-# We can't rely on that the user will have an active internet connection, thus we change the default backend to
-# "notebook" If plotly detects the 'notebook-connected' backend.
-# for more info, see: https://plotly.com/python/renderers/
-pio_backends = pio.renderers.default.split('+')
-if 'notebook_connected' in pio_backends:
-    pio_backends[pio_backends.index('notebook_connected')] = 'notebook'
-    pio.renderers.default = '+'.join(pio_backends)
-
-
 # Send an import event if not disabled
 validate_latest_version()
 
@@ -96,50 +72,56 @@ warnings.filterwarnings(
 )
 
 
-# NOTE:
-# Code below is a temporary hack that exists only to provide backward compatibility
-# and will be removed in the next versions.
-
-# TODO:
-# python (>=3.7) provides an ability to modify module attribute access by
-# implementing '__getattr__' function on the module level scope
-
-__original_module__ = sys.modules[__name__]
+_SUBPACKAGES = ('analytics', 'core', 'datasets', 'nlp', 'tabular', 'utils', 'vision')
 
+_LAZY_ROUTINES = {
+    # core
+    'BaseCheck': 'deepchecks.core',
+    'SingleDatasetBaseCheck': 'deepchecks.core',
+    'TrainTestBaseCheck': 'deepchecks.core',
+    'ModelOnlyBaseCheck': 'deepchecks.core',
+    'CheckResult': 'deepchecks.core',
+    'CheckFailure': 'deepchecks.core',
+    'Condition': 'deepchecks.core',
+    'ConditionResult': 'deepchecks.core',
+    'ConditionCategory': 'deepchecks.core',
+    'BaseSuite': 'deepchecks.core',
+    'SuiteResult': 'deepchecks.core',
+    # TODO: remove in further versions
+    'Dataset': 'deepchecks.tabular',
+    'Suite': 'deepchecks.tabular',
+    'Context': 'deepchecks.tabular',
+    'SingleDatasetCheck': 'deepchecks.tabular',
+    'TrainTestCheck': 'deepchecks.tabular',
+    'ModelOnlyCheck': 'deepchecks.tabular',
+    'ModelComparisonCheck': 'deepchecks.tabular',
+    'ModelComparisonSuite': 'deepchecks.tabular',
+    # logger
+    'set_verbosity': 'deepchecks.utils.logger',
+    'get_verbosity': 'deepchecks.utils.logger',
+}
 
-class _SubstituteModule(types.ModuleType):
-    """Substitute module type to provide backward compatibility."""
 
-    ROUTINES = (
-        'Dataset',
-        'Suite',
-        'Context',
-        'SingleDatasetCheck',
-        'TrainTestCheck',
-        'ModelOnlyCheck',
-        'ModelComparisonCheck',
-        'ModelComparisonSuite',
-    )
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'{__name__}.{name}')
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.__dict__.update(__original_module__.__dict__)
+    if name not in _LAZY_ROUTINES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-    def __getattribute__(self, name):
-        routines = object.__getattribute__(self, 'ROUTINES')
-        if name in routines:
-            deprecation_warning = 'Ability to import base tabular functionality from the `deepchecks` package ' \
-                                  'directly is deprecated, please import from `deepchecks.tabular` instead'
+    module_name = _LAZY_ROUTINES[name]
+    if module_name == 'deepchecks.tabular':
+        deprecation_warning = 'Ability to import base tabular functionality from the `deepchecks` package ' \
+                              'directly is deprecated, please import from `deepchecks.tabular` instead'
 
-            if os.environ.get('FAIL_ON_DEEPCHECKS_DEPRECATION_WARNINGS') == 'true':
-                raise DeprecationWarning(deprecation_warning)
-            warnings.warn(
-                deprecation_warning,
-                DeprecationWarning
-            )
-        return object.__getattribute__(self, name)
+        if os.environ.get('FAIL_ON_DEEPCHECKS_DEPRECATION_WARNINGS') == 'true':
+            raise DeprecationWarning(deprecation_warning)
+        warnings.warn(
+            deprecation_warning,
+            DeprecationWarning
+        )
+    return getattr(importlib.import_module(module_name), name)
 
 
-__substitute_module__ = _SubstituteModule(__name__)
-_init_module_attrs(__original_module__.__spec__, __substitute_module__, override=True)
-sys.modules[__name__] = __substitute_module__
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
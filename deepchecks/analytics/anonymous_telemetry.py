@@ -14,12 +14,13 @@ Module for anonymous telemetry.
 No credentials, data, personal information or anything private is collected (and will never be).
 """
 import http.client
+import logging
 import os
 import pathlib
+import threading
 import uuid
 
 import deepchecks
-from deepchecks.utils.logger import get_logger
 
 MODULE_DIR = pathlib.Path(__file__).absolute().parent.parent
 ANALYTICS_DISABLED = os.environ.get('DISABLE_DEEPCHECKS_ANONYMOUS_TELEMETRY', False) or \
@@ -27,25 +28,36 @@ ANALYTICS_DISABLED = os.environ.get('DISABLE_DEEPCHECKS_ANONYMOUS_TELEMETRY', Fa
 
 
 def validate_latest_version():
-    """Check if we are on the latest version and send an anonymous import event to PostHog."""
+    """Check if we are on the latest version and send an anonymous import event to PostHog.
+
+    The check runs on a daemon thread, so it never blocks the import of deepchecks (for example when there is no
+    internet connection) and never keeps the interpreter from exiting.
+    """
     if not ANALYTICS_DISABLED:
-        try:
-            if os.path.exists(os.path.join(MODULE_DIR, '.user_id')):
-                with open(os.path.join(MODULE_DIR, '.user_id'), 'r', encoding='utf8') as f:
-                    user_id = f.read()
-            else:
-                user_id = str(uuid.uuid4())
-                with open(os.path.join(MODULE_DIR, '.user_id'), 'w', encoding='utf8') as f:
-                    f.write(user_id)
-
-            conn = http.client.HTTPSConnection('api.deepchecks.com', timeout=3)
-            conn.request('GET', f'/v3/latest?version={deepchecks.__version__}&uuid={user_id}')
-            result = conn.getresponse()
-            is_on_latest = result.read().decode() == 'True'
-            if not is_on_latest:
-                get_logger().warning('You are using deepchecks version %s, however a newer version is available.'
-                                     'Deepchecks is frequently updated with major improvements. You should consider '
-                                     'upgrading via the "python -m pip install --upgrade deepchecks" command.',
-                                     deepchecks.__version__)
-        except Exception:  # pylint: disable=broad-except
-            pass
+        threading.Thread(target=_validate_latest_version, name='deepchecks-version-check', daemon=True).start()
+
+
+def _validate_latest_version():
+    """Send the latest version request and warn if a newer version is available."""
+    try:
+        if os.path.exists(os.path.join(MODULE_DIR, '.user_id')):
+            with open(os.path.join(MODULE_DIR, '.user_id'), 'r', encoding='utf8') as f:
+                user_id = f.read()
+        else:
+            user_id = str(uuid.uuid4())
+            with open(os.path.join(MODULE_DIR, '.user_id'), 'w', encoding='utf8') as f:
+                f.write(user_id)
+
+        conn = http.client.HTTPSConnection('api.deepchecks.com', timeout=3)
+        conn.request('GET', f'/v3/latest?version={deepchecks.__version__}&uuid={user_id}')
+        result = conn.getresponse()
+        is_on_latest = result.read().decode() == 'True'
+        if not is_on_latest:
+            # deepchecks.utils.logger is not used, as importing deepchecks.utils imports deepchecks.core
+            logging.getLogger('deepchecks').warning(
+                'You are using deepchecks version %s, however a newer version is available.'
+                'Deepchecks is frequently updated with major improvements. You should consider '
+                'upgrading via the "python -m pip install --upgrade deepchecks" command.',
+                deepchecks.__version__)
+    except Exception:  # pylint: disable=broad-except
+        pass
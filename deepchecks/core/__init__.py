@@ -12,6 +12,11 @@
 
 Import objects to be available in parent deepchecks module.
 """
+import matplotlib
+import plotly.io as pio
+
+from deepchecks.utils.ipython import is_notebook
+
 from .check_json import CheckFailureJson, CheckResultJson
 from .check_result import CheckFailure, CheckResult
 from .checks import BaseCheck, DatasetKind, ModelOnlyBaseCheck, SingleDatasetBaseCheck, TrainTestBaseCheck
@@ -34,3 +39,18 @@ __all__ = [
     'ModelOnlyBaseCheck',
     'DatasetKind'
 ]
+
+
+# Matplotlib has multiple backends. If we are in a context that does not support GUI (For example, during unit tests)
+# we can't use a GUI backend. Thus we must use a non-GUI backend.
+if not is_notebook():
+    matplotlib.use('Agg')
+
+
+# We can't rely on that the user will have an active internet connection, thus we change the default backend to
+# "notebook" If plotly detects the 'notebook-connected' backend.
+# for more info, see: https://plotly.com/python/renderers/
+_pio_backends = pio.renderers.default.split('+')
+if 'notebook_connected' in _pio_backends:
+    _pio_backends[_pio_backends.index('notebook_connected')] = 'notebook'
+    pio.renderers.default = '+'.join(_pio_backends)
@@ -83,7 +83,8 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
                                   min_pps_to_show: float = 0.05,
                                   random_state: int = None,
                                   with_display: bool = True,
-                                  dataset_names: Tuple[str] = DEFAULT_DATASET_NAMES
+                                  dataset_names: Tuple[str] = DEFAULT_DATASET_NAMES,
+                                  n_jobs: int = 1
                                   ):
     """
     Calculate the PPS for train, test and difference for feature label correlation checks.
@@ -112,6 +113,8 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
             Random state for the ppscore.predictors function
         dataset_names: tuple, default: DEFAULT_DATASET_NAMES
             The names to show in the display for the first and second datasets.
+        n_jobs: int, default: 1
+            Number of processes used by the ppscore.predictors function. -1 uses all available CPUs.
 
     Returns:
         CheckResult
@@ -119,11 +122,11 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
             display: bar graph of the PPS of each feature.
     """
     df_pps_train = pps.predictors(df=train_df, y=train_label_name,
-                                  random_seed=random_state,
+                                  random_seed=random_state, n_jobs=n_jobs,
                                   **ppscore_params)
     df_pps_test = pps.predictors(df=test_df,
                                  y=test_label_name,
-                                 random_seed=random_state, **ppscore_params)
+                                 random_seed=random_state, n_jobs=n_jobs, **ppscore_params)
 
     s_pps_train = df_pps_train.set_index('x', drop=True)['ppscore']
     s_pps_test = df_pps_test.set_index('x', drop=True)['ppscore']
@@ -156,7 +159,8 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
                                             min_pps_to_show: float = 0.05,
                                             random_state: int = None,
                                             with_display: bool = True,
-                                            dataset_names: Tuple[str] = DEFAULT_DATASET_NAMES
+                                            dataset_names: Tuple[str] = DEFAULT_DATASET_NAMES,
+                                            n_jobs: int = 1
                                             ):
     """
     Calculate the PPS for train, test and difference for feature label correlation checks per class.
@@ -185,6 +189,8 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
             Random state for the ppscore.predictors function
         dataset_names: tuple, default: DEFAULT_DATASET_NAMES
             The names to show in the display for the first and second datasets.
+        n_jobs: int, default: 1
+            Number of processes used by the ppscore.predictors function. -1 uses all available CPUs.
 
     Returns:
         CheckResult
@@ -208,11 +214,11 @@ def get_feature_label_correlation_per_class(train_df: pd.DataFrame, train_label_
             lambda x: 1 if x == c else 0)  # pylint: disable=cell-var-from-loop
 
         df_pps_train = pps.predictors(df=train_df_all_vs_one, y=train_label_name,
-                                      random_seed=random_state,
+                                      random_seed=random_state, n_jobs=n_jobs,
                                       **ppscore_params)
         df_pps_test = pps.predictors(df=test_df_all_vs_one,
                                      y=test_label_name,
-                                     random_seed=random_state, **ppscore_params)
+                                     random_seed=random_state, n_jobs=n_jobs, **ppscore_params)
 
         s_pps_train = df_pps_train.set_index('x', drop=True)['ppscore']
         s_pps_test = df_pps_test.set_index('x', drop=True)['ppscore']
@@ -27,6 +27,7 @@ from deepchecks.utils.strings import get_ellipsis as truncate_string
 __all__ = ['UnknownTokens']
 
 OTHER_CAT_NAME = 'Other Unknown Words'
+TOKENIZER_BATCH_SIZE = 10_000
 
 
 @docstrings
@@ -132,20 +133,38 @@ class UnknownTokens(SingleDatasetCheck):
                           'Please check your internet connection.')
             tokenize = str.split
 
-        # Tokenize samples and count unknown words
+        # Tokenize samples, and find which of the distinct words contain unknown tokens
         words_array = [tokenize(sample) for sample in samples]
-        all_unknown_words = []
+        unique_words = list(dict.fromkeys(word for words in words_array for word in words))
+        unknown_words = set(self._find_words_with_unknown_tokens(unique_words))
+
+        # Count unknown words
+        all_unknown_words_counter = Counter()
         unknown_word_indexes = {}
         total_words = 0
         for idx, words in zip(indices, words_array):
             total_words += len(words)
             for word in words:
-                tokens = self.tokenizer.tokenize(word)
-                if any(self.tokenizer.convert_tokens_to_ids(token) == self.tokenizer.unk_token_id for token in tokens):
-                    all_unknown_words.append(word)
+                if word in unknown_words:
+                    all_unknown_words_counter[word] += 1
                     unknown_word_indexes.setdefault(word, []).append(idx)
 
-        return Counter(all_unknown_words), total_words, unknown_word_indexes
+        return all_unknown_words_counter, total_words, unknown_word_indexes
+
+    def _find_words_with_unknown_tokens(self, words: t.List[str]) -> t.List[str]:
+        """Return the words that are tokenized into at least one unknown token."""
+        unk_token_id = self.tokenizer.unk_token_id
+        if getattr(self.tokenizer, 'is_fast', False):
+            # Fast tokenizers encode a whole batch of words in a single call
+            unknown_words = []
+            for start in range(0, len(words), TOKENIZER_BATCH_SIZE):
+                batch = words[start:start + TOKENIZER_BATCH_SIZE]
+                input_ids = self.tokenizer(batch, add_special_tokens=False)['input_ids']
+                unknown_words.extend(word for word, ids in zip(batch, input_ids) if unk_token_id in ids)
+            return unknown_words
+
+        return [word for word in words
+                if unk_token_id in self.tokenizer.convert_tokens_to_ids(self.tokenizer.tokenize(word))]
 
     def create_pie_chart(self, all_unknown_words_counter, total_words):
         """Create pie chart with most common unknown words."""
@@ -35,7 +35,7 @@ class WeakSegmentsAbstractText(SingleDatasetCheck, WeakSegmentAbstract):
                  ignore_columns: Union[Hashable, List[Hashable], None], n_top_features: Optional[int],
                  segment_minimum_size_ratio: float, alternative_scorer: Dict[str, Callable],
                  score_per_sample: Union[np.ndarray, pd.Series, None], n_samples: int,
-                 categorical_aggregation_threshold: float, n_to_show: int, **kwargs):
+                 categorical_aggregation_threshold: float, n_to_show: int, n_jobs: int = 1, **kwargs):
         super().__init__(**kwargs)
         self.segment_by = segment_by
         self.columns = columns
@@ -47,6 +47,7 @@ class WeakSegmentsAbstractText(SingleDatasetCheck, WeakSegmentAbstract):
         self.score_per_sample = score_per_sample
         self.alternative_scorer = alternative_scorer if alternative_scorer else None
         self.categorical_aggregation_threshold = categorical_aggregation_threshold
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check."""
@@ -150,6 +151,8 @@ class PropertySegmentsPerformance(WeakSegmentsAbstractText):
         number of segments with the weakest performance to show.
     categorical_aggregation_threshold : float , default: 0.05
         In each categorical column, categories with frequency below threshold will be merged into "Other" category.
+    n_jobs : int , default: 1
+        Number of processes used to search the weak segments of the feature pairs. -1 uses all available CPUs.
     """
 
     def __init__(self,
@@ -162,6 +165,7 @@ class PropertySegmentsPerformance(WeakSegmentsAbstractText):
                  n_samples: int = 10_000,
                  categorical_aggregation_threshold: float = 0.05,
                  n_to_show: int = 3,
+                 n_jobs: int = 1,
                  **kwargs):
         super().__init__(segment_by='properties',
                          columns=properties,
@@ -173,6 +177,7 @@ class PropertySegmentsPerformance(WeakSegmentsAbstractText):
                          score_per_sample=score_per_sample,
                          alternative_scorer=alternative_scorer,
                          categorical_aggregation_threshold=categorical_aggregation_threshold,
+                         n_jobs=n_jobs,
                          **kwargs)
 
 
@@ -215,6 +220,8 @@ class MetadataSegmentsPerformance(WeakSegmentsAbstractText):
         number of segments with the weakest performance to show.
     categorical_aggregation_threshold : float , default: 0.05
         In each categorical column, categories with frequency below threshold will be merged into "Other" category.
+    n_jobs : int , default: 1
+        Number of processes used to search the weak segments of the feature pairs. -1 uses all available CPUs.
     """
 
     def __init__(self,
@@ -227,6 +234,7 @@ class MetadataSegmentsPerformance(WeakSegmentsAbstractText):
                  n_samples: int = 10_000,
                  categorical_aggregation_threshold: float = 0.05,
                  n_to_show: int = 3,
+                 n_jobs: int = 1,
                  **kwargs):
         super().__init__(segment_by='metadata',
                          columns=columns,
@@ -238,4 +246,5 @@ class MetadataSegmentsPerformance(WeakSegmentsAbstractText):
                          score_per_sample=score_per_sample,
                          alternative_scorer=alternative_scorer,
                          categorical_aggregation_threshold=categorical_aggregation_threshold,
+                         n_jobs=n_jobs,
                          **kwargs)
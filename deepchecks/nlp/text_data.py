@@ -10,6 +10,7 @@
 #
 """The dataset module containing the tabular Dataset class and its functions."""
 import contextlib
+import pathlib
 import typing as t
 import warnings
 from numbers import Number
@@ -21,6 +22,7 @@ from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueE
 from deepchecks.nlp.input_validations import (validate_length_and_calculate_column_types, validate_modify_label,
                                               validate_raw_text, validate_tokenized_text)
 from deepchecks.nlp.task_type import TaskType, TTextLabel
+from deepchecks.nlp.utils.properties_cache import PropertiesCache
 from deepchecks.nlp.utils.text_properties import calculate_default_properties
 from deepchecks.utils.logger import get_logger
 from deepchecks.utils.validation import is_sequence_not_str
@@ -308,7 +310,10 @@ class TextData:
         include_properties: t.Optional[t.List[str]] = None,
         ignore_properties: t.Optional[t.List[str]] = None,
         include_long_calculation_properties: bool = False,
-        device: t.Optional[str] = None
+        device: t.Optional[str] = None,
+        n_jobs: int = 1,
+        batch_size: int = 16,
+        cache: t.Optional[t.Union[str, pathlib.Path, PropertiesCache]] = None
     ):
         """Calculate the default properties of the dataset.
 
@@ -325,6 +330,13 @@ class TextData:
             ignored.
         device : int, default None
             The device to use for the calculation. If None, the default device will be used.
+        n_jobs : int, default 1
+            Number of processes used to calculate the properties that don't use a model. -1 uses all available CPUs.
+        batch_size : int, default 16
+            Number of texts in each inference batch of the properties that use a model.
+        cache : Union[str, pathlib.Path, PropertiesCache], default None
+            A PropertiesCache, or a path of its database file. Properties are calculated only for texts whose values
+            are not in the cache yet, and then stored in it.
         """
         if self._properties is not None:
             warnings.warn('Properties already exist, overwriting them', UserWarning)
@@ -334,7 +346,10 @@ class TextData:
             include_properties=include_properties,
             ignore_properties=ignore_properties,
             include_long_calculation_properties=include_long_calculation_properties,
-            device=device
+            device=device,
+            n_jobs=n_jobs,
+            batch_size=batch_size,
+            cache=cache
         )
 
         self._properties = pd.DataFrame(properties, index=self.get_original_text_indexes())
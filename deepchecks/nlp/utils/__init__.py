@@ -10,11 +10,15 @@
 #
 """Utils package for nlp functionality."""
 
+from deepchecks.nlp.utils.embeddings_store import EmbeddingsStore
 from deepchecks.nlp.utils.llm_utils import calculate_embeddings_for_text, call_open_ai_completion_api
+from deepchecks.nlp.utils.properties_cache import PropertiesCache
 from deepchecks.nlp.utils.text_properties import calculate_default_properties
 
 __all__ = [
     'calculate_embeddings_for_text',
     'call_open_ai_completion_api',
-    'calculate_default_properties'
+    'calculate_default_properties',
+    'PropertiesCache',
+    'EmbeddingsStore'
 ]
@@ -0,0 +1,119 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing a binary on-disk store for text embeddings."""
+import os
+import pathlib
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from deepchecks.core.errors import DeepchecksValueError
+
+__all__ = ['EmbeddingsStore']
+
+
+class EmbeddingsStore:
+    """On-disk store of text embeddings, keyed by the hash of each text.
+
+    The embeddings are saved as raw float32 rows in a binary file, which is memory-mapped instead of being read
+    into memory, and the hashes of the embedded texts are saved next to it in a '.index' file, after the dimension
+    of the embeddings. New embeddings are appended to both files, so adding embeddings doesn't rewrite the stored
+    ones. Texts that already have embeddings in the store don't need to be embedded again.
+
+    Parameters
+    ----------
+    path : Union[str, pathlib.Path]
+        Path of the embeddings file. The index is saved to the same path with an additional '.index' suffix.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self.path = pathlib.Path(path)
+        self.index_path = self.path.with_name(self.path.name + '.index')
+
+    def __len__(self) -> int:
+        """Return the number of stored embeddings."""
+        return len(self.load_index())
+
+    def _load_index_file(self) -> Tuple[int, np.ndarray]:
+        if not self.index_path.exists():
+            return 0, np.empty(0, dtype=np.int64)
+        index = np.fromfile(self.index_path, dtype=np.int64)
+        return int(index[0]), index[1:]
+
+    def load_index(self) -> np.ndarray:
+        """Return the hashes of the stored texts, in the order of the rows of the embeddings array."""
+        return self._load_index_file()[1]
+
+    def load(self, mmap: bool = True) -> np.ndarray:
+        """Return the stored embeddings array, memory-mapped in read-only mode by default."""
+        dim, index = self._load_index_file()
+        if len(index) == 0:
+            return np.empty((0, dim), dtype=np.float32)
+        # The embeddings file may have rows after the indexed ones, if adding embeddings was interrupted
+        if mmap:
+            return np.memmap(self.path, dtype=np.float32, mode='r', shape=(len(index), dim))
+        return np.fromfile(self.path, dtype=np.float32, count=len(index) * dim).reshape(len(index), dim)
+
+    def get(self, text_hashes: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the stored embeddings of the given text hashes.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            A boolean mask of the hashes found in the store, and the embeddings of the found hashes, in their order.
+        """
+        text_hashes = np.asarray(text_hashes, dtype=np.int64)
+        index = self.load_index()
+        if len(index) == 0:
+            return np.zeros(len(text_hashes), dtype=bool), np.empty((0, 0), dtype=np.float32)
+        sorter = np.argsort(index)
+        positions = np.searchsorted(index, text_hashes, sorter=sorter)
+        positions = np.minimum(positions, len(index) - 1)
+        rows = sorter[positions]
+        found = index[rows] == text_hashes
+        return found, np.asarray(self.load()[rows[found]])
+
+    def add(self, text_hashes: Sequence[int], embeddings: np.ndarray):
+        """Add the embeddings of the given text hashes to the store, skipping hashes that are already stored."""
+        text_hashes = np.asarray(text_hashes, dtype=np.int64)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or len(embeddings) != len(text_hashes):
+            raise DeepchecksValueError('embeddings must be a 2D array with a row for each text hash')
+        dim, index = self._load_index_file()
+        _, first_occurrences = np.unique(text_hashes, return_index=True)
+        new = np.zeros(len(text_hashes), dtype=bool)
+        new[first_occurrences] = True
+        new &= ~np.isin(text_hashes, index)
+        if not new.any():
+            return
+
+        if not self.index_path.exists():
+            dim = embeddings.shape[1]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_bytes(b'')
+            self.index_path.write_bytes(np.array([dim], dtype=np.int64).tobytes())
+        elif dim != embeddings.shape[1]:
+            raise DeepchecksValueError(f'Embeddings dimension {embeddings.shape[1]} does not match the dimension '
+                                       f'of the stored embeddings {dim}')
+        # The embeddings are appended before their hashes, so an interrupted add leaves only rows which are not in
+        # the index, and those are dropped before appending
+        with open(self.path, 'r+b') as f:
+            f.truncate(len(index) * dim * np.dtype(np.float32).itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(np.ascontiguousarray(embeddings[new]).tobytes())
+        with open(self.index_path, 'ab') as f:
+            f.write(text_hashes[new].tobytes())
+
+    def clear(self):
+        """Remove all the stored embeddings."""
+        for path in (self.path, self.index_path):
+            if path.exists():
+                path.unlink()
@@ -9,14 +9,27 @@
 # ----------------------------------------------------------------------------
 #
 """Utils module for calculating embeddings or completion for text."""
-from typing import List, Optional, Sequence
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar, Union
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from deepchecks.nlp.utils.embeddings_store import EmbeddingsStore
+from deepchecks.nlp.utils.text import hash_text
+from deepchecks.utils.parallel import effective_n_jobs
+
+OPEN_AI_EMBEDDINGS_BATCH_SIZE = 500
+
+T = TypeVar('T')
+
 
 def calculate_embeddings_for_text(text: pd.Series, model: str = 'miniLM',
-                                  file_path: Optional[str] = 'embeddings.csv') -> pd.DataFrame:
+                                  file_path: Optional[str] = 'embeddings.csv',
+                                  embeddings_store: Optional[Union[str, pathlib.Path, EmbeddingsStore]] = None,
+                                  n_jobs: int = 1) -> pd.DataFrame:
     """
     Get default embeddings for the dataset.
 
@@ -30,12 +43,54 @@ def calculate_embeddings_for_text(text: pd.Series, model: str = 'miniLM',
         by using the command openai.api_key = YOUR_API_KEY
     file_path : Optional[str], default 'embeddings.csv'
         If given, the embeddings will be saved to the given file path.
+    embeddings_store : Union[str, pathlib.Path, EmbeddingsStore], default None
+        An EmbeddingsStore, or a path of its embeddings file, storing the embeddings by the hash of each text. Texts
+        whose embeddings are already in the store are not embedded again, and the new embeddings are added to it.
+        If None, the embeddings of all the texts are calculated.
+    n_jobs : int, default 1
+        Number of batches sent concurrently to the embeddings API, for the 'open_ai' option. -1 uses all cpus.
 
     Returns
     -------
         pd.DataFrame
             The embeddings for the dataset.
     """
+    if model not in ('miniLM', 'open_ai'):
+        raise ValueError(f'Unknown model type: {model}')
+    if len(text) == 0:
+        return pd.DataFrame(index=text.index)
+
+    store = embeddings_store
+    if store is not None and not isinstance(store, EmbeddingsStore):
+        store = EmbeddingsStore(store)
+    text_hashes = np.array([hash_text(f'{model}:{x}') for x in text], dtype=np.int64)
+    unique_hashes, first_occurrences, inverse = np.unique(text_hashes, return_index=True, return_inverse=True)
+    unique_text = [text.iloc[i] for i in first_occurrences]
+
+    if store is not None:
+        found, stored_embeddings = store.get(unique_hashes)
+    else:
+        found, stored_embeddings = np.zeros(len(unique_hashes), dtype=bool), None
+    text_to_embed = [x for x, is_found in zip(unique_text, found) if not is_found]
+
+    new_embeddings = _embed(text_to_embed, model, n_jobs) if text_to_embed else None
+    if store is not None and new_embeddings is not None:
+        store.add(unique_hashes[~found], new_embeddings)
+
+    dim = stored_embeddings.shape[1] if found.any() else new_embeddings.shape[1]
+    unique_embeddings = np.empty((len(unique_hashes), dim), dtype=np.float32)
+    if found.any():
+        unique_embeddings[found] = stored_embeddings
+    if new_embeddings is not None:
+        unique_embeddings[~found] = new_embeddings
+
+    embeddings = pd.DataFrame(unique_embeddings[inverse.reshape(-1)], index=text.index)
+    if file_path is not None:
+        embeddings.to_csv(file_path, index=True)
+    return embeddings
+
+
+def _embed(text: List[str], model: str, n_jobs: int) -> np.ndarray:
     if model == 'miniLM':
         try:
             import sentence_transformers  # pylint: disable=import-outside-toplevel
@@ -44,36 +99,38 @@ def calculate_embeddings_for_text(text: pd.Series, model: str = 'miniLM',
                 'get_default_embeddings with model="miniLM" requires the sentence_transformers python package. '
                 'To get it, run "pip install sentence_transformers".') from e
 
-        model = sentence_transformers.SentenceTransformer('all-MiniLM-L6-v2')
-        embeddings = model.encode(text)
-    elif model == 'open_ai':
-        try:
-            import openai  # pylint: disable=import-outside-toplevel
-        except ImportError as e:
-            raise ImportError('get_default_embeddings with model="open_ai" requires the openai python package. '
-                              'To get it, run "pip install openai".') from e
-
-        from tenacity import (retry, stop_after_attempt,  # pylint: disable=import-outside-toplevel
-                              wait_random_exponential)
-
-        @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
-        def _get_embedding_with_backoff(list_of_strings):
-            return openai.Embedding.create(input=list_of_strings, model='text-embedding-ada-002')['data']
-
-        batch_size = 500
-        embeddings = []
-        clean_text = [_clean_special_chars(x) for x in text]
-        for sub_list in tqdm([clean_text[x:x + batch_size] for x in range(0, len(text), batch_size)],
-                             desc='Calculating Embeddings '):
-            open_ai_response = _get_embedding_with_backoff(sub_list)
-            for x in open_ai_response:
-                embeddings.append(x['embedding'])
-    else:
-        raise ValueError(f'Unknown model type: {model}')
-    embeddings = pd.DataFrame(embeddings, index=text.index)
-    if file_path is not None:
-        embeddings.to_csv(file_path, index=True)
-    return embeddings
+        sentence_model = sentence_transformers.SentenceTransformer('all-MiniLM-L6-v2')
+        return np.asarray(sentence_model.encode(text), dtype=np.float32)
+
+    try:
+        import openai  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError('get_default_embeddings with model="open_ai" requires the openai python package. '
+                          'To get it, run "pip install openai".') from e
+
+    from tenacity import (retry, stop_after_attempt,  # pylint: disable=import-outside-toplevel
+                          wait_random_exponential)
+
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
+    def _get_embedding_with_backoff(list_of_strings):
+        response = openai.Embedding.create(input=list_of_strings, model='text-embedding-ada-002')['data']
+        return [x['embedding'] for x in sorted(response, key=lambda x: x['index'])]
+
+    clean_text = [_clean_special_chars(x) for x in text]
+    batches = [clean_text[x:x + OPEN_AI_EMBEDDINGS_BATCH_SIZE]
+               for x in range(0, len(clean_text), OPEN_AI_EMBEDDINGS_BATCH_SIZE)]
+    results = _fetch_batches_concurrently(batches, _get_embedding_with_backoff, n_jobs, 'Calculating Embeddings ')
+    return np.asarray([embedding for batch in results for embedding in batch], dtype=np.float32)
+
+
+def _fetch_batches_concurrently(batches: Sequence[T], fetch_batch: Callable[[T], list], n_jobs: int,
+                                desc: str) -> List[list]:
+    """Call fetch_batch on each batch with up to n_jobs calls in flight, and return the results in the batches order."""
+    max_workers = effective_n_jobs(n_jobs)
+    if max_workers == 1 or len(batches) <= 1:
+        return [fetch_batch(batch) for batch in tqdm(batches, desc=desc)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(tqdm(executor.map(fetch_batch, batches), total=len(batches), desc=desc))
 
 
 def call_open_ai_completion_api(inputs: Sequence[str], max_tokens=200, batch_size=20,  # api limit of 20 requests
@@ -0,0 +1,135 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing an on-disk cache for text properties."""
+import contextlib
+import hashlib
+import pathlib
+import sqlite3
+import time
+from typing import Any, Dict, Iterator, Sequence, Union
+
+import numpy as np
+
+from deepchecks.core.errors import DeepchecksValueError
+
+__all__ = ['PropertiesCache']
+
+# Max number of parameters in a single SQLite query is 999 in old SQLite versions
+_QUERY_BATCH_SIZE = 900
+
+
+class PropertiesCache:
+    """On-disk cache of text properties values, keyed by the hash of each text and the property name and version.
+
+    The values are stored in a SQLite database, so properties calculated in previous runs are only calculated again
+    for new texts. When the cache holds more than max_entries values, the least recently used values are evicted.
+
+    Parameters
+    ----------
+    path : Union[str, pathlib.Path]
+        Path of the cache database file. It is created if it doesn't exist.
+    max_entries : int, default: 10_000_000
+        Maximal number of property values (texts times properties) kept in the cache.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path], max_entries: int = 10_000_000):
+        if max_entries <= 0:
+            raise DeepchecksValueError(f'max_entries must be a positive integer, but got: {max_entries}')
+        self.path = pathlib.Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS properties ('
+                'text_hash TEXT NOT NULL, property TEXT NOT NULL, value, last_used REAL NOT NULL, '
+                'PRIMARY KEY (text_hash, property))'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS properties_last_used ON properties (last_used)')
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def hash_text(text: Any) -> str:
+        """Return the hash of the text used as its key in the cache."""
+        # The type is part of the hashed value, so missing texts don't collide with the strings 'None' or 'nan'
+        return hashlib.blake2b(f'{type(text).__name__}:{text}'.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, text_hashes: Sequence[str], properties: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the cached values of the properties for the given text hashes.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            A dictionary with the property as key and a dictionary of text hash to value, of the cached texts only.
+        """
+        values = {prop: {} for prop in properties}
+        if not properties:
+            return values
+        text_hashes = list(dict.fromkeys(text_hashes))
+        batch_size = max(_QUERY_BATCH_SIZE - len(properties), 1)
+        now = time.time()
+        with self._connect() as connection:
+            for start in range(0, len(text_hashes), batch_size):
+                batch = text_hashes[start:start + batch_size]
+                condition = (f'property IN ({",".join("?" * len(properties))}) '
+                             f'AND text_hash IN ({",".join("?" * len(batch))})')
+                rows = connection.execute(
+                    f'SELECT text_hash, property, value FROM properties WHERE {condition}', [*properties, *batch]
+                ).fetchall()
+                connection.execute(f'UPDATE properties SET last_used = ? WHERE {condition}',
+                                   [now, *properties, *batch])
+                for text_hash, prop, value in rows:
+                    # SQLite stores NaN values as NULL
+                    values[prop][text_hash] = np.nan if value is None else value
+        return values
+
+    def set(self, values: Dict[str, Dict[str, Any]]):
+        """Store the values of the properties, given as a dictionary of property to dictionary of text hash to value.
+
+        Least recently used values are evicted if the cache exceeds max_entries.
+        """
+        now = time.time()
+        rows = [(text_hash, prop, _to_sql_value(value), now)
+                for prop, property_values in values.items() for text_hash, value in property_values.items()]
+        with self._connect() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO properties (text_hash, property, value, last_used) VALUES (?, ?, ?, ?)', rows
+            )
+            n_entries = connection.execute('SELECT COUNT(*) FROM properties').fetchone()[0]
+            if n_entries > self.max_entries:
+                connection.execute(
+                    'DELETE FROM properties WHERE rowid IN '
+                    '(SELECT rowid FROM properties ORDER BY last_used LIMIT ?)', (n_entries - self.max_entries,)
+                )
+
+    def __len__(self) -> int:
+        """Return the number of cached property values."""
+        with self._connect() as connection:
+            return connection.execute('SELECT COUNT(*) FROM properties').fetchone()[0]
+
+    def clear(self):
+        """Remove all the cached values."""
+        with self._connect() as connection:
+            connection.execute('DELETE FROM properties')
+
+
+def _to_sql_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
@@ -9,17 +9,23 @@
 # ----------------------------------------------------------------------------
 #
 """Module of text utils for NLP package."""
+import hashlib
 import string
 import typing as t
 import unicodedata
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
+from deepchecks.utils.parallel import effective_n_jobs
+
 __all__ = [
     'break_to_lines_and_trim',
+    'download_nltk_resource',
+    'TextNormalizer',
     'normalize_text',
     'hash_text',
     'normalize_samples',
@@ -63,9 +69,34 @@ def break_to_lines_and_trim(s, max_lines: int = 10, min_line_length: int = 50, m
     return '<br>'.join(lines)
 
 
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+_NORMALIZATION_CHUNK_SIZE = 10_000
+
+_downloaded_nltk_resources = set()
+_stop_words = {}
+
+
+def download_nltk_resource(resource: str) -> bool:
+    """Download the nltk resource, trying again on the following calls only if the download failed."""
+    if resource not in _downloaded_nltk_resources:
+        if not nltk.download(resource, quiet=True):
+            return False
+        _downloaded_nltk_resources.add(resource)
+    return True
+
+
+def _get_stop_words(language: str = 'english') -> t.Optional[t.FrozenSet[str]]:
+    """Return the nltk stop words of the language, loaded once per process, or None if they are not available."""
+    if language not in _stop_words:
+        if not download_nltk_resource('stopwords'):
+            return None
+        _stop_words[language] = frozenset(stopwords.words(language))
+    return _stop_words[language]
+
+
 def remove_punctuation(text: str) -> str:
     """Remove punctuation characters from a string."""
-    return text.translate(str.maketrans('', '', string.punctuation))
+    return text.translate(_PUNCTUATION_TABLE)
 
 
 def normalize_unicode(text: str) -> str:
@@ -75,18 +106,70 @@ def normalize_unicode(text: str) -> str:
 
 def remove_stopwords(text: str) -> str:
     """Remove stop words from a string."""
-    if nltk.download('stopwords', quiet=True):
-        stop_words = set(stopwords.words('english'))
-    else:
-        warnings.warn('nltk stopwords not found, stopwords won\'t be ignored when considering text duplicates.'
-                      ' Please check your internet connection.')
-        return text
-    if nltk.download('punkt', quiet=True):
-        tokenize = word_tokenize
-    else:
-        tokenize = str.split
-    words = tokenize(text)
-    return ' '.join([word for word in words if word.lower() not in stop_words])
+    return TextNormalizer(ignore_case=False, remove_punct=False, normalize_uni=False)(text)
+
+
+class TextNormalizer:
+    """Normalize text samples by a fixed sequence of steps.
+
+    The resources needed by the steps (the punctuation translation table, nltk stop words and tokenizer) are
+    loaded once when the normalizer is created, and reused for all the normalized samples.
+
+    Parameters
+    ----------
+    ignore_case : bool, default True
+        Whether to lowercase the text.
+    remove_punct : bool, default True
+        Whether to remove punctuation characters.
+    normalize_uni : bool, default True
+        Whether to apply unicode NFKC normalization.
+    remove_stops : bool, default True
+        Whether to remove english stop words.
+    ignore_whitespace : bool, default False
+        Whether to remove all whitespace characters.
+    """
+
+    def __init__(
+        self,
+        *,
+        ignore_case: bool = True,
+        remove_punct: bool = True,
+        normalize_uni: bool = True,
+        remove_stops: bool = True,
+        ignore_whitespace: bool = False
+    ):
+        self.ignore_case = ignore_case
+        self.remove_punct = remove_punct
+        self.normalize_uni = normalize_uni
+        self.ignore_whitespace = ignore_whitespace
+        self.stop_words = None
+        self.tokenize = str.split
+        if remove_stops:
+            self.stop_words = _get_stop_words()
+            if self.stop_words is None:
+                warnings.warn('nltk stopwords not found, stopwords won\'t be ignored when considering text duplicates.'
+                              ' Please check your internet connection.')
+            elif download_nltk_resource('punkt'):
+                self.tokenize = word_tokenize
+
+    def __call__(self, text_sample: str) -> str:
+        """Normalize given text sample."""
+        if self.ignore_case:
+            text_sample = text_sample.lower()
+        if self.remove_punct:
+            text_sample = text_sample.translate(_PUNCTUATION_TABLE)
+        if self.normalize_uni:
+            text_sample = unicodedata.normalize('NFKC', text_sample)
+        if self.stop_words is not None:
+            text_sample = ' '.join([word for word in self.tokenize(text_sample)
+                                    if word.lower() not in self.stop_words])
+        if self.ignore_whitespace:
+            text_sample = ''.join(text_sample.split())
+        return text_sample
+
+    def normalize_samples(self, text_samples: t.Sequence[str]) -> t.List[str]:
+        """Normalize given sequence of text samples."""
+        return [self(it) for it in text_samples]
 
 
 def normalize_text(
@@ -99,17 +182,13 @@ def normalize_text(
     ignore_whitespace: bool = False
 ) -> str:
     """Normalize given text sample."""
-    if ignore_case:
-        text_sample = text_sample.lower()
-    if remove_punct:
-        text_sample = remove_punctuation(text_sample)
-    if normalize_uni:
-        text_sample = normalize_unicode(text_sample)
-    if remove_stops:
-        text_sample = remove_stopwords(text_sample)
-    if ignore_whitespace:
-        text_sample = ''.join(text_sample.split())
-    return text_sample
+    return TextNormalizer(
+        ignore_case=ignore_case,
+        remove_punct=remove_punct,
+        normalize_uni=normalize_uni,
+        remove_stops=remove_stops,
+        ignore_whitespace=ignore_whitespace
+    )(text_sample)
 
 
 def normalize_samples(
@@ -119,26 +198,39 @@ def normalize_samples(
     remove_punct: bool = True,
     normalize_uni: bool = True,
     remove_stops: bool = True,
-    ignore_whitespace: bool = False
+    ignore_whitespace: bool = False,
+    n_jobs: int = 1
 ) -> t.List[str]:
-    """Normalize given sequence of text samples."""
-    return [
-        normalize_text(
-            it,
-            ignore_case=ignore_case,
-            remove_punct=remove_punct,
-            normalize_uni=normalize_uni,
-            remove_stops=remove_stops,
-            ignore_whitespace=ignore_whitespace
-        )
-        for it in text_samples
-    ]
+    """Normalize given sequence of text samples.
+
+    The normalization resources are loaded once for all the samples. If n_jobs is not 1, chunks of the samples are
+    normalized by a pool of n_jobs processes (-1 uses all available CPUs).
+    """
+    normalizer = TextNormalizer(
+        ignore_case=ignore_case,
+        remove_punct=remove_punct,
+        normalize_uni=normalize_uni,
+        remove_stops=remove_stops,
+        ignore_whitespace=ignore_whitespace
+    )
+    text_samples = list(text_samples)
+    max_workers = effective_n_jobs(n_jobs)
+    if max_workers == 1 or len(text_samples) <= _NORMALIZATION_CHUNK_SIZE:
+        return normalizer.normalize_samples(text_samples)
+
+    chunks = [text_samples[i:i + _NORMALIZATION_CHUNK_SIZE]
+              for i in range(0, len(text_samples), _NORMALIZATION_CHUNK_SIZE)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [it for chunk in pool.map(normalizer.normalize_samples, chunks) for it in chunk]
 
 
 def hash_text(text: str) -> int:
-    """Hash a text sample."""
+    """Hash a text sample.
+
+    Unlike the builtin hash, the hash is stable between processes and python sessions.
+    """
     assert isinstance(text, str)
-    return hash(text)
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little', signed=True)
 
 
 def hash_samples(text: t.Sequence[str]) -> t.List[int]:
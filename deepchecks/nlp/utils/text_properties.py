@@ -9,23 +9,77 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the text properties for the NLP module."""
+import contextlib
+import contextvars
 import importlib
 import pathlib
 import string
+import threading
+import time
 import warnings
-from typing import Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import textblob
-from nltk import download as nltk_download
 
+from deepchecks.nlp.utils.properties_cache import PropertiesCache
+from deepchecks.nlp.utils.text import download_nltk_resource
 from deepchecks.utils.function import run_available_kwargs
+from deepchecks.utils.logger import get_logger
+from deepchecks.utils.parallel import effective_n_jobs
 
 __all__ = ['calculate_default_properties']
 
 
 ONNX_MODELS_STORAGE = pathlib.Path(__file__).absolute().parent / '.onnx-nlp-models'
+PROPERTIES_CHUNK_SIZE = 10_000
+MAX_RESIDENT_PIPELINES = 3
+# Version of the properties calculation, part of the keys of the properties cache. Should be increased when the
+# calculation of existing properties changes, so values cached by older versions are not used.
+PROPERTIES_VERSION = 1
+DEFAULT_BATCH_SIZE = 16
+
+# Parsed representations of texts (split words, TextBlob objects, ...) shared by all the properties calculated
+# together over a chunk of texts. None when the properties are calculated separately.
+_shared_parses: contextvars.ContextVar[Optional[Dict[Tuple[str, Any], Any]]] = \
+    contextvars.ContextVar('shared_parses', default=None)
+
+
+@contextlib.contextmanager
+def _shared_text_parsing():
+    """Share the parsed representation of each text between all the properties calculated inside the context."""
+    token = _shared_parses.set({})
+    try:
+        yield
+    finally:
+        _shared_parses.reset(token)
+
+
+def _get_parsed(kind: str, text: Any, parse: Callable[[Any], Any]):
+    """Return parse(text), calculated once per text while inside _shared_text_parsing."""
+    parses = _shared_parses.get()
+    if parses is None:
+        return parse(text)
+    key = (kind, text)
+    if key not in parses:
+        parses[key] = parse(text)
+    return parses[key]
+
+
+def _split_words(text: str) -> List[str]:
+    return _get_parsed('words', text, str.split)
+
+
+def _text_blob(text: str) -> textblob.TextBlob:
+    return _get_parsed('blob', text, textblob.TextBlob)
+
+
+def _text_blob_sentiment(text: str):
+    return _get_parsed('sentiment', text, lambda x: _text_blob(x).sentiment)
 
 
 def _import_optional_property_dependency(
@@ -118,12 +172,79 @@ def get_transformer_model(
     return onnx.ORTModelForSequenceClassification.from_pretrained(model_path)
 
 
+# Loaded transformers pipelines by (model name, device), kept resident in the process and evicted in least recently
+# used order when more than MAX_RESIDENT_PIPELINES are loaded
+_resident_pipelines: 'OrderedDict[Tuple[str, Optional[str]], Any]' = OrderedDict()
+_pipelines_throughput: Dict[str, Dict[str, float]] = {}
+_pipelines_lock = threading.Lock()
+
+
 def get_transformer_pipeline(property_name: str, model_name: str, device: Optional[str] = None):
-    """Return a transformers pipeline for the given model name."""
+    """Return a transformers pipeline for the given model name.
+
+    The pipeline is loaded once and kept resident in the process, up to MAX_RESIDENT_PIPELINES pipelines.
+    """
+    key = (model_name, device)
+    with _pipelines_lock:
+        if key in _resident_pipelines:
+            _resident_pipelines.move_to_end(key)
+            return _resident_pipelines[key]
+
     transformers = _import_optional_property_dependency('transformers', property_name=property_name)
     tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
     model = get_transformer_model(property_name, model_name, device)
-    return transformers.pipeline('text-classification', model=model, tokenizer=tokenizer, device=device)
+    classifier = transformers.pipeline('text-classification', model=model, tokenizer=tokenizer, device=device)
+
+    with _pipelines_lock:
+        _resident_pipelines[key] = classifier
+        while len(_resident_pipelines) > MAX_RESIDENT_PIPELINES:
+            _resident_pipelines.popitem(last=False)
+    return classifier
+
+
+def clear_transformer_pipelines():
+    """Release all the transformers pipelines kept resident by the text properties."""
+    with _pipelines_lock:
+        _resident_pipelines.clear()
+
+
+def get_transformer_pipelines_throughput() -> Dict[str, Dict[str, float]]:
+    """Return the number of texts, run time in seconds and texts per second of the inference per model name."""
+    with _pipelines_lock:
+        return {model_name: {**stats, 'texts_per_second': stats['texts'] / stats['seconds'] if stats['seconds'] else 0}
+                for model_name, stats in _pipelines_throughput.items()}
+
+
+def _run_transformer_pipeline(
+    property_name: str,
+    model_name: str,
+    raw_text: Sequence[str],
+    device: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[Dict[str, Any]]:
+    """Run a text classification pipeline on the texts and return its output per text, in the order of the texts.
+
+    Texts are sorted by length before being split into batches, so each batch holds texts of similar length and
+    little padding is needed.
+    """
+    classifier = get_transformer_pipeline(property_name, model_name, device=device)
+    start = time.time()
+    texts = list(raw_text)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]) if isinstance(texts[i], str) else 0)
+    results = [None] * len(texts)
+    for batch_start in range(0, len(order), batch_size):
+        batch_indexes = order[batch_start:batch_start + batch_size]
+        batch_output = classifier([texts[i] for i in batch_indexes], batch_size=batch_size)
+        for i, output in zip(batch_indexes, batch_output):
+            results[i] = output
+    run_time = time.time() - start
+
+    with _pipelines_lock:
+        stats = _pipelines_throughput.setdefault(model_name, {'texts': 0, 'seconds': 0})
+        stats['texts'] += len(texts)
+        stats['seconds'] += run_time
+    get_logger().debug('%s property calculated on %d texts in %.2f seconds', property_name, len(texts), run_time)
+    return results
 
 
 def text_length(raw_text: Sequence[str]) -> List[int]:
@@ -138,7 +259,7 @@ def word_length(raw_text: Sequence[str]) -> List[int]:  # Not yet used as return
 
 def average_word_length(raw_text: Sequence[str]) -> List[float]:
     """Return list of floats of average word length."""
-    return [np.mean([len(word) for word in text.split()]) for text in raw_text]
+    return [np.mean([len(word) for word in _split_words(text)]) for text in raw_text]
 
 
 def percentage_special_characters(raw_text: Sequence[str]) -> List[float]:
@@ -148,7 +269,7 @@ def percentage_special_characters(raw_text: Sequence[str]) -> List[float]:
 
 def max_word_length(raw_text: Sequence[str]) -> List[int]:
     """Return list of integers of max word length."""
-    return [max([len(word) for word in text.split()]) for text in raw_text]
+    return [max([len(word) for word in _split_words(text)]) for text in raw_text]
 
 
 def language(raw_text: Sequence[str]) -> List[str]:
@@ -167,33 +288,45 @@ def language(raw_text: Sequence[str]) -> List[str]:
 
 def sentiment(raw_text: Sequence[str]) -> List[str]:
     """Return list of floats of sentiment."""
-    return [textblob.TextBlob(text).sentiment.polarity for text in raw_text]
+    return [_text_blob_sentiment(text).polarity for text in raw_text]
 
 
 def subjectivity(raw_text: Sequence[str]) -> List[str]:
     """Return list of floats of subjectivity."""
-    return [textblob.TextBlob(text).sentiment.subjectivity for text in raw_text]
+    return [_text_blob_sentiment(text).subjectivity for text in raw_text]
 
 
-def toxicity(raw_text: Sequence[str], device: Optional[int] = None) -> List[float]:
+def toxicity(
+    raw_text: Sequence[str],
+    device: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[float]:
     """Return list of floats of toxicity."""
     model_name = 'unitary/toxic-bert'
-    classifier = get_transformer_pipeline('toxicity', model_name, device=device)
-    return [x['score'] for x in classifier(raw_text)]
+    predictions = _run_transformer_pipeline('toxicity', model_name, raw_text, device=device, batch_size=batch_size)
+    return [x['score'] for x in predictions]
 
 
-def fluency(raw_text: Sequence[str], device: Optional[int] = None) -> List[float]:
+def fluency(
+    raw_text: Sequence[str],
+    device: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[float]:
     """Return list of floats of fluency."""
     model_name = 'prithivida/parrot_fluency_model'
-    classifier = get_transformer_pipeline('fluency', model_name, device=device)
-    return [x['score'] if x['label'] == 'LABEL_1' else 1 - x['score'] for x in classifier(raw_text)]
+    predictions = _run_transformer_pipeline('fluency', model_name, raw_text, device=device, batch_size=batch_size)
+    return [x['score'] if x['label'] == 'LABEL_1' else 1 - x['score'] for x in predictions]
 
 
-def formality(raw_text: Sequence[str], device: Optional[int] = None) -> List[float]:
+def formality(
+    raw_text: Sequence[str],
+    device: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[float]:
     """Return list of floats of formality."""
     model_name = 's-nlp/roberta-base-formality-ranker'
-    classifier = get_transformer_pipeline('formality', model_name, device=device)
-    return [x['score'] if x['label'] == 'formal' else 1 - x['score'] for x in classifier(raw_text)]
+    predictions = _run_transformer_pipeline('formality', model_name, raw_text, device=device, batch_size=batch_size)
+    return [x['score'] if x['label'] == 'formal' else 1 - x['score'] for x in predictions]
 
 
 def lexical_density(raw_text: Sequence[str]) -> List[str]:
@@ -202,14 +335,14 @@ def lexical_density(raw_text: Sequence[str]) -> List[str]:
     Lexical density is the percentage of unique words in a given text. For more
     information: https://en.wikipedia.org/wiki/Lexical_density
     """
-    if not nltk_download('punkt', quiet=True):
+    if not download_nltk_resource('punkt'):
         warnings.warn('nltk punkt not found, lexical density cannot be calculated.'
                       ' Please check your internet connection.')
         return [np.nan] * len(raw_text)
     result = []
     for text in raw_text:
         if not pd.isna(text):
-            all_words = textblob.TextBlob(text).words
+            all_words = _text_blob(text).words
             total_words = len(all_words)
             total_unique_words = len(set(all_words))
             text_lexical_density = round(total_unique_words * 100 / total_words, 2)
@@ -221,14 +354,14 @@ def lexical_density(raw_text: Sequence[str]) -> List[str]:
 
 def unique_noun_count(raw_text: Sequence[str]) -> List[str]:
     """Return a list of integers of number of unique noun words in the text."""
-    if not nltk_download('averaged_perceptron_tagger', quiet=True):
+    if not download_nltk_resource('averaged_perceptron_tagger'):
         warnings.warn('nltk averaged_perceptron_tagger not found, unique noun count cannot be calculated.'
                       ' Please check your internet connection.')
         return [np.nan] * len(raw_text)
     result = []
     for text in raw_text:
         if not pd.isna(text):
-            unique_words_with_tags = set(textblob.TextBlob(text).tags)
+            unique_words_with_tags = set(_text_blob(text).tags)
             result.append(sum(1 for (_, tag) in unique_words_with_tags if tag.startswith('N')))
         else:
             result.append(np.nan)
@@ -251,6 +384,9 @@ DEFAULT_PROPERTIES = (
 )
 
 LONG_RUN_PROPERTIES = ['Toxicity', 'Fluency', 'Formality', 'Language', 'Unique Noun Count']
+MODEL_PROPERTIES = ['Toxicity', 'Fluency', 'Formality']
+# The nltk resource each property needs, without which the property returns only missing values
+NLTK_RESOURCE_PROPERTIES = {'Lexical Density': 'punkt', 'Unique Noun Count': 'averaged_perceptron_tagger'}
 ENGLISH_ONLY_PROPERTIES = ['Sentiment', 'Subjectivity', 'Toxicity', 'Fluency', 'Formality']
 LARGE_SAMPLE_SIZE = 10_000
 
@@ -277,12 +413,119 @@ def _get_default_properties(
     return properties
 
 
+def _calculate_properties_on_chunk(
+    raw_text: Sequence[str],
+    property_names: List[str],
+    device: Optional[str] = None
+) -> Tuple[Dict[str, list], Dict[str, str]]:
+    """Calculate the properties over a chunk of texts, parsing each text once for all the properties.
+
+    Returns the calculated properties, and the error message of each property that failed to import or to download
+    its nltk resource.
+    """
+    methods = {prop['name']: prop['method'] for prop in DEFAULT_PROPERTIES}
+    calculated_properties = {}
+    errors = {}
+    with _shared_text_parsing():
+        for name in property_names:
+            if name in NLTK_RESOURCE_PROPERTIES and not download_nltk_resource(NLTK_RESOURCE_PROPERTIES[name]):
+                errors[name] = (f'nltk {NLTK_RESOURCE_PROPERTIES[name]} not found. '
+                                'Please check your internet connection.')
+                continue
+            try:
+                calculated_properties[name] = run_available_kwargs(methods[name], raw_text=raw_text, device=device)
+            except ImportError as e:
+                errors[name] = str(e)
+    return calculated_properties, errors
+
+
+def _calculate_properties(
+    texts: List[str],
+    default_text_properties: Sequence[Dict[str, Any]],
+    device: Optional[str] = None,
+    n_jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Tuple[Dict[str, list], Dict[str, str]]:
+    """Calculate the properties of the texts.
+
+    Returns the calculated properties, and the import error message of each property that failed.
+    """
+    # The properties that use a model are calculated over all the texts at once, so the model is loaded once. The
+    # other properties are calculated together over chunks of texts, parsing each text once for all of them.
+    chunked_properties = [prop['name'] for prop in default_text_properties if prop['name'] not in MODEL_PROPERTIES]
+    results = {}
+    errors = {}
+    if chunked_properties:
+        chunks = [texts[i:i + PROPERTIES_CHUNK_SIZE] for i in range(0, len(texts), PROPERTIES_CHUNK_SIZE)] or [texts]
+        max_workers = effective_n_jobs(n_jobs)
+        if max_workers == 1 or len(chunks) == 1:
+            chunks_results = [_calculate_properties_on_chunk(chunk, chunked_properties, device) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                chunks_results = list(pool.map(_calculate_properties_on_chunk, chunks,
+                                               repeat(chunked_properties), repeat(device)))
+        for name in chunked_properties:
+            property_errors = [chunk_errors[name] for _, chunk_errors in chunks_results if name in chunk_errors]
+            if property_errors:
+                errors[name] = property_errors[0]
+            else:
+                results[name] = [value for chunk_result, _ in chunks_results for value in chunk_result[name]]
+
+    for prop in default_text_properties:
+        if prop['name'] in MODEL_PROPERTIES:
+            try:
+                results[prop['name']] = run_available_kwargs(prop['method'], raw_text=texts, device=device,
+                                                             batch_size=batch_size)
+            except ImportError as e:
+                errors[prop['name']] = str(e)
+    return results, errors
+
+
+def _calculate_properties_with_cache(
+    texts: List[str],
+    default_text_properties: Sequence[Dict[str, Any]],
+    cache: Union[str, pathlib.Path, PropertiesCache],
+    **calculation_kwargs
+) -> Tuple[Dict[str, list], Dict[str, str]]:
+    """Calculate the properties only for the texts missing from the cache, and store them in it."""
+    if not isinstance(cache, PropertiesCache):
+        cache = PropertiesCache(cache)
+    keys = {prop['name']: f'{prop["name"]}:v{PROPERTIES_VERSION}' for prop in default_text_properties}
+    text_hashes = [cache.hash_text(text) for text in texts]
+    cached_values = cache.get(text_hashes, list(keys.values()))
+
+    # Each distinct text missing any of the properties is calculated once
+    missing_texts = {}
+    for text_hash, text in zip(text_hashes, texts):
+        if text_hash not in missing_texts and any(text_hash not in cached_values[key] for key in keys.values()):
+            missing_texts[text_hash] = text
+
+    errors = {}
+    if missing_texts:
+        new_results, errors = _calculate_properties(list(missing_texts.values()), default_text_properties,
+                                                    **calculation_kwargs)
+        new_values = {keys[name]: dict(zip(missing_texts, values))
+                      for name, values in new_results.items() if name not in errors}
+        # Properties which failed (e.g. when an nltk resource failed to download) are in errors and aren't cached,
+        # so they are calculated again on the following calls
+        cache.set(new_values)
+        for key, values in new_values.items():
+            cached_values[key].update(values)
+
+    results = {name: [cached_values[key][text_hash] for text_hash in text_hashes]
+               for name, key in keys.items() if name not in errors}
+    return results, errors
+
+
 def calculate_default_properties(
     raw_text: Sequence[str],
     include_properties: Optional[List[str]] = None,
     ignore_properties: Optional[List[str]] = None,
     include_long_calculation_properties: Optional[bool] = False,
-    device: Optional[str] = None
+    device: Optional[str] = None,
+    n_jobs: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache: Optional[Union[str, pathlib.Path, PropertiesCache]] = None
 ) -> Tuple[Dict[str, List[float]], Dict[str, str]]:
     """Calculate properties on provided text samples.
 
@@ -306,6 +549,17 @@ def calculate_default_properties(
         ignored, even if they are in the include_properties parameter.
     device : int, default None
         The device to use for the calculation. If None, the default device will be used.
+    n_jobs : int, default 1
+        Number of processes used to calculate the properties that don't use a model, over chunks of texts.
+        -1 uses all available CPUs. The properties that use a model (Toxicity, Fluency and Formality) are calculated
+        in the calling process.
+    batch_size : int, default 16
+        Number of texts in each inference batch of the properties that use a model. Texts of similar length are
+        batched together. The loaded models are kept in memory, so following calls don't load them again.
+    cache : Union[str, pathlib.Path, PropertiesCache], default None
+        A PropertiesCache, or a path of its database file, storing the calculated properties values by the hash of
+        each text. Properties are calculated only for texts whose values are not in the cache yet, and then stored
+        in it. If None, all the properties are calculated.
 
     Returns
     -------
@@ -330,13 +584,20 @@ def calculate_default_properties(
 
             warnings.warn(warning_message, UserWarning)
 
+    texts = list(raw_text)
+    calculation_kwargs = dict(device=device, n_jobs=n_jobs, batch_size=batch_size)
+    if cache is None:
+        results, errors = _calculate_properties(texts, default_text_properties, **calculation_kwargs)
+    else:
+        results, errors = _calculate_properties_with_cache(texts, default_text_properties, cache,
+                                                           **calculation_kwargs)
+
     calculated_properties = {}
     for prop in default_text_properties:
-        try:
-            res = run_available_kwargs(prop['method'], raw_text=raw_text, device=device)
-            calculated_properties[prop['name']] = res
-        except ImportError as e:
-            warnings.warn(f'Failed to calculate property {prop["name"]}.\nError: {e}')
+        if prop['name'] in errors:
+            warnings.warn(f'Failed to calculate property {prop["name"]}.\nError: {errors[prop["name"]]}')
+        else:
+            calculated_properties[prop['name']] = results[prop['name']]
     if not calculated_properties:
         raise RuntimeError('Failed to calculate any of the properties.')
 
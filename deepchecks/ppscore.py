@@ -31,6 +31,7 @@
 
 # pylint: skip-file
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 warnings.filterwarnings('ignore', message='The least populated class in y has only')
 
@@ -42,6 +43,7 @@ from sklearn import preprocessing, tree
 from sklearn.metrics import f1_score, mean_absolute_error
 from sklearn.model_selection import cross_val_score
 
+from deepchecks.utils.parallel import effective_n_jobs
 from deepchecks.utils.typing import Hashable
 
 NOT_SUPPORTED_ANYMORE = "NOT_SUPPORTED_ANYMORE"
@@ -534,7 +536,33 @@ def _format_list_of_dicts(scores, output, sorted):
     return scores
 
 
-def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
+# The dataframe scored by a worker process, set once per worker by _init_worker so it isn't pickled for each task
+_worker_df = None
+
+
+def _init_worker(df):
+    global _worker_df
+    _worker_df = df
+
+
+def _score_in_worker(x, y, kwargs):
+    return score(_worker_df, x, y, **kwargs)
+
+
+def _score_pairs(df, pairs, n_jobs=1, **kwargs):
+    """Calculate the PPS of each (x, y) pair of columns, in a pool of n_jobs processes if n_jobs is not 1."""
+    max_workers = effective_n_jobs(n_jobs)
+    if max_workers == 1 or len(pairs) <= 1:
+        return [score(df, x, y, **kwargs) for x, y in pairs]
+
+    max_workers = min(max_workers, len(pairs))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(df,)) as executor:
+        # map keeps the order of the pairs, so the result is the same as in the sequential calculation
+        return list(executor.map(_score_in_worker, [x for x, _ in pairs], [y for _, y in pairs],
+                                 [kwargs] * len(pairs), chunksize=max(len(pairs) // (max_workers * 4), 1)))
+
+
+def predictors(df, y: Hashable, output="df", sorted=True, n_jobs=1, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) of all the features in the dataframe.
 
@@ -550,6 +578,9 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
         Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
     sorted: bool
         Whether or not to sort the output dataframe/list by the ppscore
+    n_jobs: int, default: 1
+        Number of processes used to calculate the scores of the columns. -1 means using all the CPUs. The
+        dataframe is sent once to each process.
     kwargs:
         Other key-word arguments that shall be forwarded to the pps.score method,
         e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
@@ -581,12 +612,12 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
             f"""The 'sorted' argument should be one of [True, False] but you passed: {sorted}\nPlease adjust your input to one of the valid values"""
         )
 
-    scores = [score(df, column, y, **kwargs) for column in df if column != y]
+    scores = _score_pairs(df, [(column, y) for column in df if column != y], n_jobs=n_jobs, **kwargs)
 
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
 
 
-def matrix(df, output="df", sorted=False, **kwargs):
+def matrix(df, output="df", sorted=False, n_jobs=1, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) matrix for all columns in the dataframe.
 
@@ -597,6 +628,9 @@ def matrix(df, output="df", sorted=False, **kwargs):
             Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
         sorted: bool
             Whether or not to sort the output dataframe/list by the ppscore
+        n_jobs: int, default: 1
+            Number of processes used to calculate the scores of the pairs of columns. -1 means using all the
+            CPUs. The dataframe is sent once to each process.
         kwargs:
             Other key-word arguments that shall be forwarded to the pps.score method,
             e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
@@ -619,6 +653,6 @@ def matrix(df, output="df", sorted=False, **kwargs):
             f"""The 'sorted' argument should be one of [True, False] but you passed: {sorted}\nPlease adjust your input to one of the valid values"""
         )
 
-    scores = [score(df, x, y, **kwargs) for x in df for y in df]
+    scores = _score_pairs(df, [(x, y) for x in df for y in df], n_jobs=n_jobs, **kwargs)
 
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
@@ -13,10 +13,14 @@ from .base_checks import ModelComparisonCheck, ModelOnlyCheck, SingleDatasetChec
 from .context import Context
 from .dataset import Dataset
 from .model_base import ModelComparisonContext, ModelComparisonSuite
+from .reference_profile import ReferenceProfile
+from .streaming_dataset import StreamingDataset
 from .suite import Suite
 
 __all__ = [
     "Dataset",
+    "StreamingDataset",
+    "ReferenceProfile",
     "Context",
     "SingleDatasetCheck",
     "TrainTestCheck",
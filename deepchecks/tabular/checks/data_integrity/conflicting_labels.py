@@ -11,13 +11,14 @@
 """module contains Data Duplicates check."""
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 from typing_extensions import TypedDict
 
 from deepchecks.core import CheckResult
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.abstracts.conflicting_labels import ConflictingLabelsAbstract
-from deepchecks.utils.dataframes import cast_categorical_to_object_dtype
+from deepchecks.utils.dataframes import get_group_positions, group_identical_rows
 from deepchecks.utils.strings import format_list
 from deepchecks.utils.typing import Hashable
 
@@ -82,53 +83,37 @@ class ConflictingLabels(SingleDatasetCheck, ConflictingLabelsAbstract):
         features = dataset.features
         label_name = dataset.label_name
 
-        # HACK:
-        # pandas have bug with groupby on category dtypes,
-        # so until it fixed, change dtypes manually
-        df = cast_categorical_to_object_dtype(dataset.data.copy())
-
-        # Get index in order to use in the display
-        index_col_name = '_dc_index'
-        df[index_col_name] = df.index
-        # Group by features
-        group_unique_data = df.groupby(features, dropna=False).agg(list)
-        # Calculate count per feature-group
-        group_unique_data['count'] = group_unique_data[index_col_name].apply(len)
-        # Sort by count
-        group_unique_data = group_unique_data.sort_values(by='count', ascending=False)
-
-        num_ambiguous = 0
+        df = dataset.data
+        row_groups = group_identical_rows(df[features])[0]
+        group_counts = np.bincount(row_groups)
+
+        # Only groups of more than one sample may have conflicting labels
+        duplicated = group_counts[row_groups] > 1
+        n_labels_per_group = pd.Series(df[label_name].to_numpy()[duplicated]) \
+            .groupby(row_groups[duplicated]).nunique(dropna=False)
+        ambiguous_groups = n_labels_per_group.index[n_labels_per_group > 1].to_numpy()
+        ambiguous_groups = ambiguous_groups[np.argsort(-group_counts[ambiguous_groups], kind='stable')]
+        groups_positions = get_group_positions(row_groups, ambiguous_groups)
+
+        num_ambiguous = int(group_counts[ambiguous_groups].sum())
+        samples = [df.index[positions].to_list() for positions in groups_positions]
+
         ambiguous_label_name = 'Observed Labels'
         indices_name = 'Instances'
-        samples = []
-        display_samples = []
-
-        for group_index, group_data in group_unique_data.iterrows():
-            ambiguous_labels = set(group_data[label_name])
-            if len(ambiguous_labels) == 1:
-                continue
-            num_ambiguous += group_data['count']
-            samples.append(group_data[index_col_name])
-
-            if context.with_display is True:
-                index_names = group_unique_data.index.names
-                # In case of single feature the group_index is not a list so convert it
-                group_index = group_index if isinstance(group_index, list) else [group_index]
-                display_sample = dict(zip(index_names, group_index))
-                # Using tuple since it's hashable
-                display_sample[ambiguous_label_name] = tuple(ambiguous_labels)
-                display_sample[indices_name] = format_list(group_data[index_col_name])
-                display_samples.append(display_sample)
-
-        if len(display_samples) == 0:
+        if not context.with_display or len(samples) == 0:
             display = None
         else:
-            display = pd.DataFrame.from_records(display_samples[:self.n_to_show])
+            shown_positions = groups_positions[:self.n_to_show]
+            display = df[features].iloc[[positions[0] for positions in shown_positions]].reset_index(drop=True)
+            # Using tuple since it's hashable
+            display[ambiguous_label_name] = [tuple(dict.fromkeys(df[label_name].iloc[positions]))
+                                             for positions in shown_positions]
+            display[indices_name] = [format_list(group_samples) for group_samples in samples[:self.n_to_show]]
             display.set_index([ambiguous_label_name, indices_name], inplace=True)
             display = [
                 'Each row in the table shows an example of a data sample '
                 'and the its observed labels as found in the dataset. '
-                f'Showing top {display.shape[0]} of {len(display_samples)}',
+                f'Showing top {display.shape[0]} of {len(samples)}',
                 display
             ]
 
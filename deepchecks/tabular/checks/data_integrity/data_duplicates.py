@@ -9,20 +9,29 @@
 # ----------------------------------------------------------------------------
 #
 """module contains Data Duplicates check."""
+import warnings
 from typing import List, Union
 
 import numpy as np
+import pandas as pd
 
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DatasetValidationError
-from deepchecks.tabular import Context, SingleDatasetCheck
+from deepchecks.tabular import Context, Dataset, SingleDatasetCheck
 from deepchecks.utils.abstracts.data_duplicates import DataDuplicatesAbstract
-from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.utils.dataframes import (get_group_positions, group_identical_rows, hash_rows_128,
+                                         select_from_dataframe)
 from deepchecks.utils.strings import format_list, format_percent
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['DataDuplicates']
 
+_MAX_INSTANCES_TO_SHOW = 10
+# Maximal number of row hashes counted at once over a streaming dataset (16 bytes each), larger datasets are counted
+# in several passes, each over the hashes of a separate partition of the rows
+_MAX_HASHES_IN_MEMORY = 2 ** 24
+_HASH_DTYPE = np.dtype([('first', np.uint64), ('second', np.uint64)])
+
 
 class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
     """Checks for duplicate samples in the dataset.
@@ -38,7 +47,7 @@ class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
     n_to_show : int , default: 5
         number of most common duplicated samples to show.
     n_samples : int , default: 10_000_000
-        number of samples to use for this check.
+        number of samples to use for this check. StreamingDataset objects are checked over all of their data.
     random_state : int, default: 42
         random seed for all check internals.
     """
@@ -67,47 +76,37 @@ class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
         CheckResult
             percentage of duplicates and display of the top n_to_show most duplicated.
         """
-        df = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state).data
+        dataset = context.get_data_by_kind(dataset_kind)
+        # Streaming datasets are aggregated chunk by chunk over all of their data, instead of over a sample
+        if dataset.is_streaming:
+            return self._run_on_chunks(context, dataset.select(self.columns, self.ignore_columns))
+
+        df = dataset.sample(self.n_samples, random_state=self.random_state).data
         df = select_from_dataframe(df, self.columns, self.ignore_columns)
 
-        data_columns = list(df.columns)
         n_samples = df.shape[0]
 
         if n_samples == 0:
             raise DatasetValidationError('Dataset does not contain any data')
 
-        # HACK: pandas have bug with groupby on category dtypes, so until it fixed, change dtypes manually
-        category_columns = df.dtypes[df.dtypes == 'category'].index.tolist()
-        if category_columns:
-            df = df.astype({c: 'object' for c in category_columns})
-
-        group_unique_data = df[data_columns].groupby(data_columns, dropna=False).size()
-        n_unique = len(group_unique_data)
+        # Rows are grouped by their hashes instead of by groupby over all the columns, which is much slower and
+        # memory consuming for wide dataframes
+        row_groups = group_identical_rows(df)[0]
+        group_counts = np.bincount(row_groups)
+        n_unique = len(group_counts)
 
         percent_duplicate = 1 - (1.0 * int(n_unique)) / (1.0 * int(n_samples))
 
         if context.with_display and percent_duplicate > 0:
-            # patched for anonymous_series
-            # TODO: reset_index(name=...) can be used instead of this confusing hack
-            is_anonymous_series = 0 in group_unique_data.keys().names
-            if is_anonymous_series:
-                new_name = str(group_unique_data.keys().names)
-                new_index = group_unique_data.keys()
-                new_index.names = [new_name if name == 0 else name for name in new_index.names]
-                group_unique_data = group_unique_data.reindex(new_index)
-            duplicates_counted = group_unique_data.reset_index().rename(columns={0: 'Number of Duplicates'})
-            if is_anonymous_series:
-                duplicates_counted.rename(columns={new_name: 0}, inplace=True)
-
-            most_duplicates = duplicates_counted[duplicates_counted['Number of Duplicates'] > 1]. \
-                nlargest(self.n_to_show, ['Number of Duplicates'])
-
-            indexes = []
-            for row in most_duplicates.iloc():
-                indexes.append(format_list(df.index[np.all(df == row[data_columns], axis=1)].to_list()))
-
-            most_duplicates['Instances'] = indexes
-
+            duplicated_groups = np.flatnonzero(group_counts > 1)
+            most_duplicated_groups = duplicated_groups[
+                np.argsort(-group_counts[duplicated_groups], kind='stable')][:self.n_to_show]
+            groups_positions = get_group_positions(row_groups, most_duplicated_groups)
+
+            most_duplicates = df.iloc[[positions[0] for positions in groups_positions]].reset_index(drop=True)
+            most_duplicates['Number of Duplicates'] = group_counts[most_duplicated_groups]
+            most_duplicates['Instances'] = [format_list(df.index[positions].to_list())
+                                            for positions in groups_positions]
             most_duplicates = most_duplicates.set_index(['Instances', 'Number of Duplicates'])
 
             text = f'{format_percent(percent_duplicate)} of data samples are duplicates. '
@@ -118,3 +117,81 @@ class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
             display = None
 
         return CheckResult(value=percent_duplicate, display=display)
+
+    def _run_on_chunks(self, context: Context, dataset: Dataset) -> CheckResult:
+        """Run check on a streaming dataset, by counting the hashes of the rows of the chunks.
+
+        Rows are counted by their 128-bit hashes, for which a collision between different rows is negligible. At
+        most _MAX_HASHES_IN_MEMORY hashes are held in memory, so larger datasets are read once for each partition
+        of the hashes. The rows of the displayed duplicates are also compared to each other when they are
+        collected, and rows which share a hash with different values are reported in a warning.
+        """
+        n_samples = dataset.n_samples
+        n_partitions = max(1, -(-n_samples // _MAX_HASHES_IN_MEMORY))
+        n_unique = 0
+        most_duplicates_hashes = np.empty(0, dtype=_HASH_DTYPE)
+        most_duplicates_counts = np.empty(0, dtype=np.int64)
+        for partition in range(n_partitions):
+            partition_hashes = []
+            for chunk in dataset.iter_chunks():
+                chunk_hashes = _to_hash_array(hash_rows_128(chunk.data))
+                if n_partitions > 1:
+                    chunk_hashes = chunk_hashes[chunk_hashes['first'] % np.uint64(n_partitions) == partition]
+                partition_hashes.append(chunk_hashes)
+            unique_hashes, counts = np.unique(np.concatenate(partition_hashes), return_counts=True)
+            n_unique += len(unique_hashes)
+            # Keeping only the most duplicated rows of the partitions read so far
+            most_duplicates_hashes = np.concatenate([most_duplicates_hashes, unique_hashes[counts > 1]])
+            most_duplicates_counts = np.concatenate([most_duplicates_counts, counts[counts > 1]])
+            order = np.argsort(-most_duplicates_counts, kind='stable')[:self.n_to_show]
+            most_duplicates_hashes = most_duplicates_hashes[order]
+            most_duplicates_counts = most_duplicates_counts[order]
+
+        percent_duplicate = 1 - (1.0 * n_unique) / (1.0 * n_samples)
+
+        if context.with_display and percent_duplicate > 0:
+            most_duplicates_index = pd.MultiIndex.from_arrays([most_duplicates_hashes['first'],
+                                                               most_duplicates_hashes['second']])
+            # Reading the data again in order to collect the duplicated rows and their instances
+            rows, instances = {}, {row_hash: [] for row_hash in most_duplicates_index}
+            n_colliding_rows = 0
+            for chunk in dataset.iter_chunks():
+                chunk_groups = most_duplicates_index.get_indexer(hash_rows_128(chunk.data))
+                for group, (row_hash, row_instances) in enumerate(instances.items()):
+                    positions = np.flatnonzero(chunk_groups == group)
+                    if len(positions) == 0:
+                        continue
+                    row = rows.setdefault(row_hash, chunk.data.iloc[positions[:1]])
+                    # Validate the rows are identical to the first row of their hash
+                    row_groups, chunk_groups_of_rows = group_identical_rows(row, chunk.data.iloc[positions])
+                    is_identical = chunk_groups_of_rows == row_groups[0]
+                    n_colliding_rows += int(np.count_nonzero(~is_identical))
+                    positions = positions[is_identical]
+                    # Keeping only the instances which are displayed (and one more, to mark the list is truncated)
+                    n_missing_instances = max(_MAX_INSTANCES_TO_SHOW + 1 - len(row_instances), 0)
+                    row_instances.extend(chunk.data.index[positions[:n_missing_instances]])
+            if n_colliding_rows > 0:
+                warnings.warn(f'Found {n_colliding_rows} rows which share a hash with a different duplicated row, '
+                              'the percent of duplicates may be overestimated.')
+
+            most_duplicates = pd.concat([rows[row_hash] for row_hash in most_duplicates_index])
+            most_duplicates['Number of Duplicates'] = most_duplicates_counts
+            most_duplicates['Instances'] = [format_list(instances[row_hash], _MAX_INSTANCES_TO_SHOW)
+                                            for row_hash in most_duplicates_index]
+            most_duplicates = most_duplicates.set_index(['Instances', 'Number of Duplicates'])
+
+            text = f'{format_percent(percent_duplicate)} of data samples are duplicates. '
+            explanation = 'Each row in the table shows an example of duplicate data and the number of times it appears.'
+            display = [text, explanation, most_duplicates]
+        else:
+            display = None
+
+        return CheckResult(value=percent_duplicate, display=display)
+
+
+def _to_hash_array(hashes: pd.MultiIndex) -> np.ndarray:
+    """Return the 128-bit row hashes as a structured array, which numpy sorts and counts without python objects."""
+    hash_array = np.empty(len(hashes), dtype=_HASH_DTYPE)
+    hash_array['first'] = hashes.get_level_values(0).to_numpy(dtype=np.uint64)
+    hash_array['second'] = hashes.get_level_values(1).to_numpy(dtype=np.uint64)
+    return hash_array
@@ -50,6 +50,8 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         number of samples to use for this check.
     random_state : int , default: None
         Random state for the ppscore.predictors function
+    n_jobs : int , default: 1
+        Number of processes used to calculate the PPS of the features. -1 uses all available CPUs.
     """
 
     def __init__(
@@ -58,6 +60,7 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         n_top_features: int = 5,
         n_samples: int = 100_000,
         random_state: t.Optional[int] = None,
+        n_jobs: int = 1,
         **kwargs
     ):
         super().__init__(**kwargs)
@@ -65,6 +68,7 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         self.n_top_features = n_top_features
         self.n_samples = n_samples
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check.
@@ -90,7 +94,7 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
             data_df[dataset.label_name] = data_df[dataset.label_name].astype(object)
 
         df_pps = pps.predictors(df=data_df, y=dataset.label_name, random_seed=self.random_state,
-                                **self.ppscore_params)
+                                n_jobs=self.n_jobs, **self.ppscore_params)
         s_ppscore = df_pps.set_index('x', drop=True)['ppscore']
 
         if context.with_display:
@@ -37,17 +37,21 @@ class IdentifierLabelCorrelation(SingleDatasetCheck):
         number of samples to use for this check.
     random_state : int, default: 42
         random seed for all check internals.
+    n_jobs : int, default: 1
+        Number of processes used to calculate the PPS of the identifiers. -1 uses all available CPUs.
     """
 
     def __init__(self,
                  ppscore_params=None,
                  n_samples: int = 1_000_000,
                  random_state: int = 42,
+                 n_jobs: int = 1,
                  **kwargs):
         super().__init__(**kwargs)
         self.ppscore_params = ppscore_params or {}
         self.n_samples = n_samples
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check.
@@ -86,6 +90,7 @@ class IdentifierLabelCorrelation(SingleDatasetCheck):
             df=relevant_data,
             y=label_name,
             random_seed=42,
+            n_jobs=self.n_jobs,
             **self.ppscore_params
         )
 
@@ -9,14 +9,14 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains is_single_value check."""
-from typing import List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
-from deepchecks.tabular import Context, SingleDatasetCheck
+from deepchecks.tabular import Context, Dataset, SingleDatasetCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.utils.dataframes import hash_rows_128, select_from_dataframe
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['IsSingleValue']
@@ -36,7 +36,7 @@ class IsSingleValue(SingleDatasetCheck):
     ignore_nan : bool, default True
         Whether to ignore NaN values in a column when counting the number of unique values.
     n_samples : int , default: 10_000_000
-        number of samples to use for this check.
+        number of samples to use for this check. StreamingDataset objects are checked over all of their data.
     random_state : int, default: 42
         random seed for all check internals.
     """
@@ -66,21 +66,29 @@ class IsSingleValue(SingleDatasetCheck):
             value of result is a dict of all columns with number of unique values in format {column: number_of_uniques}
             display is a series with columns that have only one unique
         """
-        # Validate parameters
-        df = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state).data
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
-
-        num_unique_per_col = df.nunique(dropna=self.ignore_nan)
+        dataset = context.get_data_by_kind(dataset_kind)
+        # Streaming datasets are aggregated chunk by chunk over all of their data, instead of over a sample
+        if dataset.is_streaming:
+            num_unique_per_col, first_values = _count_unique_values_in_chunks(
+                dataset.select(self.columns, self.ignore_columns), self.ignore_nan
+            )
+        else:
+            df = dataset.sample(self.n_samples, random_state=self.random_state).data
+            df = select_from_dataframe(df, self.columns, self.ignore_columns)
+            num_unique_per_col = df.nunique(dropna=self.ignore_nan)
         is_single_unique_value = (num_unique_per_col == 1)
 
         if context.with_display and is_single_unique_value.any():
             # get names of columns with one unique value
             # pylint: disable=unsubscriptable-object
             cols_with_single = is_single_unique_value[is_single_unique_value].index.to_list()
-            uniques = pd.DataFrame({
-                column_name: [column.sort_values(kind='mergesort').values[0]]
-                for column_name, column in df.loc[:, cols_with_single].items()
-            })
+            if dataset.is_streaming:
+                uniques = pd.DataFrame({column_name: [first_values[column_name]] for column_name in cols_with_single})
+            else:
+                uniques = pd.DataFrame({
+                    column_name: [column.sort_values(kind='mergesort').values[0]]
+                    for column_name, column in df.loc[:, cols_with_single].items()
+                })
             uniques.index = ['Single unique value']
             display = ['The following columns have only one unique value', uniques]
         else:
@@ -102,3 +110,34 @@ class IsSingleValue(SingleDatasetCheck):
                 return ConditionResult(ConditionCategory.PASS, get_condition_passed_message(result))
 
         return self.add_condition(name, condition)
+
+
+def _count_unique_values_in_chunks(dataset: Dataset, dropna: bool) -> Tuple[pd.Series, Dict[Hashable, Any]]:
+    """Count the unique values of each column by merging the hashes of the unique values of each chunk.
+
+    Returns the number of unique values per column, and the first value (preferring non-null values) per column.
+    """
+    unique_hashes = {}
+    first_values = {}
+    columns_with_non_null_value = set()
+    for chunk in dataset.iter_chunks():
+        for column_name, column in chunk.data.items():
+            chunk_uniques = column.drop_duplicates()
+            if dropna:
+                chunk_uniques = chunk_uniques.dropna()
+            # Integers and integral floats are hashed the same, as integer columns become floats in chunks which
+            # contain nulls
+            chunk_hashes = hash_rows_128(chunk_uniques.to_frame())
+            unique_hashes[column_name] = chunk_hashes.unique() if column_name not in unique_hashes else \
+                unique_hashes[column_name].append(chunk_hashes).unique()
+            if column_name not in columns_with_non_null_value:
+                non_null_values = column.dropna()
+                if len(non_null_values) > 0:
+                    first_values[column_name] = non_null_values.iloc[0]
+                    columns_with_non_null_value.add(column_name)
+                else:
+                    first_values.setdefault(column_name, column.iloc[0])
+
+    num_unique_per_col = pd.Series({column_name: len(hashes) for column_name, hashes in unique_hashes.items()},
+                                   dtype='int64')
+    return num_unique_per_col, first_values
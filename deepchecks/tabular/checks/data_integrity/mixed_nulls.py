@@ -52,7 +52,7 @@ class MixedNulls(SingleDatasetCheck, ReduceFeatureMixin):
     aggregation_method: t.Optional[str], default: 'max'
         {feature_aggregation_method_argument:2*indent}
     n_samples : int , default: 10_000_000
-        number of samples to use for this check.
+        number of samples to use for this check. StreamingDataset objects are checked over all of their data.
     random_state : int, default: 42
         random seed for all check internals.
     """
@@ -90,52 +90,36 @@ class MixedNulls(SingleDatasetCheck, ReduceFeatureMixin):
             display is DataFrame with columns ('Column Name', 'Value', 'Count', 'Percentage') for any column that
             has more than 1 null values.
         """
-        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
-        df = dataset.data
-
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
+        dataset = context.get_data_by_kind(dataset_kind)
+        # Streaming datasets are aggregated chunk by chunk over all of their data, instead of over a sample
+        if dataset.is_streaming:
+            frames = (chunk.data for chunk in dataset.select(self.columns, self.ignore_columns).iter_chunks())
+        else:
+            df = dataset.sample(self.n_samples, random_state=self.random_state).data
+            frames = [select_from_dataframe(df, self.columns, self.ignore_columns)]
         null_string_list = self._validate_null_string_list(self.null_string_list)
 
+        n_samples = 0
+        null_counts_per_column = {}
+        for df in frames:
+            n_samples += len(df)
+            for column_name in list(df.columns):
+                column_null_counts = null_counts_per_column.setdefault(column_name, {})
+                for null_value, count in _count_nulls(df[column_name], null_string_list).items():
+                    column_null_counts[null_value] = column_null_counts.get(null_value, 0) + count
+
         feature_importance = context.feature_importance if context.feature_importance is not None \
-            else pd.Series(index=list(df.columns), dtype=object)
+            else pd.Series(index=list(null_counts_per_column), dtype=object)
 
         # Result value
         display_array = []
-        result_dict = {'n_samples': len(df), 'columns': {}, 'feature_importance': feature_importance}
-
-        for column_name in list(df.columns):
-            column_data = df[column_name]
-            if is_categorical_dtype(column_data) is True:
-                # NOTE:
-                # 'pandas.Series.value_counts' and 'pandas.Series.apply'
-                # work in an unusual way with categorical data types
-                # - 'value_counts' returns all categorical values even if they are not in series
-                # - 'apply' applies function to each category, not to values
-                # therefore we processing categorical dtypes differently
-                # NOTE:
-                # 'Series.value_counts' method transforms null values like 'None', 'pd.Na', 'pd.NaT'
-                # into 'np.nan' therefore it cannot be used for usual dtypes, because we will lose info
-                # about all different null types in the column
-                null_counts = {}
-                for value, count in column_data.value_counts(dropna=False).to_dict().items():
-                    if count > 0:
-                        if pd.isna(value):
-                            null_counts[nan_type(value)] = count
-                        elif string_baseform(value) in null_string_list:
-                            null_counts[repr(value).replace('\'', '"')] = count
-            else:
-                string_null_counts = {
-                    repr(value).replace('\'', '"'): count
-                    for value, count in column_data.value_counts(dropna=True).items()
-                    if string_baseform(value) in null_string_list
-                }
-                nan_data_counts = column_data[column_data.isna()].apply(nan_type).value_counts().to_dict()
-                null_counts = {**string_null_counts, **nan_data_counts}
+        result_dict = {'n_samples': n_samples, 'columns': {}, 'feature_importance': feature_importance}
 
+        for column_name, null_counts in null_counts_per_column.items():
             result_dict['columns'][column_name] = {}
             # Save the column nulls info
             for null_value, count in null_counts.items():
-                percent = count / len(column_data)
+                percent = count / n_samples
                 display_array.append([column_name, null_value, count, format_percent(percent)])
                 result_dict['columns'][column_name][null_value] = {'count': count, 'percent': percent}
 
@@ -220,6 +204,37 @@ class MixedNulls(SingleDatasetCheck, ReduceFeatureMixin):
                                   condition)
 
 
+def _count_nulls(column_data: pd.Series, null_string_list: set) -> Dict[str, int]:
+    """Count the different null values in the column, including string representations of null."""
+    if is_categorical_dtype(column_data) is True:
+        # NOTE:
+        # 'pandas.Series.value_counts' and 'pandas.Series.apply'
+        # work in an unusual way with categorical data types
+        # - 'value_counts' returns all categorical values even if they are not in series
+        # - 'apply' applies function to each category, not to values
+        # therefore we processing categorical dtypes differently
+        # NOTE:
+        # 'Series.value_counts' method transforms null values like 'None', 'pd.Na', 'pd.NaT'
+        # into 'np.nan' therefore it cannot be used for usual dtypes, because we will lose info
+        # about all different null types in the column
+        null_counts = {}
+        for value, count in column_data.value_counts(dropna=False).to_dict().items():
+            if count > 0:
+                if pd.isna(value):
+                    null_counts[nan_type(value)] = count
+                elif string_baseform(value) in null_string_list:
+                    null_counts[repr(value).replace('\'', '"')] = count
+    else:
+        string_null_counts = {
+            repr(value).replace('\'', '"'): count
+            for value, count in column_data.value_counts(dropna=True).items()
+            if string_baseform(value) in null_string_list
+        }
+        nan_data_counts = column_data[column_data.isna()].apply(nan_type).value_counts().to_dict()
+        null_counts = {**string_null_counts, **nan_data_counts}
+    return null_counts
+
+
 def nan_type(x):
     if x is np.nan:
         return 'numpy.nan'
@@ -61,6 +61,8 @@ class OutlierSampleDetection(SingleDatasetCheck):
         random seed for all check internals.
     timeout : int, default: 10
         Check will be interrupted if it takes more than this number of seconds. If 0, check will not be interrupted.
+    n_jobs : int, default: 1
+        Number of threads used to calculate the nearest neighbors distances. -1 uses all available CPUs.
     """
 
     def __init__(
@@ -73,6 +75,7 @@ class OutlierSampleDetection(SingleDatasetCheck):
             n_to_show: int = 5,
             random_state: int = 42,
             timeout: int = 10,
+            n_jobs: int = 1,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -88,6 +91,7 @@ class OutlierSampleDetection(SingleDatasetCheck):
         self.n_to_show = n_to_show
         self.random_state = random_state
         self.timeout = timeout
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check."""
@@ -114,7 +118,7 @@ class OutlierSampleDetection(SingleDatasetCheck):
         try:
             dist_matrix, idx_matrix = gower_distance.calculate_nearest_neighbors_distances(
                 data=df, cat_cols=dataset.cat_features, numeric_cols=dataset.numerical_features,
-                num_neighbors=num_neighbors)
+                num_neighbors=num_neighbors, n_jobs=self.n_jobs)
         except MemoryError as e:
             raise DeepchecksProcessError('Out of memory error occurred while calculating the distance matrix. Try '
                                          'reducing n_samples or nearest_neighbors_percent parameters values.') from e
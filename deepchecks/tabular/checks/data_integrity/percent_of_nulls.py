@@ -46,7 +46,7 @@ class PercentOfNulls(SingleDatasetCheck, ReduceFeatureMixin):
     aggregation_method: t.Optional[str], default: 'max'
         {feature_aggregation_method_argument:2*indent}
     n_samples : int , default: 100_000
-        number of samples to use for this check.
+        number of samples to use for this check. StreamingDataset objects are checked over all of their data.
     random_state : int, default: 42
         random seed for all check internals.
     """
@@ -71,26 +71,36 @@ class PercentOfNulls(SingleDatasetCheck, ReduceFeatureMixin):
 
     def run_logic(self, context: Context, dataset_kind: DatasetKind) -> CheckResult:
         """Run check logic."""
-        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
+        dataset = context.get_data_by_kind(dataset_kind)
+        # Streaming datasets are aggregated chunk by chunk over all of their data, instead of over a sample
+        if not dataset.is_streaming:
+            dataset = dataset.sample(self.n_samples, random_state=self.random_state)
         dataset = dataset.select(self.columns, self.ignore_columns, keep_label=False)
-        data = dataset.features_columns
+
+        null_counts = None
+        n_samples = 0
+        for chunk in (dataset.iter_chunks() if dataset.is_streaming else [dataset]):
+            chunk_null_counts = chunk.features_columns.isna().sum()
+            null_counts = chunk_null_counts if null_counts is None else null_counts + chunk_null_counts
+            n_samples += chunk.n_samples
+        columns = list(null_counts.index)
 
         feature_importance = context.feature_importance if context.feature_importance is not None \
-            else pd.Series(index=list(data.columns), dtype=object)
+            else pd.Series(index=columns, dtype=object)
 
-        result_data = [[col, data[col].isna().sum(), feature_importance[col]] for col in data.columns]
+        result_data = [[col, null_counts[col], feature_importance[col]] for col in columns]
         result_data = pd.DataFrame(data=result_data,
                                    columns=['Column',
                                             'Percent of nulls in sample',
                                             'Feature importance']).set_index(['Column'])
-        result_data['Percent of nulls in sample'] = result_data['Percent of nulls in sample'] / dataset.n_samples
+        result_data['Percent of nulls in sample'] = result_data['Percent of nulls in sample'] / n_samples
         result_data.sort_values(by='Percent of nulls in sample')
         if all(feature_importance.isna()):
             result_data.drop('Feature importance', axis=1, inplace=True)
 
         if context.with_display and max(result_data['Percent of nulls in sample']) > 0:
             display = (
-                [px.bar(x=data.columns, y=result_data['Percent of nulls in sample'],
+                [px.bar(x=columns, y=result_data['Percent of nulls in sample'],
                         title='Percent Of Nulls', range_y=(0, 1))
                  .update_layout(yaxis_title=None, xaxis_title=None)])
         else:
@@ -10,10 +10,13 @@
 #
 """Boosting overfit check module."""
 from copy import deepcopy
-from typing import TYPE_CHECKING, Callable, Tuple, Union
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, List, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
+from scipy.special import expit, softmax
 from sklearn.pipeline import Pipeline
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
@@ -175,22 +178,23 @@ class BoostingOverfit(TrainTestCheck):
         CheckResult
             The score value on the test dataset.
         """
-        train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
-        test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
         model = context.model
 
         # Get default scorer
         scorer = context.get_single_scorer(self.alternative_scorer)
 
+        # Null labels are filtered in advance so the staged predictions are aligned with the data the scorer uses
+        train_dataset = scorer.filter_nulls(context.train.sample(self.n_samples, random_state=self.random_state))
+        test_dataset = scorer.filter_nulls(context.test.sample(self.n_samples, random_state=self.random_state))
+
         # Get number of estimators on model
         num_estimators = PartialBoostingModel.n_estimators(model)
         estimator_steps = _calculate_steps(self.num_steps, num_estimators)
 
-        train_scores = []
-        test_scores = []
-        for step in estimator_steps:
-            train_scores.append(_partial_score(scorer, train_dataset, model, step))
-            test_scores.append(_partial_score(scorer, test_dataset, model, step))
+        train_scores = [scorer(partial_model, train_dataset)
+                        for partial_model in _staged_models(model, train_dataset.features_columns, estimator_steps)]
+        test_scores = [scorer(partial_model, test_dataset)
+                       for partial_model in _staged_models(model, test_dataset.features_columns, estimator_steps)]
 
         result = {'test': test_scores, 'train': train_scores}
 
@@ -257,9 +261,113 @@ class BoostingOverfit(TrainTestCheck):
         return super().config(include_version, include_defaults=include_defaults)
 
 
-def _partial_score(scorer, dataset, model, step):
-    partial_model = PartialBoostingModel(model, step)
-    return scorer(partial_model, dataset)
+class _StagedPredictionsModel:
+    """Model returning predictions of a boosting model limited to a number of estimators, calculated in advance."""
+
+    def __init__(self, predictions: np.ndarray, probas: np.ndarray = None):
+        self._predictions = predictions
+        self._probas = probas
+        if probas is not None:
+            self.predict_proba = self._predict_proba
+
+    def _validate_data(self, data: pd.DataFrame):
+        if len(data) != len(self._predictions):
+            raise DeepchecksValueError(f'Staged predictions were calculated for {len(self._predictions)} samples, '
+                                       f'but received data with {len(data)} samples')
+
+    def predict(self, data: pd.DataFrame) -> np.ndarray:
+        self._validate_data(data)
+        return self._predictions
+
+    def _predict_proba(self, data: pd.DataFrame) -> np.ndarray:
+        self._validate_data(data)
+        return self._probas
+
+
+def _staged_models(model, data: pd.DataFrame, steps: List[int]) -> list:
+    """Return a model per step, predicting the data using only the first estimators of the boosting model.
+
+    The predictions of all the steps are calculated in a single pass over the estimators of the model, using the
+    staged predictions of sklearn and CatBoost models and the accumulated raw margins of LightGBM and XGBoost models.
+    If the accumulated margins can't reproduce the predictions of the model (for example when using a custom
+    objective), falls back to predicting with the limited model on each step.
+    """
+    estimator = get_model_of_pipeline(model)
+    model_class = estimator.__class__.__name__
+    is_classification = model_class.endswith('Classifier')
+    transformed_data = model[:-1].transform(data) if isinstance(model, Pipeline) else data
+
+    if model_class in ['AdaBoostClassifier', 'GradientBoostingClassifier', 'AdaBoostRegressor',
+                       'GradientBoostingRegressor', 'CatBoostClassifier', 'CatBoostRegressor']:
+        staged_kwargs = {'eval_period': 1} if model_class.startswith('CatBoost') else {}
+        predictions = _select_steps(estimator.staged_predict(transformed_data, **staged_kwargs), steps)
+        if is_classification:
+            probas = _select_steps(estimator.staged_predict_proba(transformed_data, **staged_kwargs), steps)
+        else:
+            probas = [None] * len(steps)
+        return [_StagedPredictionsModel(*outputs) for outputs in zip(predictions, probas)]
+
+    if model_class in ['LGBMClassifier', 'LGBMRegressor', 'XGBClassifier', 'XGBRegressor']:
+        margins = _accumulated_margins(estimator, transformed_data, steps)
+        staged_models = [_StagedPredictionsModel(*_margins_to_outputs(estimator, step_margins, is_classification))
+                         for step_margins in margins]
+        if _is_matching_model(staged_models[-1], PartialBoostingModel(model, steps[-1]), data, is_classification):
+            return staged_models
+
+    return [PartialBoostingModel(model, step) for step in steps]
+
+
+def _select_steps(staged_outputs, steps: List[int]) -> list:
+    """Return the outputs of the given steps (1-based) out of the outputs generated per estimator."""
+    steps_set = set(steps)
+    return [np.asarray(output) for step, output in enumerate(islice(staged_outputs, steps[-1]), start=1)
+            if step in steps_set]
+
+
+def _accumulated_margins(estimator, data, steps: List[int]) -> List[np.ndarray]:
+    """Calculate the raw margins of the model per step by adding up the margins of the estimators between steps."""
+    margins = []
+    current_margins = None
+    previous_step = 0
+    for step in steps:
+        if estimator.__class__.__name__.startswith('LGBM'):
+            step_margins = estimator.predict(data, raw_score=True, start_iteration=previous_step,
+                                             num_iteration=step - previous_step)
+        elif current_margins is None:
+            step_margins = estimator.predict(data, output_margin=True, iteration_range=(0, step))
+        else:
+            # The base margin is already included in the first step margins, so not adding it again
+            step_margins = estimator.predict(data, output_margin=True, iteration_range=(previous_step, step),
+                                             base_margin=np.zeros_like(current_margins))
+        current_margins = step_margins if current_margins is None else current_margins + step_margins
+        margins.append(current_margins)
+        previous_step = step
+    return margins
+
+
+def _margins_to_outputs(estimator, margins: np.ndarray, is_classification: bool):
+    """Convert raw margins into predictions and probabilities, assuming the default objectives are used."""
+    if not is_classification:
+        return margins, None
+    if margins.ndim == 1:
+        positive_probas = expit(margins)
+        probas = np.column_stack([1 - positive_probas, positive_probas])
+    else:
+        probas = softmax(margins, axis=1)
+    return estimator.classes_[np.argmax(probas, axis=1)], probas
+
+
+def _is_matching_model(staged_model, partial_model, data: pd.DataFrame, is_classification: bool,
+                       n_samples: int = 100) -> bool:
+    """Validate the staged model reproduces the predictions of the limited model on the first samples of the data."""
+    samples = data.iloc[:n_samples]
+    staged_predictions = staged_model.predict(data)[:n_samples]
+    partial_predictions = np.asarray(partial_model.predict(samples)).reshape(staged_predictions.shape)
+    if not is_classification:
+        return np.allclose(staged_predictions, partial_predictions, rtol=1e-4, atol=1e-5)
+    return np.array_equal(staged_predictions, partial_predictions) and \
+        np.allclose(staged_model.predict_proba(data)[:n_samples], partial_model.predict_proba(samples),
+                    rtol=1e-4, atol=1e-5)
 
 
 def _calculate_steps(num_steps, num_estimators):
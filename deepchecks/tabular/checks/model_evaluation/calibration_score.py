@@ -62,7 +62,7 @@ class CalibrationScore(SingleDatasetCheck):
         ds_x = dataset.features_columns
         ds_y = dataset.label_col
         dataset_classes = dataset.classes_in_label_col
-        model = t.cast(ClassificationModel, context.model)
+        model = t.cast(ClassificationModel, context.cached_model)
 
         # Expect predict_proba to return in order of the sorted classes.
         if not hasattr(context.model, 'predict_proba'):
@@ -57,6 +57,6 @@ class ConfusionMatrixReport(SingleDatasetCheck):
         dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
         context.assert_classification_task()
         y_true = dataset.label_col
-        y_pred = np.array(context.model.predict(dataset.features_columns)).reshape(len(y_true), )
+        y_pred = np.array(context.cached_model.predict(dataset.features_columns)).reshape(len(y_true), )
 
         return run_confusion_matrix_check(y_pred, y_true, context.with_display, self.normalize_display)
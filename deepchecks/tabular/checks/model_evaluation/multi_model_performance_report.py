@@ -17,6 +17,7 @@ import plotly.express as px
 
 from deepchecks.core import CheckResult
 from deepchecks.tabular import ModelComparisonCheck, ModelComparisonContext
+from deepchecks.tabular.metric_utils.scorers import score_dataset
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.docref import doclink
 
@@ -69,14 +70,14 @@ class MultiModelPerformanceReport(ModelComparisonCheck):
 
             for context, model_name in zip(multi_context, multi_context.models.keys()):
                 test = context.test.sample(self.n_samples, random_state=self.random_state)
-                model = context.model
+                model = context.cached_model
                 label = cast(pd.Series, test.label_col)
                 n_samples = label.groupby(label).count()
                 results.extend(
                     [model_name, class_score, scorer.name, class_name, n_samples[class_name]]
-                    for scorer in scorers
+                    for scorer, scorer_value in zip(scorers, score_dataset(scorers, model, test))
                     # scorer returns numpy array of results with item per class
-                    for class_score, class_name in zip(scorer(model, test), context.model_classes)
+                    for class_score, class_name in zip(scorer_value, context.model_classes)
                 )
 
             results_df = pd.DataFrame(results, columns=['Model', 'Value', 'Metric', 'Class', 'Number of samples'])
@@ -84,10 +85,9 @@ class MultiModelPerformanceReport(ModelComparisonCheck):
         else:
             plot_x_axis = 'Model'
             results = [
-                [model_name, scorer(context.model, context.test), scorer.name,
-                 cast(pd.Series, context.test.label_col).count()]
+                [model_name, scorer_value, scorer.name, cast(pd.Series, context.test.label_col).count()]
                 for context, model_name in zip(multi_context, multi_context.models.keys())
-                for scorer in scorers
+                for scorer, scorer_value in zip(scorers, score_dataset(scorers, context.cached_model, context.test))
             ]
             results_df = pd.DataFrame(results, columns=['Model', 'Value', 'Metric', 'Number of samples'])
 
@@ -127,7 +127,7 @@ class PerformanceBias(SingleDatasetCheck):
             by this feature.
             display is a Figure showing the subgroups with the largest performance differences.
         """
-        model = context.model
+        model = context.cached_model
         dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
         if self.scorer is None:
             scorer = context.get_single_scorer()
@@ -112,7 +112,8 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
         Minimum number of samples required to calculate the drift score. If there are not enough samples for either
         train or test, the check will raise a ``NotEnoughSamplesError`` exception.
     n_samples : int , default: 100_000
-        number of samples to use for this check.
+        number of samples to use for this check. For a train ReferenceProfile, the predictions on all the rows it
+        was built on are used.
     random_state : int, default: 42
         random seed for all check internals.
     """
@@ -174,9 +175,8 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
         if (self.drift_mode == 'proba') and (context.task_type == TaskType.REGRESSION):
             raise DeepchecksValueError('probability_drift="proba" is not supported for regression tasks')
 
-        train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
         test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
-        model = context.model
+        model = context.cached_model
 
         # Flag for computing drift on the probabilities rather than the predicted labels
         proba_drift = \
@@ -185,12 +185,20 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
             and not (self.balance_classes is True and self.drift_mode == 'auto')
 
         if proba_drift:
-            train_pred = np.array(model.predict_proba(train_dataset.features_columns))
             test_pred = np.array(model.predict_proba(test_dataset.features_columns))
         else:
-            train_pred = np.array(model.predict(train_dataset.features_columns)).reshape((-1, 1))
             test_pred = np.array(model.predict(test_dataset.features_columns)).reshape((-1, 1))
 
+        if context.train.is_reference_profile:
+            # The profile holds the model predictions on the train rows it was built on
+            train_pred = context.train.get_predictions(proba=proba_drift)
+        else:
+            train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
+            if proba_drift:
+                train_pred = np.array(model.predict_proba(train_dataset.features_columns))
+            else:
+                train_pred = np.array(model.predict(train_dataset.features_columns)).reshape((-1, 1))
+
         return self._prediction_drift(train_pred, test_pred, context.model_classes, context.with_display, proba_drift,
                                       (context.task_type != TaskType.REGRESSION) and (not proba_drift))
 
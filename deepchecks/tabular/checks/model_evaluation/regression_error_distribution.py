@@ -73,7 +73,7 @@ class RegressionErrorDistribution(SingleDatasetCheck):
         """
         dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
         context.assert_regression_task()
-        model = context.model
+        model = context.cached_model
         y_test = dataset.label_col
 
         y_pred = model.predict(dataset.features_columns)
@@ -63,7 +63,7 @@ class RegressionSystematicError(SingleDatasetCheck):
         context.assert_regression_task()
         y_test = dataset.label_col
         x_test = dataset.features_columns
-        y_pred = context.model.predict(x_test)
+        y_pred = context.cached_model.predict(x_test)
 
         rmse = mean_squared_error(y_test, y_pred, squared=False)
         diff = y_test - y_pred
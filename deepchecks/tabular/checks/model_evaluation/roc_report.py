@@ -87,7 +87,7 @@ class RocReport(SingleDatasetCheck):
                                               'needs the predicted probabilities to plot the ROC curve, instead'
                                               ' of only predicted classes.')
 
-        y_pred_prob = context.model.predict_proba(dataset.features_columns)
+        y_pred_prob = context.cached_model.predict_proba(dataset.features_columns)
         dataset_classes = context.model_classes
 
         fpr = {}
@@ -90,7 +90,7 @@ class SegmentPerformance(SingleDatasetCheck):
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check."""
         dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
-        model = context.model
+        model = context.cached_model
         scorer = context.get_single_scorer(self.alternative_scorer)
         dataset.assert_features()
         features = dataset.features
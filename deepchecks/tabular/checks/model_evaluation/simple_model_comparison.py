@@ -25,6 +25,7 @@ from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, Dataset, TrainTestCheck
+from deepchecks.tabular.metric_utils.scorers import score_dataset
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.distribution.preprocessing import ScaledNumerics
 from deepchecks.utils.docref import doclink
@@ -168,9 +169,12 @@ class SimpleModelComparison(TrainTestCheck):
         simple_model = self._create_simple_model(train_dataset, task_type)
 
         models = [
-            (f'{type(model).__name__} model', 'Origin', model),
+            (f'{type(model).__name__} model', 'Origin', context.cached_model),
             (f'Simple model - {self.strategy}', 'Simple', simple_model)
         ]
+        # Each model predicts once, and all the scorers are calculated on its predictions
+        models_scores = {model_type: score_dataset(scorers, model_instance, test_dataset)
+                         for _, model_type, model_instance in models}
         classes_display_array = []
         display_array = []
         # Multiclass have different return type from the scorer, list of score per class instead of single score
@@ -178,10 +182,10 @@ class SimpleModelComparison(TrainTestCheck):
             class_counts = test_label.groupby(test_label).count()
             # Dict in format { Scorer : Dict { Class : Dict { Origin/Simple : score } } }
             results_dict = {}
-            for scorer in scorers:
+            for scorer_index, scorer in enumerate(scorers):
                 model_dict = defaultdict(dict)
-                for model_name, model_type, model_instance in models:
-                    scorer_value = scorer(model_instance, test_dataset)
+                for model_name, model_type, _ in models:
+                    scorer_value = models_scores[model_type][scorer_index]
                     if isinstance(scorer_value, Number) or scorer_value is None:
                         model_dict[model_type] = scorer_value
                         if context.with_display:
@@ -210,10 +214,10 @@ class SimpleModelComparison(TrainTestCheck):
         else:
             # Dict in format { Scorer : Dict { Origin/Simple : score } }
             results_dict = {}
-            for scorer in scorers:
+            for scorer_index, scorer in enumerate(scorers):
                 model_dict = defaultdict(dict)
-                for model_name, model_type, model_instance in models:
-                    score = scorer(model_instance, test_dataset)
+                for model_name, model_type, _ in models:
+                    score = models_scores[model_type][scorer_index]
                     model_dict[model_type] = score
                     if context.with_display:
                         display_array.append([model_name,
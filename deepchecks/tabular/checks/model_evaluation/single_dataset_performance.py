@@ -19,6 +19,7 @@ from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.core.reduce_classes import ReduceMetricClassMixin
 from deepchecks.tabular import Context
 from deepchecks.tabular.base_checks import SingleDatasetCheck
+from deepchecks.tabular.metric_utils.scorers import score_dataset
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.docref import doclink
 from deepchecks.utils.strings import format_number
@@ -59,23 +60,22 @@ class SingleDatasetPerformance(SingleDatasetCheck, ReduceMetricClassMixin):
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check."""
         dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
-        model = context.model
+        model = context.cached_model
         if context.task_type == TaskType.REGRESSION and self.scorers is None:
             self.scorers = {'RMSE': 'RMSE'}
         scorers = context.get_scorers(self.scorers, use_avg_defaults=True)
 
         results = []
         display = None
+        scorer_values = score_dataset(scorers, model, dataset)
         if context.task_type == TaskType.REGRESSION:
-            for scorer in scorers:
-                scorer_value = scorer(model, dataset)
+            for scorer, scorer_value in zip(scorers, scorer_values):
                 results.append([scorer.name, scorer_value])
             results_df = pd.DataFrame(results, columns=['Metric', 'Value'])
             if context.with_display:
                 display = [results_df]
         else:
-            for scorer in scorers:
-                scorer_value = scorer(model, dataset)
+            for scorer, scorer_value in zip(scorers, scorer_values):
                 if isinstance(scorer_value, Number) or scorer_value is None:
                     results.append([pd.NA, scorer.name, scorer_value])
                 else:
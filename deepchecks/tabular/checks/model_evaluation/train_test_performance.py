@@ -17,6 +17,7 @@ import pandas as pd
 from deepchecks.core import CheckResult
 from deepchecks.core.checks import CheckConfig
 from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular.metric_utils.scorers import score_dataset
 from deepchecks.utils.abstracts.train_test_performace import TrainTestPerformanceAbstract
 from deepchecks.utils.docref import doclink
 
@@ -88,7 +89,7 @@ class TrainTestPerformance(TrainTestPerformanceAbstract, TrainTestCheck):
         """Run check."""
         train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
         test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
-        model = context.model
+        model = context.cached_model
         scorers = context.get_scorers(self.scorers, use_avg_defaults=False)
         datasets = {'Train': train_dataset, 'Test': test_dataset}
 
@@ -96,8 +97,7 @@ class TrainTestPerformance(TrainTestPerformanceAbstract, TrainTestCheck):
         for dataset_name, dataset in datasets.items():
             label = cast(pd.Series, dataset.label_col)
             n_samples_per_class = label.groupby(label).count()
-            for scorer in scorers:
-                scorer_value = scorer(model, dataset)
+            for scorer, scorer_value in zip(scorers, score_dataset(scorers, model, dataset)):
                 if isinstance(scorer_value, Number):
                     results.append([dataset_name, pd.NA, scorer.name, scorer_value, len(label)])
                 else:
@@ -73,6 +73,8 @@ class WeakSegmentsPerformance(SingleDatasetCheck, WeakSegmentAbstract):
         In each categorical column, categories with frequency below threshold will be merged into "Other" category.
     random_state : int, default: 42
         random seed for all check internals.
+    n_jobs : int , default: 1
+        Number of processes used to search the weak segments of the feature pairs. -1 uses all available CPUs.
     """
 
     def __init__(
@@ -88,6 +90,7 @@ class WeakSegmentsPerformance(SingleDatasetCheck, WeakSegmentAbstract):
             categorical_aggregation_threshold: float = 0.05,
             n_to_show: int = 3,
             random_state: int = 42,
+            n_jobs: int = 1,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -108,6 +111,7 @@ class WeakSegmentsPerformance(SingleDatasetCheck, WeakSegmentAbstract):
         self.loss_per_sample = loss_per_sample
         self.alternative_scorer = alternative_scorer
         self.categorical_aggregation_threshold = categorical_aggregation_threshold
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check."""
@@ -127,7 +131,7 @@ class WeakSegmentsPerformance(SingleDatasetCheck, WeakSegmentAbstract):
             scorer, dummy_model = None, None
             avg_score = round(score_per_sample.mean(), 3)
         else:
-            predictions = context.model.predict(dataset.features_columns)
+            predictions = context.cached_model.predict(dataset.features_columns)
             if context.task_type == TaskType.REGRESSION:
                 y_proba = None
                 score_per_sample = calculate_neg_mse_per_sample(dataset_subset.label_col, predictions)
@@ -137,7 +141,7 @@ class WeakSegmentsPerformance(SingleDatasetCheck, WeakSegmentAbstract):
                         'Predicted probabilities not supplied. The weak segment checks relies'
                         ' on cross entropy error that requires predicted probabilities, '
                         'rather than only predicted classes.')
-                y_proba = context.model.predict_proba(dataset.features_columns)
+                y_proba = context.cached_model.predict_proba(dataset.features_columns)
                 score_per_sample = calculate_neg_cross_entropy_per_sample(dataset.label_col, y_proba,
                                                                           context.model_classes)
 
@@ -9,10 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """The date_leakage check module."""
+import typing as t
+
 import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular.utils.leakage import leaked_mask
 from deepchecks.utils.strings import format_datetime, format_percent
 
 __all__ = ['DateTrainTestLeakageDuplicates']
@@ -25,14 +28,14 @@ class DateTrainTestLeakageDuplicates(TrainTestCheck):
     ----------
     n_to_show : int , default: 5
         Number of common dates to show.
-    n_samples : int , default: 10_000_000
-        number of samples to use for this check.
+    n_samples : t.Optional[int] , default: 10_000_000
+        number of samples to use for this check. If None, the check runs on all the samples of the datasets.
     random_state : int, default: 42
         random seed for all check internals.
     """
 
     def __init__(self, n_to_show: int = 5,
-                 n_samples: int = 10_000_000,
+                 n_samples: t.Optional[int] = 10_000_000,
                  random_state: int = 42,
                  **kwargs):
         super().__init__(**kwargs)
@@ -61,16 +64,17 @@ class DateTrainTestLeakageDuplicates(TrainTestCheck):
         train_date = train_dataset.datetime_col
         test_date = test_dataset.datetime_col
 
-        date_intersection = tuple(set(train_date).intersection(test_date))
+        is_leaked = leaked_mask(test_date, train_date)
 
-        if len(date_intersection) > 0:
-            leakage_ratio = len([x for x in test_date if x in date_intersection]) / test_dataset.n_samples
+        if is_leaked.any():
+            leakage_ratio = is_leaked.sum() / test_dataset.n_samples
             return_value = leakage_ratio
 
             if context.with_display:
                 text = f'{format_percent(leakage_ratio)} of test data dates appear in training data'
+                leaked_dates = test_date[is_leaked].drop_duplicates()[:self.n_to_show]
                 table = pd.DataFrame(
-                    [[list(format_datetime(it) for it in date_intersection[:self.n_to_show])]],
+                    [[list(format_datetime(it) for it in leaked_dates)]],
                     index=['Sample of test dates in train:'], columns=['duplicate values']
                 )
                 display = [text, table]
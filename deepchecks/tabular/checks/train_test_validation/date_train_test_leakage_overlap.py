@@ -9,8 +9,11 @@
 # ----------------------------------------------------------------------------
 #
 """The date_leakage check module."""
+import typing as t
+
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular.utils.leakage import count_earlier_than
 from deepchecks.utils.strings import format_datetime, format_percent
 
 __all__ = ['DateTrainTestLeakageOverlap']
@@ -21,15 +24,15 @@ class DateTrainTestLeakageOverlap(TrainTestCheck):
 
     Parameters
     ----------
-    n_samples : int , default: 1_000_000
-        number of samples to use for this check.
+    n_samples : t.Optional[int] , default: 1_000_000
+        number of samples to use for this check. If None, the check runs on all the samples of the datasets.
     random_state : int, default: 42
         random seed for all check internals.
     """
 
     def __init__(
         self,
-        n_samples: int = 1_000_000,
+        n_samples: t.Optional[int] = 1_000_000,
         random_state: int = 42,
         **kwargs
     ):
@@ -58,9 +61,9 @@ class DateTrainTestLeakageOverlap(TrainTestCheck):
         train_date = train_dataset.datetime_col
         test_date = test_dataset.datetime_col
 
-        max_train_date = max(train_date)
-        min_test_date = min(test_date)
-        dates_leaked = sum(date < max_train_date for date in test_date)
+        max_train_date = train_date.max()
+        min_test_date = test_date.min()
+        dates_leaked = count_earlier_than(test_date, max_train_date)
 
         if dates_leaked > 0:
             leakage_ratio = dates_leaked / test_dataset.n_samples
@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains Feature Drift check."""
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -19,6 +19,7 @@ from deepchecks.core.reduce_classes import ReduceFeatureMixin
 from deepchecks.tabular import Context, Dataset, TrainTestCheck
 from deepchecks.tabular._shared_docs import docstrings
 from deepchecks.utils.abstracts.feature_drift import FeatureDriftAbstract
+from deepchecks.utils.distribution.streaming_drift import DriftAccumulator
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['FeatureDrift']
@@ -96,9 +97,13 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         train or test, the check will return None for that feature. If there are not enough samples for all features,
         the check will raise a ``NotEnoughSamplesError`` exception.
     n_samples : int , default: 100_000
-        Number of samples to use for drift computation and plot.
+        Number of samples to use for drift computation and plot. A train ReferenceProfile is used with all the rows
+        it was built on. The drift scores of a StreamingDataset are calculated over all of its chunks, and only the
+        plots use a sample of it.
     random_state : int , default: 42
         Random seed for sampling.
+    n_jobs : int , default: 1
+        Number of threads used to calculate the drift scores of the columns. -1 uses all available CPUs.
     """
 
     def __init__(
@@ -119,6 +124,7 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
             min_samples: int = 10,
             n_samples: int = 100_000,
             random_state: int = 42,
+            n_jobs: int = 1,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -143,6 +149,7 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         self.min_samples = min_samples
         self.n_samples = n_samples
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context) -> CheckResult:
         """
@@ -170,12 +177,8 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         train_dataset.assert_features()
         test_dataset.assert_features()
 
-        train_dataset = train_dataset.select(
-            self.columns, self.ignore_columns
-        ).sample(self.n_samples, random_state=self.random_state)
-        test_dataset = test_dataset.select(
-            self.columns, self.ignore_columns
-        ).sample(self.n_samples, random_state=self.random_state)
+        train_dataset = train_dataset.select(self.columns, self.ignore_columns)
+        test_dataset = test_dataset.select(self.columns, self.ignore_columns)
 
         features_order = (
             # In order to have consistent order for features with same importance, first sorting by index, and then
@@ -197,16 +200,38 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
                 # we only support categorical or numerical features
                 continue
 
+        # Streaming datasets are aggregated chunk by chunk over all of their data, and sampled only for the plots.
+        # Against a train ReferenceProfile, which holds the distributions of a sample, the test data is sampled too.
+        if (train_dataset.is_streaming or test_dataset.is_streaming) and not train_dataset.is_reference_profile:
+            drift_scores = self._calculate_drift_over_chunks(train_dataset, test_dataset, common_columns)
+        else:
+            drift_scores = None
+
+        if drift_scores is not None and not context.with_display:
+            train, test = None, None
+        else:
+            if not train_dataset.is_reference_profile:
+                train_dataset = train_dataset.sample(self.n_samples, random_state=self.random_state)
+            test_dataset = test_dataset.sample(self.n_samples, random_state=self.random_state)
+            # A reference profile holds the distributions of the train columns instead of the data
+            train = (
+                {column: train_dataset.column_distribution(column) for column in common_columns}
+                if train_dataset.is_reference_profile
+                else train_dataset.data
+            )
+            test = test_dataset.data
+
         results, displays = self._calculate_feature_drift(
             drift_kind='tabular-features',
-            train=train_dataset.data,
-            test=test_dataset.data,
+            train=train,
+            test=test,
             train_dataframe_name=train_dataset.name,
             test_dataframe_name=test_dataset.name,
             common_columns=common_columns,
             feature_importance=feature_importance,
             features_order=features_order,
-            with_display=context.with_display
+            with_display=context.with_display,
+            drift_scores=drift_scores
         )
         return CheckResult(
             value=results,
@@ -214,6 +239,31 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
             header='Feature Drift'
         )
 
+    def _calculate_drift_over_chunks(self, train_dataset: Dataset, test_dataset: Dataset,
+                                     common_columns: Dict[Hashable, str]) -> Dict[Hashable, Dict[str, Any]]:
+        """Calculate the drift scores of the columns by accumulating all the chunks of the datasets."""
+        accumulators = []
+        for dataset in (train_dataset, test_dataset):
+            accumulator = DriftAccumulator(common_columns, random_state=self.random_state)
+            for chunk in (dataset.iter_chunks() if dataset.is_streaming else [dataset]):
+                accumulator.update(chunk.data)
+            accumulators.append(accumulator)
+
+        train_accumulator, test_accumulator = accumulators
+        sort_by = 'difference' if self.show_categories_by == 'largest_difference' else \
+            ('dist1' if self.show_categories_by == 'train_largest' else 'dist2')
+        return test_accumulator.calc_drift(
+            train_accumulator,
+            numerical_drift_method=self.numerical_drift_method,
+            categorical_drift_method=self.categorical_drift_method,
+            margin_quantile_filter=self.margin_quantile_filter,
+            max_num_categories_for_drift=self.max_num_categories_for_drift,
+            min_category_size_ratio=self.min_category_size_ratio,
+            ignore_na=self.ignore_na,
+            min_samples=self.min_samples,
+            sort_by=sort_by
+        )
+
     def reduce_output(self, check_result: CheckResult) -> Dict[str, float]:
         """Return an aggregated drift score based on aggregation method defined."""
         feature_importance = pd.Series({column: info['Importance'] for column, info in check_result.value.items()})
@@ -59,6 +59,8 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
         Random state for the ppscore.predictors function
     min_pps_to_show: float, default 0.05
         Minimum PPS to show a class in the graph
+    n_jobs : int , default: 1
+        Number of processes used to calculate the PPS of the features. -1 uses all available CPUs.
     """
 
     def __init__(self, ppscore_params=None,
@@ -66,6 +68,7 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
                  n_samples: int = 100_000,
                  random_state: int = None,
                  min_pps_to_show: float = 0.05,
+                 n_jobs: int = 1,
                  **kwargs):
         super().__init__(**kwargs)
         self.ppscore_params = ppscore_params or {}
@@ -73,6 +76,7 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
         self.n_samples = n_samples
         self.random_state = random_state
         self.min_pps_to_show = min_pps_to_show
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context) -> CheckResult:
         """Run check.
@@ -127,7 +131,8 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
                                                            min_pps_to_show=self.min_pps_to_show,
                                                            random_state=self.random_state,
                                                            with_display=context.with_display,
-                                                           dataset_names=(train_dataset.name, test_dataset.name))
+                                                           dataset_names=(train_dataset.name, test_dataset.name),
+                                                           n_jobs=self.n_jobs)
 
         if display:
             display += text
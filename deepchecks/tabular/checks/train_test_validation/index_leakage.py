@@ -9,11 +9,14 @@
 # ----------------------------------------------------------------------------
 #
 """The index_leakage check module."""
+import typing as t
+
 import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular.utils.leakage import leaked_values
 from deepchecks.utils.strings import format_percent
 
 __all__ = ['IndexTrainTestLeakage']
@@ -26,14 +29,14 @@ class IndexTrainTestLeakage(TrainTestCheck):
     ----------
     n_to_show : int , default: 5
         Number of samples with same indices in train and test to show.
-    n_samples : int , default: 10_000_000
-        number of samples to use for this check.
+    n_samples : t.Optional[int] , default: 10_000_000
+        number of samples to use for this check. If None, the check runs on all the samples of the datasets.
     random_state : int, default: 42
         random seed for all check internals.
     """
 
     def __init__(self, n_to_show: int = 5,
-                 n_samples: int = 10_000_000,
+                 n_samples: t.Optional[int] = 10_000_000,
                  random_state: int = 42,
                  **kwargs):
         super().__init__(**kwargs)
@@ -62,12 +65,12 @@ class IndexTrainTestLeakage(TrainTestCheck):
         train_index = train_dataset.index_col
         val_index = test_dataset.index_col
 
-        index_intersection = list(set(train_index).intersection(val_index))
+        index_intersection = leaked_values(val_index, train_index).tolist()
         if len(index_intersection) > 0:
             size_in_test = len(index_intersection) / test_dataset.n_samples
             if context.with_display:
                 text = f'{size_in_test:.1%} of test data indexes appear in training data'
-                table = pd.DataFrame([[list(index_intersection)[:self.n_index_to_show]]],
+                table = pd.DataFrame([[index_intersection[:self.n_index_to_show]]],
                                      index=['Sample of test indexes in train:'])
                 display = [text, table]
             else:
@@ -84,7 +84,8 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
         Minimum number of samples required to calculate the drift score. If there are not enough samples for either
         train or test, the check will raise a ``NotEnoughSamplesError`` exception.
     n_samples : int , default: 100_000
-        Number of samples to use for drift computation and plot.
+        Number of samples to use for drift computation and plot. A train ReferenceProfile is used with all the rows
+        it was built on.
     random_state : int , default: 42
         Random seed for sampling.
     """
@@ -128,12 +129,17 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
             value: drift score.
             display: label distribution graph, comparing the train and test distributions.
         """
-        train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
         test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
+        if context.train.is_reference_profile:
+            train_dataset = context.train
+            train_label = train_dataset.label_distribution
+        else:
+            train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
+            train_label = train_dataset.label_col
 
         column_type = 'categorical' if context.task_type != TaskType.REGRESSION else 'numerical'
 
-        return self._calculate_label_drift(train_dataset.label_col, test_dataset.label_col, train_dataset.label_name,
+        return self._calculate_label_drift(train_label, test_dataset.label_col, train_dataset.label_name,
                                            column_type, context.with_display, (train_dataset.name, test_dataset.name))
 
     def reduce_output(self, check_result: CheckResult) -> Dict[str, float]:
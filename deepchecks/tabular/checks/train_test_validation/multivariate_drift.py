@@ -49,6 +49,7 @@ class MultivariateDrift(TrainTestCheck):
         - 'largest_difference': Show the largest difference between categories.
     sample_size : int , default: 10_000
         Max number of rows to use from each dataset for the training and evaluation of the domain classifier.
+        For a train ReferenceProfile, the rows it kept for this check are used.
     random_state : int , default: 42
         Random seed for the check.
     test_size : float , default: 0.3
@@ -101,7 +102,11 @@ class MultivariateDrift(TrainTestCheck):
         cat_features = train_dataset.cat_features
         numerical_features = train_dataset.numerical_features
 
-        sample_size = min(self.n_samples, train_dataset.n_samples, test_dataset.n_samples)
+        # A reference profile keeps only a sample of the train rows for this check
+        train_dataframe = (train_dataset.sampled_rows if train_dataset.is_reference_profile
+                           else train_dataset).features_columns
+
+        sample_size = min(self.n_samples, len(train_dataframe), test_dataset.n_samples)
 
         headnote = """
         <span>
@@ -111,7 +116,7 @@ class MultivariateDrift(TrainTestCheck):
         """
 
         values_dict, displays = run_multivariable_drift(
-            train_dataframe=train_dataset.features_columns,
+            train_dataframe=train_dataframe,
             test_dataframe=test_dataset.features_columns,
             numerical_features=numerical_features,
             cat_features=cat_features,
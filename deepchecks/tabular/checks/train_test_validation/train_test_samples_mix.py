@@ -9,14 +9,15 @@
 # ----------------------------------------------------------------------------
 #
 """The data_sample_leakage_report check module."""
-from typing import Any, List
+from typing import List, Sequence
 
+import numpy as np
 import pandas as pd
-from pandas.core.dtypes.common import is_integer_dtype
 
 from deepchecks.core import CheckResult
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.utils.abstracts.train_test_samples_mix import TrainTestSamplesMixAbstract
+from deepchecks.utils.dataframes import get_group_positions, group_identical_rows
 from deepchecks.utils.strings import format_percent
 from deepchecks.utils.typing import Hashable
 
@@ -72,17 +73,16 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
         test_dataset.assert_features()
         columns = test_dataset.features + ([test_dataset.label_name] if test_dataset.has_label() else [])
 
-        # For pandas.groupby in python 3.6, there is problem with comparing numpy nan, so replace with placeholder
-        train_df = _fillna(train_dataset.data)
-        test_df = _fillna(test_dataset.data)
+        train_groups, test_groups = group_identical_rows(train_dataset.data[columns], test_dataset.data[columns])
+        n_groups = max(train_groups.max(initial=-1), test_groups.max(initial=-1)) + 1
+        train_counts = np.bincount(train_groups, minlength=n_groups)
+        test_counts = np.bincount(test_groups, minlength=n_groups)
 
-        train_uniques = _create_unique_frame(train_df, columns, text_prefix='Train indices: ')
-        test_uniques = _create_unique_frame(test_df, columns, text_prefix='Test indices: ')
-
-        duplicates_df, test_dup_count = _create_train_test_joined_duplicate_frame(train_uniques, test_uniques, columns)
-
-        # Replace filler back to none
-        duplicates_df = duplicates_df.applymap(lambda x: None if x == NAN_REPLACEMENT else x)
+        duplicated_groups = np.flatnonzero((train_counts > 0) & (test_counts > 0))
+        duplicated_groups = duplicated_groups[np.argsort(-test_counts[duplicated_groups], kind='stable')]
+        duplicates_df = _create_train_test_duplicate_frame(train_dataset.data, test_dataset.data, columns,
+                                                           train_groups, test_groups, duplicated_groups)
+        test_dup_count = int(test_counts[duplicated_groups].sum())
         dup_ratio = test_dup_count / test_dataset.n_samples
         user_msg = f'{format_percent(dup_ratio)} ({test_dup_count} / {test_dataset.n_samples}) \
                      of test data samples appear in train data'
@@ -91,77 +91,26 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
         return CheckResult(result, header='Train Test Samples Mix', display=display)
 
 
-def _create_train_test_joined_duplicate_frame(first: pd.DataFrame, second: pd.DataFrame, columns: List[Hashable]):
-    """Create duplicate dataframe out of 2 uniques dataframes.
-
-    This function accept 2 dataframes resulted from `_create_unique_frame`. this means that each dataframe have
-    no duplicate in it. so if the concatenation between the 2 find duplicates, they are necessarily between each other.
-    """
-    columns_data = []
-    index_text = []
-    total_test_count = 0
-    group_unique_data: dict = pd.concat([first, second]).groupby(columns, dropna=False).groups
-    # The group data is backward (the columns are the indexes, and the indexes are the values)
-    for duplicate_columns, indexes in group_unique_data.items():
-        # If length is 1, then no duplicate found between first and second
-        if len(indexes) == 1:
-            continue
-        # Indexes should have dict of train & test info from `_filter_duplicates`
-        text = indexes[0]['text'] + '\n' + indexes[1]['text']
-        # Take the count only of test
-        test_count = indexes[0]['count'] if indexes[0]['text'].startswith('Test') else indexes[1]['count']
-        total_test_count += test_count
-        # Save info of duplicated text and the columns info
-        columns_data.append([*duplicate_columns, test_count])
-        index_text.append(text)
-
-    count_column_name = '_value_to_sort_by_'
-    duplicates = pd.DataFrame(columns_data, index=index_text, columns=[*columns, count_column_name])
-    duplicates = duplicates.sort_values(by=count_column_name, ascending=False)
-    duplicates = duplicates.drop(count_column_name, axis=1)
-    return duplicates, total_test_count
-
-
-def _create_unique_frame(df: pd.DataFrame, columns: List[Hashable], text_prefix: str = '') -> pd.DataFrame:
-    """For given dataframe and columns create a dataframe with only unique combinations of the columns."""
-    columns_data = []
-    index_text = []
-    group_unique_data: dict = df.groupby(columns, dropna=False).groups
-    # The group data is backward (the columns are the indexes, and the indexes are the values)
-    for duplicate_columns, indexes in group_unique_data.items():
-        # Save info of duplicated text and the columns info
-        columns_data.append(duplicate_columns)
-        index_text.append(_get_dup_info(indexes, text_prefix))
-
-    return pd.DataFrame(columns_data, index=index_text, columns=columns)
-
-
-def _get_dup_info(index_arr: list, text_prefix: str) -> dict:
+def _create_train_test_duplicate_frame(train_df: pd.DataFrame, test_df: pd.DataFrame, columns: List[Hashable],
+                                       train_groups: np.ndarray, test_groups: np.ndarray,
+                                       duplicated_groups: np.ndarray) -> pd.DataFrame:
+    """Create a dataframe with a row for each group of samples which appears in both train and test."""
+    train_positions = get_group_positions(train_groups, duplicated_groups)
+    test_positions = get_group_positions(test_groups, duplicated_groups)
+    index_text = [_get_dup_info(train_df.index[train], 'Train indices: ') + '\n' +
+                  _get_dup_info(test_df.index[test], 'Test indices: ')
+                  for train, test in zip(train_positions, test_positions)]
+    duplicates = train_df[columns].iloc[[positions[0] for positions in train_positions]]
+    duplicates.index = index_text
+    # Null values are displayed as None
+    for column in duplicates.columns[duplicates.isna().any()]:
+        duplicates[column] = duplicates[column].astype(object).where(duplicates[column].notna(), None)
+    return duplicates
+
+
+def _get_dup_info(index_arr: Sequence, text_prefix: str) -> str:
     text = ', '.join([str(i) for i in index_arr])
     if len(text) > 30:
         text = f'{text[:30]}.. Tot. {(len(index_arr))}'
 
-    return {'text': f'{text_prefix}{text}', 'count': len(index_arr)}
-
-
-NAN_REPLACEMENT = '__deepchecks_na_filler__'
-
-
-def _fillna_col(column: pd.Series, value: Any):
-    if isinstance(column.dtype, pd.CategoricalDtype):
-        return column.cat.add_categories([value]).fillna(value=value)
-    if is_integer_dtype(column):
-        # nullable int series cannot be filled with a string
-        return column.astype(float).fillna(value=value)
-    return column.fillna(value=value)
-
-
-def _fillna(
-    df: pd.DataFrame,
-    value: Any = NAN_REPLACEMENT
-) -> pd.DataFrame:
-    """Fill nan values."""
-    return pd.DataFrame({
-        name: (_fillna_col(column, value))
-        for name, column in df.items()
-    })
+    return f'{text_prefix}{text}'
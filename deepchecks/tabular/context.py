@@ -9,11 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """Module for base tabular context."""
+import threading
 import typing as t
 
 import numpy as np
 import pandas as pd
 
+from deepchecks.core.checks import DatasetKind
 from deepchecks.core.context import BaseContext
 from deepchecks.core.errors import (DatasetValidationError, DeepchecksNotSupportedError, DeepchecksValueError,
                                     ModelValidationError)
@@ -151,6 +153,114 @@ class _DummyModel:
         """Just for python 3.6 (sklearn validates fit method)."""
 
 
+def _hash_rows(data: pd.DataFrame) -> t.Optional[np.ndarray]:
+    """Return a hash of the values of each row, or None if the values can't be hashed."""
+    try:
+        return pd.util.hash_pandas_object(data, index=False).to_numpy()
+    except TypeError:
+        return None
+
+
+class _CachedModel:
+    """Model wrapper which caches the model predictions over the context datasets.
+
+    The predictions (and probabilities) of each dataset are calculated once, on the first request, over the full
+    dataset. Following requests on the dataset or on any subset of it (e.g. a sample) are served by looking up the
+    rows by their index. Data which is not part of the datasets is passed to the wrapped model as is.
+
+    Parameters
+    ----------
+    model: BasicModel
+        The user model to wrap.
+    train: t.Optional[Dataset] , default: None
+        Dataset, representing data an estimator was fitted on.
+    test: t.Optional[Dataset] , default: None
+        Dataset, representing data an estimator predicts on.
+    batch_size: t.Optional[int] , default: None
+        Number of rows to pass to the model in each inference call when populating the cache. If None, the whole
+        dataset is passed at once.
+    """
+
+    def __init__(self,
+                 model: BasicModel,
+                 train: t.Optional[Dataset] = None,
+                 test: t.Optional[Dataset] = None,
+                 batch_size: t.Optional[int] = None):
+        if batch_size is not None and batch_size < 1:
+            raise DeepchecksValueError('batch_size must be a positive integer')
+        self.model = model
+        self.batch_size = batch_size
+        # Datasets with duplicate index can't be looked up by index, so they are not cached
+        self._datasets = {
+            kind: dataset for kind, dataset in ((DatasetKind.TRAIN, train), (DatasetKind.TEST, test))
+            if dataset is not None and not dataset.is_reference_profile and dataset.data.index.is_unique
+        }
+        self._predictions: t.Dict[DatasetKind, np.ndarray] = {}
+        self._probas: t.Dict[DatasetKind, np.ndarray] = {}
+        self._row_hashes: t.Dict[DatasetKind, t.Optional[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+        if hasattr(model, 'predict_proba'):
+            self.predict_proba = self._predict_proba
+
+    def predict(self, data: pd.DataFrame) -> np.ndarray:
+        """Return the model predictions on the given data, using the cache where possible."""
+        return self._get_cached_output(data, 'predict', self._predictions)
+
+    def _predict_proba(self, data: pd.DataFrame) -> np.ndarray:
+        """Return the model predicted probabilities on the given data, using the cache where possible."""
+        return self._get_cached_output(data, 'predict_proba', self._probas)
+
+    def fit(self, *args, **kwargs):
+        """Just for python 3.6 (sklearn validates fit method)."""
+
+    def __getstate__(self):
+        """Return the wrapper state without the lock, which can't be pickled."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the wrapper state and create a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_cached_output(self, data: pd.DataFrame, method_name: str, cache: t.Dict[DatasetKind, np.ndarray]):
+        method = getattr(self.model, method_name)
+        kind, positions = self._locate_data(data)
+        if kind is None:
+            return method(data)
+        with self._lock:
+            if kind not in cache:
+                cache[kind] = self._run_in_batches(method, self._datasets[kind].features_columns)
+        return cache[kind][positions]
+
+    def _run_in_batches(self, method: t.Callable, data: pd.DataFrame) -> np.ndarray:
+        if self.batch_size is None or len(data) <= self.batch_size:
+            return np.asarray(method(data))
+        return np.concatenate([np.asarray(method(data.iloc[i:i + self.batch_size]))
+                               for i in range(0, len(data), self.batch_size)])
+
+    def _locate_data(self, data: pd.DataFrame) -> t.Tuple[t.Optional[DatasetKind], t.Optional[np.ndarray]]:
+        """Find the dataset the given data was taken from, and the positions of its rows in that dataset."""
+        if not isinstance(data, pd.DataFrame) or len(data) == 0:
+            return None, None
+        for kind, dataset in self._datasets.items():
+            if list(data.columns) != dataset.features:
+                continue
+            positions = dataset.data.index.get_indexer(data.index)
+            if (positions == -1).any():
+                continue
+            # Validate the data values were not changed (e.g. by permuting a column or editing a row)
+            if kind not in self._row_hashes:
+                self._row_hashes[kind] = _hash_rows(dataset.features_columns)
+            original_hashes, data_hashes = self._row_hashes[kind], _hash_rows(data)
+            if original_hashes is not None and data_hashes is not None and \
+                    np.array_equal(original_hashes[positions], data_hashes):
+                return kind, positions
+        return None, None
+
+
 @docstrings
 class Context(BaseContext):
     """Contains all the data + properties the user has passed to a check/suite, and validates it seamlessly.
@@ -164,6 +274,9 @@ class Context(BaseContext):
     model: Optional[BasicModel] , default: None
         A scikit-learn-compatible fitted estimator instance
     {additional_context_params:indent}
+    inference_batch_size: Optional[int] , default: None
+        Number of rows passed to the model in each inference call when caching its predictions over the datasets.
+        If None, each dataset is passed to the model at once.
     """
 
     def __init__(
@@ -180,6 +293,7 @@ class Context(BaseContext):
             y_proba_train: t.Optional[np.ndarray] = None,
             y_proba_test: t.Optional[np.ndarray] = None,
             model_classes: t.Optional[t.List] = None,
+            inference_batch_size: t.Optional[int] = None,
     ):
         # Validations
         if train is None and test is None and model is None:
@@ -259,12 +373,27 @@ class Context(BaseContext):
         self._train = train
         self._test = test
         self._model = model
+        self._cached_model = None
+        self._inference_batch_size = inference_batch_size
         self._feature_importance_force_permutation = feature_importance_force_permutation
         self._feature_importance = feature_importance
         self._feature_importance_timeout = feature_importance_timeout
         self._importance_type = None
         self._validated_model = False
         self._with_display = with_display
+        # Guards the lazily calculated properties, as checks may use the context concurrently
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        """Return the context state without the lock, which can't be pickled."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the context state and create a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     # Properties
     # Validations note: We know train & test fit each other so all validations can be run only on train
@@ -274,12 +403,30 @@ class Context(BaseContext):
         """Return & validate model if model exists, otherwise raise error."""
         if self._model is None:
             raise DeepchecksNotSupportedError('Check is irrelevant for Datasets without model')
-        if not self._validated_model:
-            if self._train:
-                validate_model(self._train, self._model)
-            self._validated_model = True
+        with self._lock:
+            if not self._validated_model:
+                # A reference profile doesn't hold the data of its dataset, so the model is validated on the test
+                dataset = self._test if self._train and self._train.is_reference_profile else self._train
+                if dataset:
+                    validate_model(dataset, self._model)
+                self._validated_model = True
         return self._model
 
+    @property
+    def cached_model(self) -> BasicModel:
+        """Return & validate the model wrapped with a cache of its predictions over the train and test datasets.
+
+        Should be used for inference over the datasets (or samples of them), while the original model should be used
+        when the model itself is inspected or when it predicts on modified data.
+        """
+        model = self.model
+        if isinstance(model, _DummyModel):
+            return model
+        with self._lock:
+            if self._cached_model is None:
+                self._cached_model = _CachedModel(model, self._train, self._test, self._inference_batch_size)
+        return self._cached_model
+
     @property
     def model_classes(self) -> t.List:
         """Return ordered list of possible label classes for classification tasks or None for regression."""
@@ -311,19 +458,20 @@ class Context(BaseContext):
     @property
     def feature_importance(self) -> t.Optional[pd.Series]:
         """Return feature importance, or None if not possible."""
-        if not self._calculated_importance:
-            if self._model and (self._train or self._test):
-                permutation_kwargs = {'timeout': self._feature_importance_timeout}
-                dataset = self.test if self.have_test() else self.train
-                importance, importance_type = calculate_feature_importance_or_none(
-                    self._model, dataset, self.model_classes, self._observed_classes, self.task_type,
-                    self._feature_importance_force_permutation, permutation_kwargs
-                )
-                self._feature_importance = importance
-                self._importance_type = importance_type
-            else:
-                self._feature_importance = None
-            self._calculated_importance = True
+        with self._lock:
+            if not self._calculated_importance:
+                if self._model and (self._train or self._test):
+                    permutation_kwargs = {'timeout': self._feature_importance_timeout}
+                    dataset = self.test if self.have_test() else self.train
+                    importance, importance_type = calculate_feature_importance_or_none(
+                        self._model, dataset, self.model_classes, self._observed_classes, self.task_type,
+                        self._feature_importance_force_permutation, permutation_kwargs
+                    )
+                    self._feature_importance = importance
+                    self._importance_type = importance_type
+                else:
+                    self._feature_importance = None
+                self._calculated_importance = True
 
         return self._feature_importance
 
@@ -374,7 +522,8 @@ class Context(BaseContext):
             A list of initialized & validated scorers.
         """
         scorers = scorers or get_default_scorers(self.task_type, use_avg_defaults)
-        return init_validate_scorers(scorers, self.model, self.train, self.model_classes, self.observed_classes)
+        return init_validate_scorers(scorers, self.cached_model, self.train, self.model_classes,
+                                     self.observed_classes)
 
     def get_single_scorer(self,
                           scorer: t.Mapping[str, t.Union[str, t.Callable]] = None,
@@ -398,5 +547,5 @@ class Context(BaseContext):
         # The single scorer is the first one in the dict
         scorer_name = next(iter(scorer))
         single_scorer_dict = {scorer_name: scorer[scorer_name]}
-        return init_validate_scorers(single_scorer_dict, self.model, self.train, self.model_classes,
+        return init_validate_scorers(single_scorer_dict, self.cached_model, self.train, self.model_classes,
                                      self.observed_classes)[0]
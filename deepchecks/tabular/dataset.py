@@ -10,6 +10,8 @@
 #
 """The dataset module containing the tabular Dataset class and its functions."""
 # pylint: disable=inconsistent-quotes,protected-access
+import copy
+import html
 import typing as t
 import warnings
 from collections import Counter
@@ -105,6 +107,8 @@ class Dataset:
     _max_categorical_ratio: float
     _max_categories: int
     _label_type: t.Optional[TaskType]
+    _samples_cache: t.Dict[t.Tuple, np.ndarray]
+    _samples_cache_axes: t.Optional[t.Tuple[pd.Index, pd.Index]]
 
     def __init__(
             self,
@@ -297,6 +301,8 @@ class Dataset:
 
         unassigned_cols = [col for col in self._features if col not in self._cat_features]
         self._numerical_features = infer_numerical_features(self._data[unassigned_cols])
+        self._samples_cache = {}
+        self._samples_cache_axes = None
 
     @classmethod
     def from_numpy(
@@ -411,6 +417,16 @@ class Dataset:
         """Return the data of dataset."""
         return self._data
 
+    @property
+    def is_streaming(self) -> bool:
+        """Return True if the data of the dataset is read in chunks instead of being held in memory."""
+        return False
+
+    @property
+    def is_reference_profile(self) -> bool:
+        """Return True if the dataset is a profile holding statistics of a dataset instead of its data."""
+        return False
+
     def copy(self: TDataset, new_data: pd.DataFrame) -> TDataset:
         """Create a copy of this Dataset with new data.
 
@@ -444,6 +460,9 @@ class Dataset:
                random_state: t.Optional[int] = None) -> TDataset:
         """Create a copy of the dataset object, with the internal dataframe being a sample of the original dataframe.
 
+        The rows drawn with a given random_state are cached, so following calls with the same arguments don't draw
+        them again. Each call returns a new dataset with the current values of these rows.
+
         Parameters
         ----------
         n_samples : t.Optional[int]
@@ -462,14 +481,54 @@ class Dataset:
             return self
 
         n_samples = min(n_samples, len(self.data))
-        return self.copy(self.data.sample(n_samples, replace=replace, random_state=random_state))
+        # Samples with a fixed random state are deterministic, so the positions of their rows are cached
+        cache_key = (n_samples, replace, random_state)
+        samples_cache = self._get_samples_cache()
+        if random_state is not None and cache_key in samples_cache:
+            positions = samples_cache[cache_key]
+        else:
+            # Draws the same rows as sampling the data itself, which depends only on the number of rows
+            positions = pd.RangeIndex(len(self.data)).to_series().sample(n_samples, replace=replace,
+                                                                         random_state=random_state).to_numpy()
+            if random_state is not None:
+                samples_cache[cache_key] = positions
+
+        sampled_data = self.data.iloc[positions]
+        # Sampling with replacement may duplicate rows, for which the dataset constructor resets the index
+        return self._view(sampled_data) if sampled_data.index.is_unique else self.copy(sampled_data)
+
+    def _get_samples_cache(self) -> t.Dict[t.Tuple, np.ndarray]:
+        """Return the cache of sampled rows positions, which is reset if the rows or columns of the data changed."""
+        data_axes = (self.data.index, self.data.columns)
+        if self._samples_cache_axes is None or any(a is not b for a, b in zip(self._samples_cache_axes, data_axes)):
+            self._samples_cache = {}
+            self._samples_cache_axes = data_axes
+        return self._samples_cache
+
+    def _view(self: TDataset, new_data: pd.DataFrame) -> TDataset:
+        """Create a dataset over a subset of the rows of this dataset without copying the data again.
+
+        The dataset constructor is not called, so the metadata of this dataset (features, inferred categorical
+        features, etc.) is reused as is. new_data must contain all the columns of this dataset, and have a unique index.
+        """
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view._data = new_data
+        view._features = list(self._features)
+        view._cat_features = list(self._cat_features)
+        view._numerical_features = list(self._numerical_features)
+        view._samples_cache = {}
+        view._samples_cache_axes = None
+        if self._set_datetime_from_dataframe_index and getattr(self, '_datetime_column', None) is not None:
+            view._datetime_column = self._datetime_column.loc[new_data.index]
+        return view
 
     def drop_na_labels(self) -> TDataset:
         """Create a copy of the dataset object without samples with missing labels."""
         if not self.has_label():
             return self
 
-        return self.copy(self.data[self.label_col.notna()])
+        return self._view(self.data[self.label_col.notna()])
 
     @property
     def n_samples(self) -> int:
@@ -894,6 +953,9 @@ class Dataset:
             raise DeepchecksValueError(
                 f'non-empty instance of Dataset or DataFrame was expected, instead got {type(obj).__name__}'
             )
+        if obj.is_streaming or obj.is_reference_profile:
+            # Streaming datasets and reference profiles don't hold their data, so only the dataset object is copied
+            return copy.copy(obj)
         return obj.copy(obj.data)
 
     @classmethod
@@ -1162,6 +1224,13 @@ class Dataset:
     def _ipython_display_(self):
         display_html(HTML(self.__repr__(fmt='html')))
 
+    def _metadata_html(self, title: str, max_cols: int = 8) -> str:
+        """Represent the columns of the dataset in html, for the datasets which don't hold their data in memory."""
+        features_info = self._dataset_description().to_html(notebook=True, max_rows=50, max_cols=max_cols,
+                                                            col_space=15)
+        return ''.join([f'<h4><b>{html.escape(title)}</b></h4>', '<h4><b>Dataset Description</b></h4>',
+                        features_info])
+
     def __len__(self) -> int:
         """Return number of samples in the member dataframe.
 
@@ -12,7 +12,7 @@
 
 from .scorers import (DEFAULT_BINARY_SCORERS, DEFAULT_MULTICLASS_SCORERS, DEFAULT_REGRESSION_SCORERS,
                       DEFAULT_SCORERS_DICT, MULTICLASS_SCORERS_NON_AVERAGE, DeepcheckScorer, TaskType,
-                      get_default_scorers, init_validate_scorers)
+                      get_default_scorers, init_validate_scorers, score_dataset, score_predictions)
 
 __all__ = [
     'TaskType',
@@ -23,5 +23,7 @@ __all__ = [
     'MULTICLASS_SCORERS_NON_AVERAGE',
     'DeepcheckScorer',
     'init_validate_scorers',
-    'get_default_scorers'
+    'get_default_scorers',
+    'score_predictions',
+    'score_dataset'
 ]
@@ -20,8 +20,9 @@ import pandas as pd
 from packaging import version
 from sklearn import __version__ as scikit_version
 from sklearn.base import ClassifierMixin
-from sklearn.metrics import get_scorer, log_loss, make_scorer, mean_absolute_error, mean_squared_error
-from sklearn.metrics._scorer import _BaseScorer, _ProbaScorer
+from sklearn.metrics import (accuracy_score, get_scorer, log_loss, make_scorer, mean_absolute_error,
+                             mean_squared_error)
+from sklearn.metrics._scorer import _BaseScorer, _PredictScorer, _ProbaScorer
 from sklearn.preprocessing import OneHotEncoder
 
 try:
@@ -54,6 +55,8 @@ __all__ = [
     'DeepcheckScorer',
     'init_validate_scorers',
     'get_default_scorers',
+    'score_predictions',
+    'score_dataset',
     'regression_scorers_lower_is_better_dict',
     'regression_scorers_higher_is_better_dict',
     'binary_scorers_dict',
@@ -440,6 +443,204 @@ def init_validate_scorers(scorers: t.Union[t.Mapping[str, t.Union[str, t.Callabl
     return scorers
 
 
+def score_predictions(scorers: t.Sequence[DeepcheckScorer], y_true: t.Union[pd.Series, np.ndarray],
+                      y_pred: np.ndarray, y_proba: t.Optional[np.ndarray] = None) -> t.List[t.Any]:
+    """Calculate the scores of all the scorers on precomputed predictions.
+
+    The labels and predictions are transformed to the format of the scorers once, and the per-class confusion counts
+    are calculated once and shared by all the accuracy, precision, recall, f1 and jaccard scorers. Other scorers are
+    run on the precomputed predictions, so no scorer calls the model.
+
+    Parameters
+    ----------
+    scorers : Sequence[DeepcheckScorer]
+        The scorers to calculate.
+    y_true : Union[pd.Series, np.ndarray]
+        The labels. Samples with missing labels are ignored.
+    y_pred : np.ndarray
+        The model predictions.
+    y_proba : Optional[np.ndarray] , default: None
+        The model predicted probabilities, required by scorers which use probabilities.
+
+    Returns
+    -------
+    List[Any]
+        The score of each scorer, in the same format as returned by calling the scorer with the model.
+    """
+    y_true = pd.Series(np.asarray(y_true, dtype='object') if not isinstance(y_true, pd.Series) else y_true)
+    not_null = y_true.notna().to_numpy()
+    y_pred = np.asarray(y_pred)[not_null]
+    y_proba = None if y_proba is None else np.asarray(y_proba)[not_null]
+    predictions_scorer = _PredictionsScorer(y_true[not_null].reset_index(drop=True), y_pred, y_proba)
+    return [predictions_scorer.score(scorer) for scorer in scorers]
+
+
+def score_dataset(scorers: t.Sequence[DeepcheckScorer], model: BasicModel,
+                  dataset: 'tabular.Dataset') -> t.List[t.Any]:
+    """Calculate the scores of all the scorers on the dataset, calling the model predict (and predict_proba) once.
+
+    Parameters
+    ----------
+    scorers : Sequence[DeepcheckScorer]
+        The scorers to calculate.
+    model : BasicModel
+        The model to score.
+    dataset : Dataset
+        The dataset to score the model on. Samples with missing labels are ignored.
+
+    Returns
+    -------
+    List[Any]
+        The score of each scorer, the same as calling each scorer with the model and the dataset.
+    """
+    dataset = DeepcheckScorer.filter_nulls(dataset)
+    features = dataset.features_columns
+    needs_proba = any('needs' in scorer.scorer._factory_args()  # pylint: disable=protected-access
+                      for scorer in scorers if isinstance(scorer.scorer, _BaseScorer))
+    y_proba = model.predict_proba(features) if needs_proba and hasattr(model, 'predict_proba') else None
+    return score_predictions(scorers, dataset.label_col, model.predict(features), y_proba)
+
+
+class _PrecomputedPredictions:
+    """Model which returns precomputed predictions, for running scorers without calling the model again."""
+
+    def __init__(self, y_pred: np.ndarray):
+        self.y_pred = y_pred
+
+    def predict(self, data: pd.DataFrame) -> np.ndarray:  # pylint: disable=unused-argument
+        return self.y_pred
+
+
+class _PrecomputedProbabilities(_PrecomputedPredictions):
+    """Model which returns precomputed predictions and predicted probabilities."""
+
+    def __init__(self, y_pred: np.ndarray, y_proba: np.ndarray):
+        super().__init__(y_pred)
+        self.y_proba = y_proba
+
+    def predict_proba(self, data: pd.DataFrame) -> np.ndarray:  # pylint: disable=unused-argument
+        return self.y_proba
+
+
+class _ConfusionCounts(t.NamedTuple):
+    true_positives: np.ndarray
+    predicted: np.ndarray
+    actual: np.ndarray
+    accuracy: float
+
+
+_CONFUSION_METRICS = {precision_score: 'precision', recall_score: 'recall', f1_score: 'f1', jaccard_score: 'jaccard'}
+
+
+class _PredictionsScorer:
+    """Score precomputed predictions with multiple scorers, sharing the confusion counts between them."""
+
+    def __init__(self, y_true: pd.Series, y_pred: np.ndarray, y_proba: t.Optional[np.ndarray]):
+        self.y_true = y_true
+        self.y_pred = y_pred
+        self.model = _PrecomputedPredictions(y_pred) if y_proba is None else \
+            _PrecomputedProbabilities(y_pred, y_proba)
+        self.data = pd.DataFrame(index=y_true.index)
+        self._confusion_counts = {}
+
+    def score(self, scorer: DeepcheckScorer):
+        score = self._score_from_confusion_counts(scorer)
+        if score is None:
+            score = scorer.run_on_data_and_label(self.model, self.data, self.y_true)
+        return score
+
+    def _get_confusion_counts(self, model_classes: t.List) -> t.Optional[_ConfusionCounts]:
+        """Return the per-class confusion counts in the format the scorers use, or None if they can't be counted."""
+        key = tuple(model_classes)
+        if key not in self._confusion_counts:
+            self._confusion_counts[key] = self._count_confusion(model_classes)
+        return self._confusion_counts[key]
+
+    def _count_confusion(self, model_classes: t.List) -> t.Optional[_ConfusionCounts]:
+        y_pred = np.squeeze(self.y_pred) if self.y_pred.ndim > 1 else self.y_pred
+        if len(model_classes) == 2:
+            # Binary scorers are calculated on the labels converted to 0 and 1
+            y_true = self.y_true.map({model_classes[0]: 0, model_classes[1]: 1})
+            if y_pred.ndim != 1 or y_true.isna().any():
+                return None
+            y_true = y_true.to_numpy(dtype=int)
+            y_pred = (y_pred != model_classes[0]).astype(int)
+            y_true, y_pred = np.stack([1 - y_true, y_true], axis=1), np.stack([1 - y_pred, y_pred], axis=1)
+        else:
+            try:
+                y_true = _transform_to_multi_label_format(np.array(self.y_true), model_classes)
+                y_pred = _transform_to_multi_label_format(y_pred, model_classes)
+            except errors.DeepchecksValueError:
+                return None
+        return _ConfusionCounts(true_positives=(y_true * y_pred).sum(axis=0), predicted=y_pred.sum(axis=0),
+                                actual=y_true.sum(axis=0), accuracy=np.all(y_true == y_pred, axis=1).mean())
+
+    def _score_from_confusion_counts(self, scorer: DeepcheckScorer):
+        """Calculate the score from the confusion counts, or return None if the scorer isn't based on them."""
+        # pylint: disable=protected-access
+        sklearn_scorer = scorer.scorer
+        if scorer.model_classes is None or type(sklearn_scorer) is not _PredictScorer:
+            return None
+        score_func, kwargs = sklearn_scorer._score_func, sklearn_scorer._kwargs
+        if score_func is accuracy_score and not kwargs:
+            metric = 'accuracy'
+        elif score_func in _CONFUSION_METRICS and set(kwargs) <= {'average', 'zero_division'} and \
+                kwargs.get('zero_division') == 0:
+            metric = _CONFUSION_METRICS[score_func]
+        else:
+            return None
+        is_binary = len(scorer.model_classes) == 2
+        if is_binary and self.y_true.nunique() > 2:
+            return None
+        counts = self._get_confusion_counts(scorer.model_classes)
+        if counts is None:
+            return None
+        if metric == 'accuracy':
+            return counts.accuracy * sklearn_scorer._sign
+
+        average = kwargs.get('average', 'binary')
+        if average == 'binary':
+            if not is_binary:
+                return None
+            classes = np.asarray([1])
+        elif is_binary:
+            # As in scikit-learn, only the classes which appear in the labels or predictions are scored
+            classes = np.flatnonzero(counts.actual + counts.predicted)
+        else:
+            classes = np.arange(len(scorer.model_classes))
+        true_positives, predicted, actual = \
+            counts.true_positives[classes], counts.predicted[classes], counts.actual[classes]
+        if average == 'micro':
+            true_positives, predicted, actual = true_positives.sum(keepdims=True), predicted.sum(keepdims=True), \
+                actual.sum(keepdims=True)
+
+        if metric == 'precision':
+            numerator, denominator = true_positives, predicted
+        elif metric == 'recall':
+            numerator, denominator = true_positives, actual
+        elif metric == 'f1':
+            numerator, denominator = 2 * true_positives, predicted + actual
+        else:
+            numerator, denominator = true_positives, predicted + actual - true_positives
+        scores = np.divide(numerator, denominator, out=np.zeros(len(classes)), where=denominator > 0)
+        scores = scores * sklearn_scorer._sign
+
+        if average in ['binary', 'micro']:
+            return scores[0]
+        elif average == 'macro':
+            return scores.mean()
+        elif average == 'weighted':
+            return np.average(scores, weights=actual) if actual.sum() > 0 else 0.
+        elif average is not None:
+            return None
+        if is_binary and len(classes) == 1:
+            # A single class in the labels and predictions, which is scored as in DeepcheckScorer
+            seen_class = scorer.model_classes[classes[0]]
+            unseen_class = scorer.model_classes[1 - classes[0]]
+            return {seen_class: scores[0], unseen_class: 0}
+        return scorer.validate_scorer_multilabel_output(scores)
+
+
 def _transform_to_multi_label_format(y: np.ndarray, classes):
     # Some classifiers like catboost might return shape like (n_rows, 1), therefore squeezing the array.
     y = np.squeeze(y) if y.ndim > 1 else y
@@ -0,0 +1,493 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""The reference profile module containing the tabular ReferenceProfile class."""
+# pylint: disable=protected-access
+import datetime
+import json
+import os
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
+from deepchecks.tabular.dataset import Dataset, DatasetReprFmt
+from deepchecks.tabular.utils.task_inference import infer_task_type_by_labels
+from deepchecks.tabular.utils.task_type import TaskType
+from deepchecks.utils.distribution.drift import ColumnDistribution
+from deepchecks.utils.typing import BasicModel, Hashable
+
+__all__ = ['ReferenceProfile']
+
+TReferenceProfile = t.TypeVar('TReferenceProfile', bound='ReferenceProfile')
+
+# Version of the format of the files written by ReferenceProfile.save
+_PROFILE_FORMAT_VERSION = 1
+
+
+class ReferenceProfile(Dataset):
+    """Statistics of a reference (train) dataset, which are used by the drift checks in place of the dataset itself.
+
+    The profile is built once from a sample of the dataset, and can be saved to disk and passed as the train dataset
+    of FeatureDrift, LabelDrift, PredictionDrift and MultivariateDrift, so the train statistics aren't calculated
+    again on each run against a new test dataset. It keeps the sorted values of the numerical features, the value
+    counts of the categorical features and of a classification label, the model predictions on the sampled rows (if
+    a model is given), and a smaller sample of the rows for MultivariateDrift, which trains a model on the rows
+    themselves. Other checks can't run on a profile, as it doesn't hold the data of the dataset.
+
+    The drift checks use all the rows of the profile regardless of their n_samples parameter, so profiles built
+    with the default parameters give the same results as running the checks with their defaults on the dataset.
+
+    Parameters
+    ----------
+    dataset : Union[Dataset, pd.DataFrame]
+        The reference dataset.
+    model : t.Optional[BasicModel] , default: None
+        A fitted model, whose predictions on the sampled rows are kept for PredictionDrift.
+    n_samples : t.Optional[int] , default: 100_000
+        Number of rows sampled from the dataset for the distributions of the features, label and predictions.
+    multivariate_n_samples : t.Optional[int] , default: 10_000
+        Number of rows sampled from the dataset and kept for MultivariateDrift.
+    random_state : int , default: 42
+        Random seed for sampling the dataset.
+    """
+
+    _template: Dataset
+    _column_distributions: t.Dict[Hashable, ColumnDistribution]
+    _label_distribution: t.Optional[ColumnDistribution]
+    _predictions: t.Optional[np.ndarray]
+    _probas: t.Optional[np.ndarray]
+    _n_rows: int
+
+    def __init__(
+            self,
+            dataset: t.Union[Dataset, pd.DataFrame],
+            model: t.Optional[BasicModel] = None,
+            n_samples: t.Optional[int] = 100_000,
+            multivariate_n_samples: t.Optional[int] = 10_000,
+            random_state: int = 42
+    ):
+        # pylint: disable=super-init-not-called
+        dataset = Dataset.cast_to_dataset(dataset)
+        if dataset.is_reference_profile:
+            raise DeepchecksValueError('Can\'t create a ReferenceProfile from another ReferenceProfile')
+        sampled = dataset.sample(n_samples, random_state=random_state)
+        template = dataset.sample(multivariate_n_samples, random_state=random_state)
+        if template.has_label() and template.label_type is None:
+            # The label type can't be inferred later from the labels, so it is inferred from the sampled labels
+            template = template.copy(template.data)
+            template._label_type = infer_task_type_by_labels(sampled.label_col)
+        self._set_template(template)
+
+        self._column_distributions = {}
+        for column in sampled.features:
+            if column in sampled.numerical_features:
+                self._column_distributions[column] = ColumnDistribution(sampled.data[column], 'numerical')
+            elif column in sampled.cat_features:
+                self._column_distributions[column] = ColumnDistribution(sampled.data[column], 'categorical')
+
+        self._label_distribution = None
+        if sampled.has_label():
+            label_column_type = 'numerical' if self.label_type == TaskType.REGRESSION else 'categorical'
+            self._label_distribution = ColumnDistribution(sampled.label_col, label_column_type)
+
+        self._predictions, self._probas = None, None
+        if model is not None:
+            features = sampled.features_columns
+            self._predictions = np.array(model.predict(features)).reshape((-1, 1))
+            if self.label_type != TaskType.REGRESSION and hasattr(model, 'predict_proba'):
+                self._probas = np.array(model.predict_proba(features))
+        self._n_rows = len(sampled)
+
+    def _set_template(self, template: Dataset):
+        """Use the metadata of the given dataset as the metadata of this profile."""
+        self.__dict__.update({k: v for k, v in template.__dict__.items() if k != '_data'})
+        self._template = template
+        self._samples_cache = {}
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Raise an error, as a reference profile doesn't hold the data of its dataset."""
+        raise DeepchecksNotSupportedError(
+            'A ReferenceProfile doesn\'t hold the data of its dataset, and can be used only as the train dataset of '
+            'the drift checks (FeatureDrift, LabelDrift, PredictionDrift and MultivariateDrift)'
+        )
+
+    @property
+    def is_reference_profile(self) -> bool:
+        """Return True, as this is a profile of a reference dataset."""
+        return True
+
+    def copy(self, new_data: pd.DataFrame) -> Dataset:
+        """Create an in-memory Dataset with the metadata of this profile over new data.
+
+        Parameters
+        ----------
+        new_data (DataFrame): new data from which new dataset will be created
+
+        Returns
+        -------
+        Dataset
+            new in-memory dataset instance
+        """
+        dataset = self._template.copy(new_data)
+        dataset.name = self.name
+        return dataset
+
+    def select(
+            self: TReferenceProfile,
+            columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            ignore_columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            keep_label: bool = False
+    ) -> TReferenceProfile:
+        """Filter the profile columns by given params.
+
+        Parameters
+        ----------
+        columns : Union[Hashable, List[Hashable], None]
+            Column names to keep.
+        ignore_columns : Union[Hashable, List[Hashable], None]
+            Column names to drop.
+
+        Returns
+        -------
+        ReferenceProfile
+            horizontally filtered profile
+        """
+        if columns is None and ignore_columns is None:
+            return self
+        template = self._template.select(columns, ignore_columns, keep_label=keep_label)
+        selected = object.__new__(type(self))
+        selected.__dict__.update(self.__dict__)
+        selected._set_template(template)
+        selected.name = self.name
+        selected._column_distributions = {column: distribution
+                                          for column, distribution in self._column_distributions.items()
+                                          if column in template.features}
+        return selected
+
+    def sample(self, n_samples: t.Optional[int] = None, replace: bool = False,
+               random_state: t.Optional[int] = None) -> Dataset:
+        """Raise an error, as a reference profile doesn't hold the rows of its dataset."""
+        raise DeepchecksNotSupportedError('A ReferenceProfile can\'t be sampled, as it doesn\'t hold the data of its '
+                                          'dataset')
+
+    def drop_na_labels(self) -> Dataset:
+        """Raise an error, as a reference profile doesn't hold the rows of its dataset."""
+        raise DeepchecksNotSupportedError('Dropping rows with missing labels is not supported for ReferenceProfile')
+
+    def column_distribution(self, column: Hashable) -> ColumnDistribution:
+        """Return the distribution of the given feature."""
+        if column not in self._column_distributions:
+            raise DeepchecksValueError(f'The profile has no distribution of the column {column}, as it is not a '
+                                       'numerical or a categorical feature')
+        return self._column_distributions[column]
+
+    @property
+    def label_distribution(self) -> ColumnDistribution:
+        """Return the distribution of the label."""
+        if self._label_distribution is None:
+            raise DeepchecksNotSupportedError('Dataset does not contain a label column')
+        return self._label_distribution
+
+    def get_predictions(self, proba: bool = False) -> np.ndarray:
+        """Return the model predictions (or predicted probabilities) on the sampled rows of the dataset.
+
+        Parameters
+        ----------
+        proba : bool , default: False
+            Whether to return the predicted probabilities instead of the predictions.
+
+        Returns
+        -------
+        np.ndarray
+            The predictions as a single column array, or the predicted probabilities with a column per class.
+        """
+        predictions = self._probas if proba else self._predictions
+        if predictions is None:
+            kind = 'predicted probabilities' if proba else 'predictions'
+            raise DeepchecksNotSupportedError(f'The profile doesn\'t contain model {kind}. In order to use them, '
+                                              'pass the model when creating the profile')
+        return predictions
+
+    def observed_labels(self) -> np.ndarray:
+        """Return the labels and the model predictions of the sampled rows of the dataset."""
+        labels = [] if self._label_distribution is None else [self._label_distribution.to_array(ignore_na=False)]
+        if self._predictions is not None:
+            labels.append(self._predictions.reshape(-1))
+        return np.concatenate(labels) if labels else np.asarray([])
+
+    @property
+    def sampled_rows(self) -> Dataset:
+        """Return the sample of the dataset rows kept for MultivariateDrift."""
+        return self._template
+
+    @property
+    def n_samples(self) -> int:
+        """Return the number of rows the distributions in the profile were calculated on.
+
+        Returns
+        -------
+        int
+            Number of rows in the sample of the dataset
+        """
+        return self._n_rows
+
+    @property
+    def columns_info(self) -> t.Dict[Hashable, str]:
+        """Return the role and logical type of each column.
+
+        Returns
+        -------
+        t.Dict[Hashable, str]
+           Directory of a column and its role
+        """
+        return self._template.columns_info
+
+    def is_sampled(self, n_samples: int):
+        """Return False, as the drift checks use all the rows of the profile."""
+        return False
+
+    def save(self, path: t.Union[str, os.PathLike]):
+        """Save the profile to the given path.
+
+        The profile is saved as a numpy .npz file, holding the numeric arrays of the profile and a JSON document with
+        its metadata and non-numeric values, so loading it doesn't execute any code. Non-numeric values (e.g. the
+        categories of the categorical features) can be strings, numbers, booleans, timestamps or missing values.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path of the file to save the profile to.
+        """
+        arrays = {}
+        template = self._template
+        metadata = {
+            'version': _PROFILE_FORMAT_VERSION,
+            'dataset': {
+                'features': _encode_values(template._features),
+                'cat_features': _encode_values(template.cat_features),
+                'label': _encode_value(template._label_name),
+                'index_name': _encode_value(template._index_name),
+                'set_index_from_dataframe_index': template._set_index_from_dataframe_index,
+                'datetime_name': _encode_value(template._datetime_name),
+                'set_datetime_from_dataframe_index': template._set_datetime_from_dataframe_index,
+                'convert_datetime': template._convert_datetime,
+                'max_categorical_ratio': template._max_categorical_ratio,
+                'max_categories': template._max_categories,
+                'label_type': None if template._label_type is None else template._label_type.value,
+                'dataset_name': template.name,
+            },
+            'columns': [_encode_value(column) for column in template.data.columns],
+            'data': [_save_series(column, f'data_{i}', arrays)
+                     for i, (_, column) in enumerate(template.data.items())],
+            'index': _save_series(template.data.index.to_series(), 'index', arrays),
+            'index_name': _encode_value(template.data.index.name),
+            'column_distributions': [_save_column_distribution(distribution, f'distribution_{i}', arrays)
+                                     for i, distribution in enumerate(self._column_distributions.values())],
+            'label_distribution': None if self._label_distribution is None else
+            _save_column_distribution(self._label_distribution, 'label_distribution', arrays),
+            'predictions': _save_array(self._predictions, 'predictions', arrays),
+            'probas': _save_array(self._probas, 'probas', arrays),
+            'n_rows': self._n_rows,
+        }
+        arrays['metadata'] = np.array(json.dumps(metadata))
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, path: t.Union[str, os.PathLike]) -> 'ReferenceProfile':
+        """Load a profile saved by :meth:`save`.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path of the file the profile was saved to.
+
+        Returns
+        -------
+        ReferenceProfile
+            The loaded profile
+        """
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                arrays = dict(arrays)
+            metadata = json.loads(str(arrays['metadata']))
+        except (ValueError, KeyError, OSError) as error:
+            raise DeepchecksValueError(f'Expected a file of a ReferenceProfile saved by ReferenceProfile.save, '
+                                       f'failed to read it: {error}') from error
+        if metadata.get('version') != _PROFILE_FORMAT_VERSION:
+            raise DeepchecksValueError(f'Unsupported ReferenceProfile file version: {metadata.get("version")}')
+
+        data = pd.DataFrame({i: _load_series(column, arrays) for i, column in enumerate(metadata['data'])})
+        data.columns = [_decode_value(column) for column in metadata['columns']]
+        data.index = pd.Index(_load_series(metadata['index'], arrays), name=_decode_value(metadata['index_name']))
+        dataset_kwargs = metadata['dataset']
+        template = Dataset(
+            data,
+            features=_decode_values(dataset_kwargs['features']),
+            cat_features=_decode_values(dataset_kwargs['cat_features']),
+            label=_decode_value(dataset_kwargs['label']),
+            index_name=_decode_value(dataset_kwargs['index_name']),
+            set_index_from_dataframe_index=dataset_kwargs['set_index_from_dataframe_index'],
+            datetime_name=_decode_value(dataset_kwargs['datetime_name']),
+            set_datetime_from_dataframe_index=dataset_kwargs['set_datetime_from_dataframe_index'],
+            convert_datetime=dataset_kwargs['convert_datetime'],
+            max_categorical_ratio=dataset_kwargs['max_categorical_ratio'],
+            max_categories=dataset_kwargs['max_categories'],
+            label_type=dataset_kwargs['label_type'],
+            dataset_name=dataset_kwargs['dataset_name']
+        )
+
+        profile = object.__new__(cls)
+        profile._set_template(template)
+        profile._column_distributions = {}
+        for distribution_metadata in metadata['column_distributions']:
+            distribution = _load_column_distribution(distribution_metadata, arrays)
+            profile._column_distributions[distribution.name] = distribution
+        profile._label_distribution = None if metadata['label_distribution'] is None else \
+            _load_column_distribution(metadata['label_distribution'], arrays)
+        profile._predictions = _load_array(metadata['predictions'], arrays)
+        profile._probas = _load_array(metadata['probas'], arrays)
+        profile._n_rows = metadata['n_rows']
+        return profile
+
+    def __bool__(self) -> bool:
+        """Return True, as a profile always describes a dataset."""
+        return True
+
+    def __repr__(
+            self,
+            max_cols: int = 8,
+            max_rows: int = 10,
+            fmt: DatasetReprFmt = 'string'
+    ) -> str:
+        """Represent the profile by its metadata, as it doesn't hold the data of its dataset."""
+        title = (f'{type(self).__name__}(name={self.name!r}, label={self._label_name!r}, features={self.features}, '
+                 f'n_samples={self.n_samples})')
+        if fmt == 'html':
+            return self._template._metadata_html(title, max_cols)
+        return title
+
+
+def _encode_value(value: t.Any) -> t.Any:
+    """Encode a scalar value as a JSON value, tagging the values which JSON can't represent."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return {'float': repr(float(value))}
+    if value is pd.NaT:
+        return {'nat': None}
+    if value is pd.NA:
+        return {'na': None}
+    if isinstance(value, (pd.Timestamp, datetime.datetime, np.datetime64)):
+        return {'timestamp': pd.Timestamp(value).isoformat()}
+    if isinstance(value, (pd.Timedelta, datetime.timedelta, np.timedelta64)):
+        return {'timedelta': pd.Timedelta(value).value}
+    raise DeepchecksValueError(f'Values of type {type(value).__name__} can\'t be saved in a ReferenceProfile')
+
+
+def _decode_value(value: t.Any) -> t.Any:
+    """Decode a JSON value encoded by _encode_value."""
+    if not isinstance(value, dict):
+        return value
+    (tag, content), = value.items()
+    if tag == 'float':
+        return float(content)
+    if tag == 'nat':
+        return pd.NaT
+    if tag == 'na':
+        return pd.NA
+    if tag == 'timestamp':
+        return pd.Timestamp(content)
+    if tag == 'timedelta':
+        return pd.Timedelta(content)
+    raise DeepchecksValueError(f'Unknown value in a ReferenceProfile file: {value}')
+
+
+def _encode_values(values: t.Iterable) -> t.List:
+    return [_encode_value(value) for value in values]
+
+
+def _decode_values(values: t.List) -> t.List:
+    return [_decode_value(value) for value in values]
+
+
+def _save_array(array: t.Optional[np.ndarray], key: str, arrays: t.Dict[str, np.ndarray]) -> t.Optional[t.Dict]:
+    """Add a numeric array to the saved arrays, or return the encoded values of an array of objects."""
+    if array is None:
+        return None
+    if array.dtype.hasobject:
+        return {'shape': list(array.shape), 'values': _encode_values(array.reshape(-1))}
+    arrays[key] = array
+    return {'key': key}
+
+
+def _load_array(array_metadata: t.Optional[t.Dict], arrays: t.Dict[str, np.ndarray]) -> t.Optional[np.ndarray]:
+    if array_metadata is None:
+        return None
+    if 'key' in array_metadata:
+        return arrays[array_metadata['key']]
+    values = np.empty(len(array_metadata['values']), dtype=object)
+    values[:] = _decode_values(array_metadata['values'])
+    return values.reshape(array_metadata['shape'])
+
+
+def _save_series(series: pd.Series, key: str, arrays: t.Dict[str, np.ndarray]) -> t.Dict:
+    """Add the values of a series to the saved arrays, and return the metadata needed to restore its dtype."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        arrays[key] = series.cat.codes.to_numpy()
+        return {'key': key, 'categories': _encode_values(dtype.categories), 'ordered': bool(dtype.ordered)}
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        arrays[key] = series.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+        return {'key': key, 'tz': str(dtype.tz)}
+    if isinstance(dtype, np.dtype) and not dtype.hasobject:
+        arrays[key] = series.to_numpy()
+        return {'key': key}
+    return {'values': _encode_values(series), 'dtype': str(dtype)}
+
+
+def _load_series(series_metadata: t.Dict, arrays: t.Dict[str, np.ndarray]) -> pd.Series:
+    if 'categories' in series_metadata:
+        return pd.Series(pd.Categorical.from_codes(arrays[series_metadata['key']],
+                                                   _decode_values(series_metadata['categories']),
+                                                   ordered=series_metadata['ordered']))
+    if 'tz' in series_metadata:
+        return pd.Series(arrays[series_metadata['key']]).dt.tz_localize('UTC').dt.tz_convert(series_metadata['tz'])
+    if 'key' in series_metadata:
+        return pd.Series(arrays[series_metadata['key']])
+    values = np.empty(len(series_metadata['values']), dtype=object)
+    values[:] = _decode_values(series_metadata['values'])
+    series = pd.Series(values, dtype=object)
+    return series if series_metadata['dtype'] == 'object' else series.astype(series_metadata['dtype'])
+
+
+def _save_column_distribution(distribution: ColumnDistribution, key: str, arrays: t.Dict[str, np.ndarray]) -> t.Dict:
+    return {
+        'name': _encode_value(distribution.name),
+        'column_type': distribution.column_type,
+        'values': _save_array(distribution.values, f'{key}_values', arrays),
+        'counts': _save_array(distribution.counts, f'{key}_counts', arrays),
+    }
+
+
+def _load_column_distribution(distribution_metadata: t.Dict, arrays: t.Dict[str, np.ndarray]) -> ColumnDistribution:
+    distribution = object.__new__(ColumnDistribution)
+    distribution.name = _decode_value(distribution_metadata['name'])
+    distribution.column_type = distribution_metadata['column_type']
+    distribution.values = _load_array(distribution_metadata['values'], arrays)
+    distribution.counts = _load_array(distribution_metadata['counts'], arrays)
+    return distribution
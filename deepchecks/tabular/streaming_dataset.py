@@ -0,0 +1,340 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""The streaming dataset module containing the tabular StreamingDataset class."""
+# pylint: disable=protected-access
+import os
+import typing as t
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
+from deepchecks.tabular.dataset import Dataset, DatasetReprFmt
+from deepchecks.tabular.utils.task_inference import infer_task_type_by_labels
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['StreamingDataset']
+
+TStreamingDataset = t.TypeVar('TStreamingDataset', bound='StreamingDataset')
+ChunksSource = t.Union[str, os.PathLike, t.Callable[[], t.Iterable[pd.DataFrame]], t.Iterable[pd.DataFrame]]
+
+_PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+class StreamingDataset(Dataset):
+    """Dataset over data which is read in chunks instead of being held in memory.
+
+    The data can be given as a path to a CSV or a Parquet file, an iterable of DataFrame chunks, or a function
+    returning such an iterable. The metadata of the dataset (features, categorical features, label type, etc.) is
+    inferred from the first chunk, so it is recommended to pass it explicitly.
+
+    Data integrity checks which support streaming (PercentOfNulls, MixedNulls, IsSingleValue and DataDuplicates)
+    merge aggregates calculated on each chunk, and so use all the data. Other checks, including the drift checks such
+    as FeatureDrift, run on a uniform sample of n_samples rows of the data (see :meth:`sample`), read into memory in a
+    single pass over the chunks. Their results note that the data was sampled, as for in-memory datasets. Checks which
+    require all the data in memory raise an error.
+
+    Parameters
+    ----------
+    chunks : Union[str, os.PathLike, Callable[[], Iterable[pd.DataFrame]], Iterable[pd.DataFrame]]
+        Path to a CSV or a Parquet file, an iterable of DataFrame chunks or a function returning a new iterable of
+        DataFrame chunks on each call. An iterator can be read only once, so a function should be used instead when
+        the data is used by more than one check.
+    chunksize : int , default: 100_000
+        Number of rows in each chunk read from a file.
+    label : t.Optional[Hashable] , default: None
+        Name of the label column in the data.
+    features : t.Optional[t.Sequence[Hashable]] , default: None
+        List of names for the feature columns in the data.
+    cat_features : t.Optional[t.Sequence[Hashable]] , default: None
+        List of names for the categorical features in the data. If None, inferred from the first chunk.
+    **kwargs
+        Additional arguments of :class:`Dataset` (index_name, datetime_name, label_type, dataset_name, etc.).
+    """
+
+    _chunks_source: ChunksSource
+    _chunksize: int
+    _single_pass_chunks: t.Optional[t.List[t.Iterator[pd.DataFrame]]]
+    _template: Dataset
+    _selections: t.List[t.Tuple]
+    _n_rows: t.Optional[int]
+    _sampled_sizes: t.Set[int]
+
+    def __init__(
+            self,
+            chunks: ChunksSource,
+            chunksize: int = 100_000,
+            label: t.Optional[Hashable] = None,
+            features: t.Optional[t.Sequence[Hashable]] = None,
+            cat_features: t.Optional[t.Sequence[Hashable]] = None,
+            **kwargs
+    ):
+        if isinstance(label, (pd.Series, pd.DataFrame, np.ndarray)):
+            raise DeepchecksValueError('label of a StreamingDataset must be the name of a column in the data')
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise DeepchecksValueError('chunksize must be a positive integer')
+
+        self._chunks_source = chunks
+        self._chunksize = chunksize
+        is_single_pass = not isinstance(chunks, (str, os.PathLike)) and not callable(chunks) and iter(chunks) is chunks
+        # A list holding the iterator until it is read, which is shared by the copies of the dataset
+        self._single_pass_chunks = [chunks] if is_single_pass else None
+
+        chunks_reader = self._read_chunks()
+        first_chunk = next(chunks_reader, None)
+        chunks_reader.close()
+        if first_chunk is None:
+            raise DeepchecksValueError('Can\'t create a StreamingDataset object without any data')
+        if is_single_pass:
+            # The first chunk was already read from the iterator, so it is chained back before the rest of the chunks
+            self._single_pass_chunks.append(chain([first_chunk], chunks))
+
+        template = Dataset(first_chunk, label=label, features=features, cat_features=cat_features, **kwargs)
+        if template.label_type is None and template.has_label():
+            # The label type can't be inferred later from all the labels, so it is inferred from the first chunk
+            template._label_type = infer_task_type_by_labels(template.label_col)
+        self._set_template(template)
+        self._selections = []
+        self._n_rows = None
+        self._sampled_sizes = set()
+
+    def _set_template(self, template: Dataset):
+        """Use the metadata of the given dataset as the metadata of this dataset."""
+        self.__dict__.update({k: v for k, v in template.__dict__.items() if k != '_data'})
+        self._template = template
+        self._samples_cache = {}
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Raise an error, as the data of a streaming dataset is not held in memory."""
+        raise DeepchecksNotSupportedError(
+            'The data of a StreamingDataset is not held in memory. Use iter_chunks() to iterate over its chunks or '
+            'sample() to load a sample of it'
+        )
+
+    @property
+    def is_streaming(self) -> bool:
+        """Return True, as the data of the dataset is read in chunks."""
+        return True
+
+    def _read_chunks(self) -> t.Iterator[pd.DataFrame]:
+        """Iterate over the raw non-empty DataFrame chunks of the source."""
+        source = self._chunks_source
+        if isinstance(source, (str, os.PathLike)):
+            chunks = _read_file_chunks(source, self._chunksize)
+        elif callable(source):
+            chunks = source()
+        elif self._single_pass_chunks is not None:
+            if not self._single_pass_chunks:
+                raise DeepchecksValueError('The iterator of chunks was already consumed. In order to read the data '
+                                           'more than once, pass a function returning a new iterator of chunks instead')
+            chunks = self._single_pass_chunks.pop()
+        else:
+            chunks = source
+
+        for chunk in chunks:
+            if not isinstance(chunk, pd.DataFrame):
+                raise DeepchecksValueError(
+                    f'Expected chunks of type pandas.DataFrame, instead got {type(chunk).__name__}'
+                )
+            if len(chunk) > 0:
+                yield chunk
+
+    def iter_chunks(self) -> t.Iterator[Dataset]:
+        """Iterate over the chunks of the data.
+
+        Chunks having a RangeIndex are re-indexed by the position of their rows in the whole data.
+
+        Returns
+        -------
+        Iterator[Dataset]
+            in-memory datasets over the chunks, sharing the metadata of this dataset.
+        """
+        offset = 0
+        index_from_dataframe = self._set_index_from_dataframe_index or self._set_datetime_from_dataframe_index
+        for raw_chunk in self._read_chunks():
+            chunk = self.copy(raw_chunk)
+            if isinstance(chunk._data.index, pd.RangeIndex) and not index_from_dataframe:
+                chunk._data.index = pd.RangeIndex(offset, offset + len(raw_chunk))
+            offset += len(raw_chunk)
+            for columns, ignore_columns, keep_label in self._selections:
+                chunk = chunk.select(columns, ignore_columns, keep_label=keep_label)
+            yield chunk
+        self._n_rows = offset
+
+    def copy(self, new_data: pd.DataFrame) -> Dataset:
+        """Create an in-memory Dataset with the metadata of this dataset over new data.
+
+        Parameters
+        ----------
+        new_data (DataFrame): new data from which new dataset will be created
+
+        Returns
+        -------
+        Dataset
+            new in-memory dataset instance
+        """
+        dataset = self._template.copy(new_data)
+        dataset.name = self.name
+        return dataset
+
+    def select(
+            self: TStreamingDataset,
+            columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            ignore_columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            keep_label: bool = False
+    ) -> TStreamingDataset:
+        """Filter dataset columns by given params, the filter is applied on each chunk when it is read.
+
+        Parameters
+        ----------
+        columns : Union[Hashable, List[Hashable], None]
+            Column names to keep.
+        ignore_columns : Union[Hashable, List[Hashable], None]
+            Column names to drop.
+
+        Returns
+        -------
+        StreamingDataset
+            horizontally filtered dataset
+        """
+        if columns is None and ignore_columns is None:
+            return self
+        columns = list(columns) if isinstance(columns, list) else columns
+        template = self._template.select(columns, ignore_columns, keep_label=keep_label)
+        selected = object.__new__(type(self))
+        selected.__dict__.update(self.__dict__)
+        selected._set_template(template)
+        selected._selections = self._selections + [(columns, ignore_columns, keep_label)]
+        return selected
+
+    def sample(self, n_samples: t.Optional[int] = None, replace: bool = False,
+               random_state: t.Optional[int] = None) -> Dataset:
+        """Read a uniform sample of the data into an in-memory Dataset, in a single pass over the chunks.
+
+        Each row is given a random key and the rows with the n_samples smallest keys are kept, so the samples of
+        each chunk are merged into a sample of the whole data without holding more than a chunk and the sample in
+        memory. Samples drawn with a given random_state are cached, so following calls with the same arguments
+        don't read the data again. Each call returns a new dataset over its own copy of the sampled rows.
+
+        Parameters
+        ----------
+        n_samples : t.Optional[int]
+            Number of samples to draw. If None, all the data is read into memory, and isn't cached.
+        replace : bool, default: False
+            Whether to sample with replacement, which is not supported for streaming datasets.
+        random_state : t.Optional[int] , default None
+            Random state.
+
+        Returns
+        -------
+        Dataset
+            in-memory dataset over the sampled rows.
+        """
+        if replace:
+            raise DeepchecksNotSupportedError('Sampling with replacement is not supported for StreamingDataset')
+
+        if n_samples is None:
+            return self.copy(pd.concat([chunk._data for chunk in self.iter_chunks()]))
+
+        cache_key = (n_samples, replace, random_state)
+        if random_state is not None and cache_key in self._samples_cache:
+            cached = self._samples_cache[cache_key]
+            return cached._view(cached.data.copy())
+
+        random_generator = np.random.RandomState(random_state)
+        sampled_data, sampled_keys = None, np.empty(0)
+        for chunk in self.iter_chunks():
+            chunk_keys = random_generator.random_sample(len(chunk._data))
+            if sampled_data is None:
+                sampled_data, sampled_keys = chunk._data, chunk_keys
+            else:
+                sampled_data = pd.concat([sampled_data, chunk._data])
+                sampled_keys = np.concatenate([sampled_keys, chunk_keys])
+            if len(sampled_keys) > n_samples:
+                positions = np.argpartition(sampled_keys, n_samples - 1)[:n_samples]
+                sampled_data, sampled_keys = sampled_data.iloc[positions], sampled_keys[positions]
+
+        sampled = self.copy(sampled_data.iloc[np.argsort(sampled_keys, kind='stable')])
+        if self._n_rows > n_samples:
+            self._sampled_sizes.add(n_samples)
+        if random_state is not None:
+            self._samples_cache[cache_key] = sampled
+            return sampled._view(sampled.data.copy())
+        return sampled
+
+    def drop_na_labels(self) -> Dataset:
+        """Raise an error, as the rows of a streaming dataset can't be filtered in memory."""
+        raise DeepchecksNotSupportedError('Dropping rows with missing labels is not supported for StreamingDataset')
+
+    @property
+    def n_samples(self) -> int:
+        """Return number of samples in the data, which is counted by reading it once.
+
+        Returns
+        -------
+        int
+            Number of samples in the data
+        """
+        if self._n_rows is None:
+            self._n_rows = sum(len(chunk) for chunk in self._read_chunks())
+        return self._n_rows
+
+    @property
+    def columns_info(self) -> t.Dict[Hashable, str]:
+        """Return the role and logical type of each column.
+
+        Returns
+        -------
+        t.Dict[Hashable, str]
+           Directory of a column and its role
+        """
+        return self._template.columns_info
+
+    def is_sampled(self, n_samples: int):
+        """Return True if a sample of n_samples rows, smaller than the data, was drawn from the dataset.
+
+        Checks which support streaming aggregate all the chunks instead of sampling the data, so their results don't
+        get a sampling note even if the data is larger than their n_samples.
+        """
+        return n_samples in self._sampled_sizes
+
+    def __bool__(self) -> bool:
+        """Return True, as a streaming dataset always contains data (and counting it requires reading it)."""
+        return True
+
+    def __repr__(
+            self,
+            max_cols: int = 8,
+            max_rows: int = 10,
+            fmt: DatasetReprFmt = 'string'
+    ) -> str:
+        """Represent the dataset by its metadata, as its data is not held in memory."""
+        title = f'{type(self).__name__}(name={self.name!r}, label={self.label_name!r}, features={self.features})'
+        if fmt == 'html':
+            return self._template._metadata_html(title, max_cols)
+        return title
+
+
+def _read_file_chunks(path: t.Union[str, os.PathLike], chunksize: int) -> t.Iterator[pd.DataFrame]:
+    """Read a CSV or a Parquet file in chunks."""
+    if str(path).lower().endswith(_PARQUET_SUFFIXES):
+        try:
+            import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError('Reading Parquet files in chunks requires the pyarrow python package. '
+                              'To get it, run "pip install pyarrow".') from error
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=chunksize) as reader:
+            yield from reader
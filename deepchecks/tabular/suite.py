@@ -10,24 +10,38 @@
 #
 """Module for base tabular abstractions."""
 # pylint: disable=broad-except
+import copy
+import multiprocessing
+import pickle
 import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from deepchecks.core import DatasetKind
-from deepchecks.core.check_result import CheckFailure
+from deepchecks.core.check_result import BaseCheckResult, CheckFailure, CheckResult
+from deepchecks.core.checks import BaseCheck
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.tabular._shared_docs import docstrings
 from deepchecks.tabular.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
 from deepchecks.tabular.context import Context
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.utils.ipython import create_progress_bar
+from deepchecks.utils.parallel import effective_n_jobs
 from deepchecks.utils.typing import BasicModel
 
 __all__ = ['Suite']
 
+_EXECUTORS = ('thread', 'process')
+
+# State of a process pool worker, set once when the worker starts
+_process_worker_state = {}
+
 
 class Suite(BaseSuite):
     """Tabular suite to run checks of types: TrainTestCheck, SingleDatasetCheck, ModelOnlyCheck."""
@@ -52,7 +66,9 @@ class Suite(BaseSuite):
         y_proba_train: Optional[np.ndarray] = None,
         y_proba_test: Optional[np.ndarray] = None,
         run_single_dataset: Optional[str] = None,
-        model_classes: Optional[List] = None
+        model_classes: Optional[List] = None,
+        n_jobs: int = 1,
+        executor: str = 'thread'
     ) -> SuiteResult:
         """Run all checks.
 
@@ -67,12 +83,26 @@ class Suite(BaseSuite):
         run_single_dataset: Optional[str], default None
             'Train', 'Test' , or None to run on both train and test.
         {additional_context_params:2*indent}
+        n_jobs: int , default: 1
+            Number of checks to run concurrently. 1 runs the checks sequentially, negative values are interpreted as
+            in joblib, so -1 uses all available CPUs and -2 all of them but one.
+        executor: str , default: 'thread'
+            Type of pool used to run the checks when n_jobs is not 1, either 'thread' or 'process'. When using
+            'process', each worker works on its own copy of the context, so values calculated lazily by the context
+            (e.g. feature importance) are calculated per worker. The workers are started fresh rather than forked
+            from the running process, so the checks (without their conditions, which are evaluated in the calling
+            process), the context and the check results must be picklable. If the checks or the context can't be
+            pickled, the checks run in threads instead.
 
         Returns
         -------
         SuiteResult
             All results by all initialized checks
         """
+        max_workers = effective_n_jobs(n_jobs)
+        if executor not in _EXECUTORS:
+            raise DeepchecksValueError(f'executor must be one of {list(_EXECUTORS)}, but got: {executor}')
+
         context = Context(
             train_dataset,
             test_dataset,
@@ -88,6 +118,10 @@ class Suite(BaseSuite):
             model_classes=model_classes
         )
 
+        has_datasets = (train_dataset is not None, test_dataset is not None)
+        run_check_kwargs = dict(context=context, has_datasets=has_datasets, has_model=model is not None,
+                                run_single_dataset=run_single_dataset)
+
         progress_bar = create_progress_bar(
             iterable=list(self.checks.values()),
             name=self.name,
@@ -96,58 +130,153 @@ class Suite(BaseSuite):
 
         # Run all checks
         results = []
-        for check in progress_bar:
-            start = time.time()
-
-            try:
+        if max_workers == 1:
+            for check in progress_bar:
                 progress_bar.set_postfix({'Check': check.name()}, refresh=False)
-                if isinstance(check, TrainTestCheck):
-                    if train_dataset is not None and test_dataset is not None:
-                        check_result = check.run_logic(context)
-                        context.finalize_check_result(check_result, check)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if not supplied with both train and test datasets'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, SingleDatasetCheck):
-                    if train_dataset is not None and (run_single_dataset in [DatasetKind.TRAIN.value, None]):
-                        # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
-                        # wrap it in try/except
-                        try:
-                            check_result = check.run_logic(context, dataset_kind=DatasetKind.TRAIN)
-                            context.finalize_check_result(check_result, check, DatasetKind.TRAIN)
-                            # In case of single dataset not need to edit the header
-                            if test_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Train Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Train Dataset')
-                        results.append(check_result)
-                    if test_dataset is not None and (run_single_dataset in [DatasetKind.TEST.value, None]):
-                        try:
-                            check_result = check.run_logic(context, dataset_kind=DatasetKind.TEST)
-                            context.finalize_check_result(check_result, check, DatasetKind.TEST)
-                            # In case of single dataset not need to edit the header
-                            if train_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Test Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Test Dataset')
-                        results.append(check_result)
-                    if train_dataset is None and test_dataset is None:
-                        msg = 'Check is irrelevant if dataset is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, ModelOnlyCheck):
-                    if model is not None:
-                        check_result = check.run_logic(context)
-                        context.finalize_check_result(check_result, check)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if model is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                else:
-                    raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
-            except Exception as exp:
-                results.append(CheckFailure(check, exp))
-
-            results[-1].run_time = int(round(time.time() - start, 0))
+                results.extend(_run_check(check, **run_check_kwargs))
+        else:
+            checks = list(self.checks.values())
+            worker_state = _pickle_process_worker_state(checks, run_check_kwargs) if executor == 'process' else None
+            if executor == 'thread' or worker_state is None:
+                pool = ThreadPoolExecutor(max_workers=max_workers)
+                futures = [pool.submit(_run_check, check, **run_check_kwargs) for check in checks]
+            else:
+                # Forking the running process would copy the locks held by its other threads (e.g. the logging lock)
+                # into the workers, where nothing releases them, so the workers are started fresh
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                pool = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=multiprocessing.get_context(start_method),
+                                           initializer=_init_process_worker, initargs=(worker_state,))
+                futures = [pool.submit(_run_check_in_process, index) for index in range(len(checks))]
+            with pool:
+                # Collect results in the order of the checks, regardless of the order they finish in
+                for check, future in zip(progress_bar, futures):
+                    progress_bar.set_postfix({'Check': check.name()}, refresh=False)
+                    check_results = future.result()
+                    if worker_state is not None:
+                        check_results = [_process_conditions_of_worker_result(check, check_result)
+                                         for check_result in check_results]
+                    for check_result in check_results:
+                        check_result.check = check
+                    results.extend(check_results)
 
         return SuiteResult(self.name, results)
+
+
+def _run_check(
+    check: Union[TrainTestCheck, SingleDatasetCheck, ModelOnlyCheck],
+    context: Context,
+    has_datasets: Tuple[bool, bool],
+    has_model: bool,
+    run_single_dataset: Optional[str] = None
+) -> List[BaseCheckResult]:
+    """Run a single check of a suite and return its results, failures are returned as CheckFailure.
+
+    Defined on module level in order to be picklable when the checks run in a process pool.
+    """
+    has_train, has_test = has_datasets
+    results = []
+    start = time.time()
+
+    try:
+        if isinstance(check, TrainTestCheck):
+            if has_train and has_test:
+                check_result = check.run_logic(context)
+                context.finalize_check_result(check_result, check)
+                results.append(check_result)
+            else:
+                msg = 'Check is irrelevant if not supplied with both train and test datasets'
+                results.append(Suite._get_unsupported_failure(check, msg))
+        elif isinstance(check, SingleDatasetCheck):
+            if has_train and (run_single_dataset in [DatasetKind.TRAIN.value, None]):
+                # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
+                # wrap it in try/except
+                try:
+                    check_result = check.run_logic(context, dataset_kind=DatasetKind.TRAIN)
+                    context.finalize_check_result(check_result, check, DatasetKind.TRAIN)
+                    # In case of single dataset not need to edit the header
+                    if has_test:
+                        check_result.header = f'{check_result.get_header()} - Train Dataset'
+                except Exception as exp:
+                    check_result = CheckFailure(check, exp, ' - Train Dataset')
+                results.append(check_result)
+            if has_test and (run_single_dataset in [DatasetKind.TEST.value, None]):
+                try:
+                    check_result = check.run_logic(context, dataset_kind=DatasetKind.TEST)
+                    context.finalize_check_result(check_result, check, DatasetKind.TEST)
+                    # In case of single dataset not need to edit the header
+                    if has_train:
+                        check_result.header = f'{check_result.get_header()} - Test Dataset'
+                except Exception as exp:
+                    check_result = CheckFailure(check, exp, ' - Test Dataset')
+                results.append(check_result)
+            if not has_train and not has_test:
+                msg = 'Check is irrelevant if dataset is not supplied'
+                results.append(Suite._get_unsupported_failure(check, msg))
+        elif isinstance(check, ModelOnlyCheck):
+            if has_model:
+                check_result = check.run_logic(context)
+                context.finalize_check_result(check_result, check)
+                results.append(check_result)
+            else:
+                msg = 'Check is irrelevant if model is not supplied'
+                results.append(Suite._get_unsupported_failure(check, msg))
+        else:
+            raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
+    except Exception as exp:
+        results.append(CheckFailure(check, exp))
+
+    results[-1].run_time = int(round(time.time() - start, 0))
+    return results
+
+
+def _pickle_process_worker_state(checks: List[BaseCheck], run_check_kwargs: dict) -> Optional[bytes]:
+    """Pickle the checks and the arguments to run them with for the process pool workers.
+
+    Conditions are often defined as local functions which can't be pickled, so the checks are pickled without them
+    and their conditions are evaluated in the calling process. Returns None, and warns, if pickling fails.
+    """
+    checks_without_conditions = []
+    for check in checks:
+        check_copy = copy.copy(check)
+        check_copy._conditions = OrderedDict()  # pylint: disable=protected-access
+        checks_without_conditions.append(check_copy)
+    try:
+        return pickle.dumps((checks_without_conditions, run_check_kwargs))
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        warnings.warn(f'Running checks in processes requires the checks and the data to be picklable, running the '
+                      f'checks in threads instead. Failed to pickle them: {error}')
+        return None
+
+
+def _init_process_worker(worker_state: bytes):
+    checks, run_check_kwargs = pickle.loads(worker_state)
+    _process_worker_state['checks'] = checks
+    _process_worker_state['run_check_kwargs'] = run_check_kwargs
+
+
+def _process_conditions_of_worker_result(check: BaseCheck, check_result: BaseCheckResult) -> BaseCheckResult:
+    """Evaluate the conditions of the check on a result calculated by a process pool worker."""
+    if not isinstance(check_result, CheckResult):
+        return check_result
+    check_result.check = check
+    try:
+        check_result.process_conditions()
+    except Exception as exp:
+        failure = CheckFailure(check, exp)
+        failure.header = check_result.get_header()
+        failure.run_time = check_result.run_time
+        return failure
+    return check_result
+
+
+def _run_check_in_process(check_index: int) -> List[BaseCheckResult]:
+    """Run a check in a process pool worker and return its results without the reference to the check.
+
+    The check is attached back to the results in the calling process, with its conditions.
+    """
+    check = _process_worker_state['checks'][check_index]
+    results = _run_check(check, **_process_worker_state['run_check_kwargs'])
+    for result in results:
+        result.check = None
+    return results
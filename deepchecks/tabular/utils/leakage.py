@@ -0,0 +1,68 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Vectorized membership and ordering utilities for the train-test leakage checks."""
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+__all__ = ['leaked_mask', 'leaked_values', 'count_earlier_than']
+
+
+def _as_series(values: t.Union[pd.Series, pd.Index, np.ndarray]) -> pd.Series:
+    return values if isinstance(values, pd.Series) else pd.Series(values, copy=False)
+
+
+def _datetime_to_int64(values: pd.Series) -> np.ndarray:
+    """Return the datetimes as int64 nanoseconds since epoch, which are hashed faster than timestamp objects.
+
+    Timezone-aware datetimes are converted to UTC first, so equal instants in different timezones are equal, as
+    they are when comparing the timestamps themselves. Missing datetimes become the minimal int64, which is how
+    pandas represents NaT.
+    """
+    if values.dt.tz is not None:
+        values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+    return values.to_numpy(dtype='datetime64[ns]').view('int64')
+
+
+def leaked_mask(values: t.Union[pd.Series, pd.Index, np.ndarray],
+                reference: t.Union[pd.Series, pd.Index, np.ndarray]) -> np.ndarray:
+    """Return a boolean mask of the values which also appear in the reference values. Missing values never appear.
+
+    The lookup is done with a hash table over the reference values, so it takes linear time in the number of values
+    and reference values.
+    """
+    values, reference = _as_series(values), _as_series(reference)
+    is_missing = values.isna().to_numpy()
+    is_datetime = pd.api.types.is_datetime64_any_dtype(values.dtype)
+    if is_datetime != pd.api.types.is_datetime64_any_dtype(reference.dtype):
+        # Datetimes are never equal to values of other types
+        return np.zeros(len(values), dtype=bool)
+    if is_datetime:
+        if (values.dt.tz is None) != (reference.dt.tz is None):
+            # Timezone-naive datetimes are never equal to timezone-aware ones
+            return np.zeros(len(values), dtype=bool)
+        values, reference = _datetime_to_int64(values), _datetime_to_int64(reference)
+    else:
+        values, reference = values.to_numpy(), reference.to_numpy()
+    return pd.Series(values, copy=False).isin(pd.unique(reference)).to_numpy() & ~is_missing
+
+
+def leaked_values(values: t.Union[pd.Series, pd.Index, np.ndarray],
+                  reference: t.Union[pd.Series, pd.Index, np.ndarray]) -> pd.Series:
+    """Return the unique values which also appear in the reference values, in order of their first appearance."""
+    unique_values = _as_series(values).drop_duplicates()
+    return unique_values[leaked_mask(unique_values, reference)]
+
+
+def count_earlier_than(values: pd.Series, threshold: t.Any) -> int:
+    """Return the number of values which are smaller than the threshold, ignoring missing values."""
+    return int(np.count_nonzero((values < threshold).to_numpy()))
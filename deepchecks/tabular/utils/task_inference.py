@@ -35,10 +35,14 @@ def get_all_labels(model, train_dataset, test_dataset=None, y_pred_train=None, y
     """Aggregate labels from all available data: labels on datasets, y_pred, and model predicitions."""
     labels = np.asarray([])
     if train_dataset:
-        if train_dataset.has_label():
-            labels = np.append(labels, train_dataset.label_col.to_numpy())
-        if model:
-            labels = np.append(labels, sequence_to_numpy(model.predict(train_dataset.features_columns)))
+        if train_dataset.is_reference_profile:
+            # A reference profile holds the distribution of the labels and the model predictions instead of the data
+            labels = np.append(labels, train_dataset.observed_labels())
+        else:
+            if train_dataset.has_label():
+                labels = np.append(labels, train_dataset.label_col.to_numpy())
+            if model:
+                labels = np.append(labels, sequence_to_numpy(model.predict(train_dataset.features_columns)))
     if test_dataset:
         if test_dataset.has_label():
             labels = np.append(labels, test_dataset.label_col.to_numpy())
@@ -9,4 +9,10 @@
 # ----------------------------------------------------------------------------
 #
 """Package for utilities routines."""
+# NOTE:
+# the utilities and deepchecks.core import each other, so deepchecks.core is imported first, as it was imported by
+# 'import deepchecks' before the package was imported lazily, in order to omit circular import errors when a utility
+# module is the first deepchecks module imported
+import deepchecks.core  # noqa: F401 # pylint: disable=unused-import
+
 __all__ = []
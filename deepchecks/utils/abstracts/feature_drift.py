@@ -12,12 +12,15 @@
 import abc
 import textwrap
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from typing_extensions import Literal, Self
 
 from deepchecks.core.errors import NotEnoughSamplesError
-from deepchecks.utils.distribution.drift import calc_drift_and_plot, drift_condition, get_drift_plot_sidenote
+from deepchecks.utils.distribution.drift import (ColumnDistribution, calc_drift_and_plot, drift_condition,
+                                                 get_drift_plot_sidenote)
+from deepchecks.utils.parallel import effective_n_jobs
 
 __all__ = ['FeatureDriftAbstract']
 
@@ -37,37 +40,41 @@ class FeatureDriftAbstract(abc.ABC):
     ignore_na: bool
     min_samples: int
     n_samples: int
+    n_jobs: int = 1
     add_condition: t.Callable[..., t.Any]
 
     def _calculate_feature_drift(
         self,
         drift_kind: Literal['tabular-features', 'nlp-properties'],
-        train: pd.DataFrame,
-        test: pd.DataFrame,
+        train: t.Union[pd.DataFrame, t.Mapping[t.Hashable, ColumnDistribution], None],
+        test: t.Optional[pd.DataFrame],
         common_columns: t.Dict[str, str],
         train_dataframe_name: str,
         test_dataframe_name: str,
         with_display: bool,
         feature_importance: t.Optional[pd.Series] = None,
         features_order: t.Optional[t.Sequence[str]] = None,
+        drift_scores: t.Optional[t.Mapping[t.Hashable, t.Dict[str, t.Any]]] = None,
     ):
-        plots = {}
-        results = {}
-        not_enough_samples = []
+        # drift_scores are the scores which were already calculated over all the data (e.g. by accumulating the chunks
+        # of streaming datasets), in which case train and test are only used for the plots
 
-        for column_name, column_kind in common_columns.items():
+        def plot_title(column_name):
             if features_order is not None:
                 fi_rank = features_order.index(column_name) + 1
-                plot_title = f'{column_name} (#{int(fi_rank)} in FI)'
-            else:
-                plot_title = column_name
-
-            value, method, display = calc_drift_and_plot(
+                return f'{column_name} (#{int(fi_rank)} in FI)'
+            return column_name
+
+        def calc_column_drift(column_name, column_with_display):
+            if drift_scores is not None and not column_with_display:
+                score = drift_scores[column_name]['Drift score']
+                return 'not_enough_samples' if score is None else score, drift_scores[column_name]['Method'], None
+            return calc_drift_and_plot(
                 train_column=train[column_name],
                 test_column=test[column_name],
                 value_name=column_name,
-                column_type=column_kind,
-                plot_title=plot_title,
+                column_type=common_columns[column_name],
+                plot_title=plot_title(column_name),
                 margin_quantile_filter=self.margin_quantile_filter,
                 max_num_categories_for_drift=self.max_num_categories_for_drift,
                 min_category_size_ratio=self.min_category_size_ratio,
@@ -77,15 +84,27 @@ class FeatureDriftAbstract(abc.ABC):
                 categorical_drift_method=self.categorical_drift_method,
                 ignore_na=self.ignore_na,
                 min_samples=self.min_samples,
-                with_display=with_display,
-                dataset_names=(test_dataframe_name, train_dataframe_name)
+                with_display=column_with_display,
+                dataset_names=(test_dataframe_name, train_dataframe_name),
+                drift_score=None if drift_scores is None else drift_scores[column_name]['Drift score']
             )
 
+        # Scores are calculated for all columns first, and the figures are built later only for the displayed columns
+        columns = list(common_columns)
+        max_workers = effective_n_jobs(self.n_jobs)
+        if max_workers == 1 or len(columns) <= 1 or drift_scores is not None:
+            scores = [calc_column_drift(column_name, False) for column_name in columns]
+        else:
+            # The heavy parts of the drift calculations are done by numpy and scipy, which release the GIL
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                scores = list(pool.map(calc_column_drift, columns, [False] * len(columns)))
+
+        results = {}
+        not_enough_samples = []
+        for column_name, (value, method, _) in zip(columns, scores):
             if value == 'not_enough_samples':
                 not_enough_samples.append(column_name)
                 value = None
-            else:
-                plots[column_name] = display
 
             results[column_name] = {
                 'Drift score': value,
@@ -151,11 +170,15 @@ class FeatureDriftAbstract(abc.ABC):
                 '<span>The following columns do not have enough samples to calculate drift '
                 f'score: {not_enough_samples}</span>'
             )
+        if drift_scores is not None:
+            headnote.append(
+                '<span>The drift scores are calculated over all the data, and the distribution plots over a sample '
+                f'of up to {self.n_samples} rows of each dataset.</span>'
+            )
 
-        displays = [
-            *headnote,
-            *(plots[col] for col in columns_order if results[col]['Drift score'] is not None)
-        ]
+        figures = (calc_column_drift(col, True)[2] for col in columns_order if results[col]['Drift score'] is not None)
+        # A plotted sample may lack the samples of a column whose drift score was calculated over all the data
+        displays = [*headnote, *(figure for figure in figures if figure is not None)]
 
         return results, displays
 
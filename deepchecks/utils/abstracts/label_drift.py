@@ -15,7 +15,7 @@ import typing as t
 import pandas as pd
 
 from deepchecks import CheckResult, ConditionCategory, ConditionResult
-from deepchecks.utils.distribution.drift import calc_drift_and_plot, get_drift_plot_sidenote
+from deepchecks.utils.distribution.drift import ColumnDistribution, calc_drift_and_plot, get_drift_plot_sidenote
 from deepchecks.utils.strings import format_number
 
 __all__ = ['LabelDriftAbstract']
@@ -42,7 +42,7 @@ class LabelDriftAbstract(abc.ABC):
                                dataset_names: t.Optional[t.Tuple[str, str]]) -> CheckResult:
 
         drift_score, method, display = calc_drift_and_plot(
-            train_column=pd.Series(train_column),
+            train_column=train_column if isinstance(train_column, ColumnDistribution) else pd.Series(train_column),
             test_column=pd.Series(test_column),
             value_name=label_name,
             column_type=column_type,
@@ -11,6 +11,7 @@
 """Module contains common methods for weak segment performance checks."""
 import abc
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -27,6 +28,7 @@ from deepchecks.tabular import Dataset
 from deepchecks.tabular.context import _DummyModel
 from deepchecks.tabular.metric_utils.scorers import DeepcheckScorer
 from deepchecks.utils.dataframes import default_fill_na_per_column_type
+from deepchecks.utils.parallel import effective_n_jobs
 from deepchecks.utils.performance.partition import (DeepchecksFilter, convert_tree_leaves_into_filters,
                                                     partition_numeric_feature_around_segment)
 from deepchecks.utils.strings import format_number, format_percent
@@ -41,6 +43,7 @@ class WeakSegmentAbstract(abc.ABC):
     min_category_size_ratio: float = 0.01
     segment_minimum_size_ratio: float = 0.05
     random_state: int = 42
+    n_jobs: int = 1
     add_condition: Callable[..., Any]
 
     def _target_encode_categorical_features_fill_na(self, data: pd.DataFrame, label_col: pd.Series,
@@ -179,86 +182,36 @@ class WeakSegmentAbstract(abc.ABC):
 
         weak_segments = pd.DataFrame(
             columns=[score_title, 'Feature1', 'Feature1 Range', 'Feature2', 'Feature2 Range', '% of Data'])
-        for i in range(min(len(feature_rank_for_search), self.n_top_features)):
-            for j in range(i + 1, min(len(feature_rank_for_search), self.n_top_features)):
-                feature1, feature2 = feature_rank_for_search[[i, j]]
-                weak_segment_score, weak_segment_filter = self._find_weak_segment(data, [feature1, feature2],
-                                                                                  score_per_sample, label_col,
-                                                                                  dummy_model, scorer)
-                if weak_segment_score is None or len(weak_segment_filter.filters) == 0:
-                    continue
-                data_size = 100 * weak_segment_filter.filter(data).shape[0] / data.shape[0]
-                filters = weak_segment_filter.filters
-                if len(filters.keys()) == 1:
-                    weak_segments.loc[len(weak_segments)] = [weak_segment_score, list(filters.keys())[0],
-                                                             tuple(list(filters.values())[0]), '',
-                                                             None, data_size]
-                else:
-                    weak_segments.loc[len(weak_segments)] = [weak_segment_score, feature1,
-                                                             tuple(filters[feature1]), feature2,
-                                                             tuple(filters[feature2]), data_size]
+        n_features = min(len(feature_rank_for_search), self.n_top_features)
+        feature_pairs = [list(feature_rank_for_search[[i, j]]) for i in range(n_features)
+                         for j in range(i + 1, n_features)]
+        search_args = dict(data=data, score_per_sample=score_per_sample, label_col=label_col,
+                           dummy_model=dummy_model, scorer=scorer,
+                           segment_minimum_size_ratio=self.segment_minimum_size_ratio,
+                           random_state=self._get_random_state())
+        for (feature1, feature2), (weak_segment_score, weak_segment_filter) in \
+                zip(feature_pairs, _find_weak_segments(feature_pairs, search_args, self.n_jobs)):
+            if weak_segment_score is None or len(weak_segment_filter.filters) == 0:
+                continue
+            data_size = 100 * weak_segment_filter.filter(data).shape[0] / data.shape[0]
+            filters = weak_segment_filter.filters
+            if len(filters.keys()) == 1:
+                weak_segments.loc[len(weak_segments)] = [weak_segment_score, list(filters.keys())[0],
+                                                         tuple(list(filters.values())[0]), '',
+                                                         None, data_size]
+            else:
+                weak_segments.loc[len(weak_segments)] = [weak_segment_score, feature1,
+                                                         tuple(filters[feature1]), feature2,
+                                                         tuple(filters[feature2]), data_size]
 
         return weak_segments.drop_duplicates().sort_values(score_title).reset_index(drop=True)
 
-    def _find_weak_segment(self, data: pd.DataFrame, features_for_segment: List[str], score_per_sample: pd.Series,
-                           label_col: Optional[pd.Series] = None, dummy_model: Optional[_DummyModel] = None,
-                           scorer: Optional[DeepcheckScorer] = None) -> \
-            Tuple[Optional[float], Optional[DeepchecksFilter]]:
-        """Find weak segment based on scorer for specified features.
-
-        In each iteration build a decision tree with a set of parameters with the goal of grouping samples with
-        similar loss_per_sample values together. Then, the generated tree is values based only on the quality of
-        the worst leaf in the tree (the rest are ignored). The leaf score is calculated by the scorer
-        if provided, otherwise by the average score_per_sample value of the leaf.
-
-        After all the iterations are done, the tree with the best score (the one with the worst leaf) is selected, and
-        the worst leaf of it is extracted and returned as a deepchecks filter.
-        """
-        if version.parse(sklearn.__version__) < version.parse('1.0.0'):
-            criterion = ['mse', 'mae']
-        else:
-            criterion = ['squared_error', 'absolute_error']
-        search_space = {
-            'max_depth': [5],
-            'min_weight_fraction_leaf': [self.segment_minimum_size_ratio],
-            'min_samples_leaf': [5],
-            'criterion': criterion
-        }
-
-        # In a given tree finds the leaf with the worst score (the rest are ignored)
-        def get_worst_leaf_filter(tree):
-            leaves_filters = convert_tree_leaves_into_filters(tree, features_for_segment)
-            min_score, min_score_leaf_filter = np.inf, None
-            for leaf_filter in leaves_filters:
-                if scorer is not None and dummy_model is not None and label_col is not None:
-                    leaf_data, leaf_labels = leaf_filter.filter(data, label_col)
-                    leaf_score = scorer.run_on_data_and_label(dummy_model, leaf_data, leaf_labels)
-                else:  # if no scorer is provided, use the average loss_per_sample of samples in the leaf as the score
-                    leaf_score = score_per_sample[list(leaf_filter.filter(data).index)].mean()
-
-                if leaf_score < min_score:
-                    min_score, min_score_leaf_filter = leaf_score, leaf_filter
-            return min_score, min_score_leaf_filter
-
-        def neg_worst_segment_score(clf: DecisionTreeRegressor, x, y) -> float:  # pylint: disable=unused-argument
-            return -get_worst_leaf_filter(clf.tree_)[0]
-
+    def _get_random_state(self) -> Optional[int]:
         if hasattr(self, 'random_state'):
-            random_state = self.random_state
+            return self.random_state
         elif hasattr(self, 'context'):
-            random_state = self.context.random_state
-        else:
-            random_state = None
-        grid_searcher = GridSearchCV(DecisionTreeRegressor(random_state=random_state),
-                                     scoring=neg_worst_segment_score, param_grid=search_space, n_jobs=-1, cv=3)
-        try:
-            grid_searcher.fit(data[features_for_segment], score_per_sample)
-            # Get the worst leaf filter out of the selected tree
-            segment_score, segment_filter = get_worst_leaf_filter(grid_searcher.best_estimator_.tree_)
-        except ValueError:
-            return None, None
-
-        return segment_score, segment_filter
+            return self.context.random_state
+        return None
 
     def _format_partition_vec_for_display(self, partition_vec: np.array, feature_name: str,
                                           seperator: Union[str, None] = '<br>') -> List[Union[List, str]]:
@@ -321,3 +274,85 @@ class WeakSegmentAbstract(abc.ABC):
 
         return self.add_condition(f'The relative performance of weakest segment is greater than '
                                   f'{format_percent(1 - max_ratio_change)} of average model performance.', condition)
+
+
+def _find_weak_segment(data: pd.DataFrame, features_for_segment: List[str], score_per_sample: pd.Series,
+                       label_col: Optional[pd.Series] = None, dummy_model: Optional[_DummyModel] = None,
+                       scorer: Optional[DeepcheckScorer] = None, segment_minimum_size_ratio: float = 0.05,
+                       random_state: Optional[int] = None, grid_search_n_jobs: Optional[int] = -1) -> \
+        Tuple[Optional[float], Optional[DeepchecksFilter]]:
+    """Find weak segment based on scorer for specified features.
+
+    In each iteration build a decision tree with a set of parameters with the goal of grouping samples with
+    similar loss_per_sample values together. Then, the generated tree is values based only on the quality of
+    the worst leaf in the tree (the rest are ignored). The leaf score is calculated by the scorer
+    if provided, otherwise by the average score_per_sample value of the leaf.
+
+    After all the iterations are done, the tree with the best score (the one with the worst leaf) is selected, and
+    the worst leaf of it is extracted and returned as a deepchecks filter.
+    """
+    if version.parse(sklearn.__version__) < version.parse('1.0.0'):
+        criterion = ['mse', 'mae']
+    else:
+        criterion = ['squared_error', 'absolute_error']
+    search_space = {
+        'max_depth': [5],
+        'min_weight_fraction_leaf': [segment_minimum_size_ratio],
+        'min_samples_leaf': [5],
+        'criterion': criterion
+    }
+
+    # In a given tree finds the leaf with the worst score (the rest are ignored)
+    def get_worst_leaf_filter(tree):
+        leaves_filters = convert_tree_leaves_into_filters(tree, features_for_segment)
+        min_score, min_score_leaf_filter = np.inf, None
+        for leaf_filter in leaves_filters:
+            if scorer is not None and dummy_model is not None and label_col is not None:
+                leaf_data, leaf_labels = leaf_filter.filter(data, label_col)
+                leaf_score = scorer.run_on_data_and_label(dummy_model, leaf_data, leaf_labels)
+            else:  # if no scorer is provided, use the average loss_per_sample of samples in the leaf as the score
+                leaf_score = score_per_sample[list(leaf_filter.filter(data).index)].mean()
+
+            if leaf_score < min_score:
+                min_score, min_score_leaf_filter = leaf_score, leaf_filter
+        return min_score, min_score_leaf_filter
+
+    def neg_worst_segment_score(clf: DecisionTreeRegressor, x, y) -> float:  # pylint: disable=unused-argument
+        return -get_worst_leaf_filter(clf.tree_)[0]
+
+    grid_searcher = GridSearchCV(DecisionTreeRegressor(random_state=random_state), scoring=neg_worst_segment_score,
+                                 param_grid=search_space, n_jobs=grid_search_n_jobs, cv=3)
+    try:
+        grid_searcher.fit(data[features_for_segment], score_per_sample)
+        # Get the worst leaf filter out of the selected tree
+        segment_score, segment_filter = get_worst_leaf_filter(grid_searcher.best_estimator_.tree_)
+    except ValueError:
+        return None, None
+
+    return segment_score, segment_filter
+
+
+_worker_search_args = None
+
+
+def _init_worker(search_args):
+    global _worker_search_args
+    _worker_search_args = search_args
+
+
+def _find_weak_segment_in_worker(features_for_segment):
+    # The pairs are already searched in parallel, so the grid search of each pair runs in the worker process
+    return _find_weak_segment(features_for_segment=features_for_segment, grid_search_n_jobs=1, **_worker_search_args)
+
+
+def _find_weak_segments(feature_pairs: List[List[str]], search_args: Dict[str, Any], n_jobs: int = 1) -> \
+        List[Tuple[Optional[float], Optional[DeepchecksFilter]]]:
+    """Find the weak segment of each pair of features, in a pool of n_jobs processes if n_jobs is not 1."""
+    max_workers = effective_n_jobs(n_jobs)
+    if max_workers == 1 or len(feature_pairs) <= 1:
+        return [_find_weak_segment(features_for_segment=features, **search_args) for features in feature_pairs]
+
+    max_workers = min(max_workers, len(feature_pairs))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(search_args,)) as executor:
+        # map keeps the order of the pairs, so the result is the same as in the sequential search
+        return list(executor.map(_find_weak_segment_in_worker, feature_pairs))
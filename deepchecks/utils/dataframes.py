@@ -22,7 +22,8 @@ from deepchecks.utils.validation import ensure_hashable_or_mutable_sequence
 __all__ = ['validate_columns_exist', 'select_from_dataframe', 'un_numpy', 'generalized_corrwith',
            'floatify_dataframe', 'floatify_series', 'default_fill_na_per_column_type',
            'is_float_column', 'default_fill_na_series',
-           'cast_categorical_to_object_dtype']
+           'cast_categorical_to_object_dtype', 'hash_rows', 'hash_rows_128', 'group_identical_rows',
+           'get_group_positions']
 
 
 def default_fill_na_per_column_type(df: pd.DataFrame, cat_features: t.Union[pd.Series, t.List]) -> pd.DataFrame:
@@ -241,3 +242,135 @@ def cast_categorical_to_object_dtype(df: pd.DataFrame) -> pd.DataFrame:
     if categorical_columns:
         df = df.astype({c: 'object' for c in categorical_columns})
     return df
+
+
+# Odd multipliers used to combine the hashes of the columns, the first taken from pandas' own hashing
+_HASH_MULTIPLIER = np.uint64(1000003)
+_SECOND_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+# The default key of pandas' hashing of strings, and the key of the second hash of hash_rows_128
+_HASH_KEY = '0123456789123456'
+_SECOND_HASH_KEY = '6543219876543210'
+
+
+def _hash_column(column: pd.Series, hash_key: str = _HASH_KEY) -> np.ndarray:
+    """Return a 64-bit hash of each value of the column.
+
+    Integers are hashed exactly, and floats with an integral value are hashed as the equal integer, so the hash of a
+    value doesn't depend on whether its column was read as floats because it contained nulls (for example when the
+    data is read in chunks). Nulls of numeric columns are hashed as NaN.
+    """
+    if is_integer_dtype(column.dtype):
+        is_null = column.isna().to_numpy()
+        hashes = pd.util.hash_array(column.to_numpy(dtype=np.int64, na_value=0), hash_key=hash_key)
+        if is_null.any():
+            hashes[is_null] = pd.util.hash_array(np.array([np.nan]), hash_key=hash_key)[0]
+        return hashes
+    if is_float_dtype(column.dtype):
+        # -0.0 and 0.0 are equal, but have different binary representations
+        values = column.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+        hashes = pd.util.hash_array(values, hash_key=hash_key)
+        with np.errstate(invalid='ignore'):
+            is_integral = (np.floor(values) == values) & (np.abs(values) < 2 ** 63)
+        if is_integral.any():
+            hashes[is_integral] = pd.util.hash_array(values[is_integral].astype(np.int64), hash_key=hash_key)
+        return hashes
+    return pd.util.hash_pandas_object(column, index=False, hash_key=hash_key).to_numpy()
+
+
+def hash_rows(df: pd.DataFrame) -> pd.Series:
+    """Return a 64-bit hash of the values of each row of the dataframe.
+
+    Integers are hashed exactly, and floats with an integral value are hashed as the equal integer, so the hash of a
+    row doesn't depend on whether its column contained nulls in the dataframe it was read with (for example when the
+    data is read in chunks). The columns are hashed one at a time, so no copy of the dataframe is made.
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for _, column in df.items():
+        hashes = np.bitwise_xor(np.multiply(hashes, _HASH_MULTIPLIER), _hash_column(column))
+    return pd.Series(hashes, index=df.index)
+
+
+def hash_rows_128(df: pd.DataFrame) -> pd.MultiIndex:
+    """Return a 128-bit hash of the values of each row of the dataframe, as pairs of independent 64-bit hashes.
+
+    The first hash is the one of hash_rows. The second one hashes the strings with another key, remixes the column
+    hashes with a salt per column and combines them differently. The chance of two different rows out of n rows
+    sharing both hashes is about n^2 / 2^129, which is negligible even for billions of rows, so the hashes can be
+    counted in place of the rows when the rows can't be held in memory.
+    """
+    second_hashes = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for i, (_, column) in enumerate(df.items()):
+            salt = np.multiply(np.uint64(i + 1), _SECOND_HASH_MULTIPLIER)
+            column_hashes = pd.util.hash_array(np.bitwise_xor(_hash_column(column, _SECOND_HASH_KEY), salt))
+            second_hashes = np.add(np.multiply(second_hashes, _SECOND_HASH_MULTIPLIER), column_hashes)
+    return pd.MultiIndex.from_arrays([hash_rows(df).to_numpy(), second_hashes])
+
+
+def group_identical_rows(*dfs: pd.DataFrame) -> t.List[np.ndarray]:
+    """Return the group of identical rows of each row of the dataframes, in a single pass over the rows hashes.
+
+    Rows are grouped by their hashes, and rows which share a hash are compared to each other so hash collisions never
+    group different rows together. Null values are considered equal to each other, as in groupby with dropna=False.
+
+    Parameters
+    ----------
+    *dfs : pd.DataFrame
+        Dataframes with the same columns. Group ids are shared between all the dataframes.
+
+    Returns
+    -------
+    List[np.ndarray]
+        For each dataframe, an array with the group id of each of its rows. Group ids are numbered from 0 by order
+        of first appearance in the dataframes.
+    """
+    codes, _ = pd.factorize(np.concatenate([hash_rows(df).to_numpy() for df in dfs]))
+    codes = _split_hash_collisions(list(dfs), codes.astype(np.int64))
+    offsets = np.cumsum([0] + [len(df) for df in dfs])
+    return [codes[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def get_group_positions(codes: np.ndarray, groups: t.Sequence[int]) -> t.List[np.ndarray]:
+    """Return the positions of the rows of each of the given groups, in the order of the rows."""
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.searchsorted(sorted_codes, groups, side='left')
+    ends = np.searchsorted(sorted_codes, groups, side='right')
+    return [order[start:end] for start, end in zip(starts, ends)]
+
+
+def _split_hash_collisions(dfs: t.List[pd.DataFrame], codes: np.ndarray) -> np.ndarray:
+    """Compare the rows which share a hash code to the first row of the code and split codes of different rows."""
+    candidates = np.flatnonzero(np.bincount(codes)[codes] > 1)
+    if len(candidates) == 0:
+        return codes
+    offsets = np.cumsum([0] + [len(df) for df in dfs])
+    local_candidates = [candidates[(candidates >= start) & (candidates < end)] - start
+                        for start, end in zip(offsets[:-1], offsets[1:])]
+    candidates_codes = codes[candidates]
+    first_positions = np.empty(codes.max() + 1, dtype=np.int64)
+    first_positions[candidates_codes[::-1]] = np.arange(len(candidates))[::-1]
+    representatives = first_positions[candidates_codes]
+
+    different = np.zeros(len(candidates), dtype=bool)
+    for i in range(dfs[0].shape[1]):
+        parts = [df.iloc[:, i].take(positions).to_numpy() for df, positions in zip(dfs, local_candidates)]
+        if len({part.dtype for part in parts}) > 1:
+            parts = [part.astype(object) for part in parts]
+        values = np.concatenate(parts)
+        nulls = pd.isna(values)
+        equal = np.asarray(values == values[representatives], dtype=bool) | (nulls & nulls[representatives])
+        different |= ~equal
+    if not different.any():
+        return codes
+
+    # Rows with colliding hashes are regrouped by their values
+    colliding = np.isin(candidates_codes, candidates_codes[different])
+    colliding_rows = pd.concat([df.iloc[positions] for df, positions in zip(dfs, local_candidates)],
+                               ignore_index=True)[colliding]
+    colliding_rows = cast_categorical_to_object_dtype(colliding_rows)
+    exact_codes = colliding_rows.groupby([colliding_rows.iloc[:, i] for i in range(colliding_rows.shape[1])],
+                                         dropna=False, sort=False).ngroup().to_numpy()
+    codes = codes.copy()
+    codes[candidates[colliding]] = codes.max() + 1 + exact_codes
+    return pd.factorize(codes)[0].astype(np.int64)
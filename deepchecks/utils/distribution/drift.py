@@ -10,6 +10,8 @@
 #
 """Common utilities for distribution checks."""
 
+from collections import Counter
+from functools import partial
 from numbers import Number
 from typing import Dict, Optional, Tuple, Union
 
@@ -24,18 +26,62 @@ from deepchecks.core.errors import DeepchecksValueError, NotEnoughSamplesError
 from deepchecks.utils.dict_funcs import get_dict_entry_by_value
 from deepchecks.utils.distribution.plot import (CategoriesSortingKind, drift_score_bar_traces,
                                                 feature_distribution_traces)
-from deepchecks.utils.distribution.preprocessing import preprocess_2_cat_cols_to_same_bins
+from deepchecks.utils.distribution.preprocessing import preprocess_2_cat_counts_to_same_bins
 from deepchecks.utils.plot import DEFAULT_DATASET_NAMES
 from deepchecks.utils.strings import format_number
 
-__all__ = ['calc_drift_and_plot', 'get_drift_method', 'SUPPORTED_CATEGORICAL_METHODS', 'SUPPORTED_NUMERIC_METHODS',
-           'drift_condition', 'get_drift_plot_sidenote', 'cramers_v', 'psi']
+__all__ = ['calc_drift_and_plot', 'ColumnDistribution', 'get_drift_method', 'SUPPORTED_CATEGORICAL_METHODS',
+           'SUPPORTED_NUMERIC_METHODS', 'drift_condition', 'get_drift_plot_sidenote', 'cramers_v', 'psi']
 
 PSI_MIN_PERCENTAGE = 0.01
 SUPPORTED_CATEGORICAL_METHODS = ['Cramer\'s V', 'PSI']
 SUPPORTED_NUMERIC_METHODS = ['Earth Mover\'s Distance', 'Kolmogorov-Smirnov']
 
 
+class ColumnDistribution:
+    """Distribution of a reference (train) column, prepared once for calculating drift of other columns against it.
+
+    Numerical columns are kept as their sorted non-missing values, and categorical columns as the count of each
+    value (including missing values), which is all the drift scores and plots need.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The reference column.
+    column_type : str
+        Type of the column (either "numerical" or "categorical").
+    """
+
+    def __init__(self, column: pd.Series, column_type: str):
+        if column_type == 'numerical':
+            self.values = np.sort(np.array(column.dropna().values).reshape(-1).astype('float'))
+            self.counts = None
+        elif column_type == 'categorical':
+            value_counts = column.value_counts(dropna=False, sort=False)
+            self.values = np.asarray(value_counts.index)
+            self.counts = value_counts.to_numpy()
+        else:
+            raise DeepchecksValueError(f'Unsupported column type for drift: {column_type}')
+        self.name = column.name
+        self.column_type = column_type
+
+    def to_array(self, ignore_na: bool = True) -> np.ndarray:
+        """Return the values of the column (sorted for numerical columns), without missing values if ignore_na."""
+        if self.counts is None:
+            return self.values
+        counts = self.counts
+        if ignore_na:
+            counts = np.where(pd.isna(self.values), 0, counts)
+        return np.repeat(self.values, counts)
+
+    def to_counter(self, ignore_na: bool = True) -> Counter:
+        """Return the count of each value of a categorical column, without missing values if ignore_na."""
+        if self.counts is None:
+            raise DeepchecksValueError('Value counts are only kept for categorical columns')
+        return Counter({value: count for value, count in zip(self.values, self.counts)
+                        if not (ignore_na and pd.isna(value))})
+
+
 def filter_margins_by_quantile(dist: Union[np.ndarray, pd.Series], margin_quantile_filter: float) -> np.ndarray:
     """Filter the margins of the distribution by a quantile."""
     qt_min, qt_max = np.quantile(dist, [margin_quantile_filter, 1 - margin_quantile_filter])
@@ -95,7 +141,7 @@ def rebalance_distributions(dist1_counts: np.array, dist2_counts: np.array):
     return dist1_counts, dist2_counts
 
 
-def cramers_v(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series],
+def cramers_v(dist1: Union[np.ndarray, pd.Series, Counter], dist2: Union[np.ndarray, pd.Series, Counter],
               balance_classes: bool = False, min_category_size_ratio: float = 0, max_num_categories: int = None,
               sort_by: str = 'dist1', from_freqs: bool = False) -> float:
     """Calculate the Cramer's V statistic.
@@ -107,10 +153,10 @@ def cramers_v(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.S
 
     Parameters
     ----------
-    dist1 : Union[np.ndarray, pd.Series]
-        array of numerical values.
-    dist2 : Union[np.ndarray, pd.Series]
-        array of numerical values to compare dist1 to.
+    dist1 : Union[np.ndarray, pd.Series, Counter]
+        array of numerical values, or a Counter of the count of each value.
+    dist2 : Union[np.ndarray, pd.Series, Counter]
+        array of numerical values to compare dist1 to, or a Counter of the count of each value.
     balance_classes : bool, default False
         whether to balance the classes of the distributions. Use this in case of extremely unbalanced classes.
     min_category_size_ratio: float, default 0.01
@@ -145,9 +191,10 @@ def cramers_v(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.S
     if from_freqs:
         dist1_counts, dist2_counts = dist1, dist2
     else:
-        dist1_counts, dist2_counts, cat_list = preprocess_2_cat_cols_to_same_bins(dist1, dist2,
-                                                                                  min_category_size_ratio,
-                                                                                  max_num_categories, sort_by)
+        # Counter(...) counts an array of values, or copies a Counter of counts which the binning modifies
+        dist1_counts, dist2_counts, cat_list = preprocess_2_cat_counts_to_same_bins(Counter(dist1), Counter(dist2),
+                                                                                    min_category_size_ratio,
+                                                                                    max_num_categories, sort_by)
         if len(cat_list) == 1:  # If the distributions have the same single value
             return 0
 
@@ -185,7 +232,7 @@ def _balance_sizes_downsizing(dist1_counts, dist2_counts, round_to_int: bool = T
     return dist1_counts, dist2_counts
 
 
-def psi(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series],
+def psi(dist1: Union[np.ndarray, pd.Series, Counter], dist2: Union[np.ndarray, pd.Series, Counter],
         min_category_size_ratio: float = 0, max_num_categories: int = None, sort_by: str = 'dist1',
         from_freqs: bool = False) -> float:
     """
@@ -195,10 +242,10 @@ def psi(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series]
 
     Parameters
     ----------
-    dist1 : Union[np.ndarray, pd.Series]
-        array of numerical values.
-    dist2 : Union[np.ndarray, pd.Series]
-        array of numerical values to compare dist1 to.
+    dist1 : Union[np.ndarray, pd.Series, Counter]
+        array of numerical values, or a Counter of the count of each value.
+    dist2 : Union[np.ndarray, pd.Series, Counter]
+        array of numerical values to compare dist1 to, or a Counter of the count of each value.
     min_category_size_ratio: float, default 0.01
         minimum size ratio for categories. Categories with size ratio lower than this number are binned
         into an "Other" category.
@@ -227,8 +274,9 @@ def psi(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series]
     if from_freqs:
         expected_counts, actual_counts = dist1, dist2
     else:
-        expected_counts, actual_counts, _ = preprocess_2_cat_cols_to_same_bins(dist1, dist2, min_category_size_ratio,
-                                                                               max_num_categories, sort_by)
+        expected_counts, actual_counts, _ = preprocess_2_cat_counts_to_same_bins(Counter(dist1), Counter(dist2),
+                                                                                 min_category_size_ratio,
+                                                                                 max_num_categories, sort_by)
     size_expected, size_actual = sum(expected_counts), sum(actual_counts)
     psi_value = 0
     for i in range(len(expected_counts)):
@@ -241,7 +289,8 @@ def psi(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series]
     return psi_value
 
 
-def kolmogorov_smirnov(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series]) -> float:
+def kolmogorov_smirnov(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series],
+                       dist1_sorted: bool = False) -> float:
     """
     Perform the two-sample Kolmogorov-Smirnov test for goodness of fit.
 
@@ -258,6 +307,8 @@ def kolmogorov_smirnov(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndar
     dist1, dist2 : array_like, 1-Dimensional
         Two arrays of sample observations assumed to be drawn from a continuous
         distribution, sample sizes can be different.
+    dist1_sorted : bool, default: False
+        Whether dist1 is already sorted, in which case it isn't sorted again.
 
     Returns
     -------
@@ -304,7 +355,8 @@ def kolmogorov_smirnov(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndar
         dist1 = dist1.compressed()
     if np.ma.is_masked(dist2):
         dist2 = dist2.compressed()
-    dist1 = np.sort(dist1)
+    if not dist1_sorted:
+        dist1 = np.sort(dist1)
     dist2 = np.sort(dist2)
     n1 = dist1.shape[0]
     n2 = dist2.shape[0]
@@ -370,7 +422,7 @@ def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.n
     return wasserstein_distance(dist1, dist2)
 
 
-def calc_drift_and_plot(train_column: pd.Series,
+def calc_drift_and_plot(train_column: Union[pd.Series, ColumnDistribution],
                         test_column: pd.Series,
                         value_name: str,
                         column_type: str,
@@ -387,15 +439,16 @@ def calc_drift_and_plot(train_column: pd.Series,
                         min_samples: int = 10,
                         raise_min_samples_error: bool = False,
                         with_display: bool = True,
-                        dataset_names: Tuple[str, str] = DEFAULT_DATASET_NAMES
+                        dataset_names: Tuple[str, str] = DEFAULT_DATASET_NAMES,
+                        drift_score: Optional[float] = None
                         ) -> Tuple[float, str, Optional[Figure]]:
     """
     Calculate drift score per column.
 
     Parameters
     ----------
-    train_column: pd.Series
-        column from train dataset
+    train_column: Union[pd.Series, ColumnDistribution]
+        column from train dataset, or its distribution prepared in advance
     test_column: pd.Series
         same column from test dataset
     value_name: str
@@ -445,6 +498,10 @@ def calc_drift_and_plot(train_column: pd.Series,
         flag that determines if function will calculate display.
     dataset_names: tuple, default: DEFAULT_DATASET_NAMES
         The names to show in the display for the first and second datasets.
+    drift_score: float, default: None
+        A drift score which was already calculated for the column (e.g. over all the chunks of a streaming dataset).
+        If given, it is returned and plotted instead of calculating the score of the given columns, which are then
+        used only for the distribution plot.
     Returns
     -------
     Tuple[float, str, Callable]
@@ -456,14 +513,35 @@ def calc_drift_and_plot(train_column: pd.Series,
         raise DeepchecksValueError(
             f'min_category_size_ratio expected a value in range [0, 1], instead got {min_category_size_ratio}.')
 
+    is_train_distribution = isinstance(train_column, ColumnDistribution)
+    if is_train_distribution:
+        if train_column.column_type != column_type:
+            raise DeepchecksValueError(f'The train distribution of {value_name} is {train_column.column_type}, '
+                                       f'but the column type is {column_type}')
+
     if column_type == 'categorical' and ignore_na is False:
-        train_dist = np.array(train_column.values).reshape(-1)
         test_dist = np.array(test_column.values).reshape(-1)
     else:
-        train_dist = np.array(train_column.dropna().values).reshape(-1)
         test_dist = np.array(test_column.dropna().values).reshape(-1)
 
-    if len(train_dist) < min_samples or len(test_dist) < min_samples:
+    if is_train_distribution:
+        train_dist = train_column.to_counter(ignore_na) if column_type == 'categorical' else train_column.to_array()
+    elif column_type == 'categorical' and ignore_na is False:
+        train_dist = np.array(train_column.values).reshape(-1)
+    else:
+        train_dist = np.array(train_column.dropna().values).reshape(-1)
+
+    if column_type == 'categorical':
+        # Categorical drift only depends on the count of each value, so a profile's counts are used as they are
+        # instead of being expanded back into values
+        if not is_train_distribution:
+            train_dist = Counter(train_dist)
+        test_dist = Counter(test_dist)
+        train_size, test_size = sum(train_dist.values()), sum(test_dist.values())
+    else:
+        train_size, test_size = len(train_dist), len(test_dist)
+
+    if train_size < min_samples or test_size < min_samples:
         if raise_min_samples_error is True:
             raise NotEnoughSamplesError(
                 f'Not enough samples to calculate drift score. Minimum {min_samples} samples required. '
@@ -479,14 +557,14 @@ def calc_drift_and_plot(train_column: pd.Series,
 
         if numerical_drift_method.lower() == 'emd':
             scorer_name = 'Earth Mover\'s Distance'
-            score = earth_movers_distance(dist1=train_dist, dist2=test_dist,
-                                          margin_quantile_filter=margin_quantile_filter)
+            calc_score = partial(earth_movers_distance, margin_quantile_filter=margin_quantile_filter)
         elif numerical_drift_method.lower() in ['ks', 'kolmogorov-smirnov']:
             scorer_name = 'Kolmogorov-Smirnov'
-            score = kolmogorov_smirnov(dist1=train_dist, dist2=test_dist)
+            calc_score = partial(kolmogorov_smirnov, dist1_sorted=is_train_distribution)
         else:
             raise DeepchecksValueError('Expected numerical_drift_method to be one '
                                        f'of ["EMD", "KS"], received: {numerical_drift_method}')
+        score = calc_score(dist1=train_dist, dist2=test_dist) if drift_score is None else drift_score
 
         if not with_display:
             return score, scorer_name, None
@@ -505,16 +583,18 @@ def calc_drift_and_plot(train_column: pd.Series,
             ('dist1' if show_categories_by == 'train_largest' else 'dist2')
         if categorical_drift_method.lower() in ['cramer_v', 'cramers_v']:
             scorer_name = 'Cramer\'s V'
-            score = cramers_v(dist1=train_dist, dist2=test_dist, balance_classes=balance_classes,
-                              min_category_size_ratio=min_category_size_ratio,
-                              max_num_categories=max_num_categories_for_drift, sort_by=sort_by)
+            calc_score = partial(cramers_v, balance_classes=balance_classes)
         elif categorical_drift_method.lower() == 'psi':
             scorer_name = 'PSI'
-            score = psi(dist1=train_dist, dist2=test_dist, min_category_size_ratio=min_category_size_ratio,
-                        max_num_categories=max_num_categories_for_drift, sort_by=sort_by)
+            calc_score = psi
         else:
             raise DeepchecksValueError('Expected categorical_drift_method to be one '
                                        f'of ["cramers_v", "PSI"], received: {categorical_drift_method}')
+        if drift_score is None:
+            score = calc_score(dist1=train_dist, dist2=test_dist, min_category_size_ratio=min_category_size_ratio,
+                               max_num_categories=max_num_categories_for_drift, sort_by=sort_by)
+        else:
+            score = drift_score
 
         if not with_display:
             return score, scorer_name, None
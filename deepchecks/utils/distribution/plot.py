@@ -141,9 +141,11 @@ def feature_distribution_traces(
     Parameters
     ----------
     train_column
-        Train data used to trace distribution.
+        Train data used to trace distribution. For a categorical column, can also be a Counter of the count of each
+        value.
     test_column
-        Test data used to trace distribution.
+        Test data used to trace distribution. For a categorical column, can also be a Counter of the count of each
+        value.
     column_name
         The name of the column values on the x axis.
     is_categorical : bool , default: False
@@ -306,7 +308,7 @@ def _create_distribution_bar_graphs(
         dist2=test_column,
     )
 
-    expected_percents, actual_percents = expected / len(train_column), actual / len(test_column)
+    expected_percents, actual_percents = expected / expected.sum(), actual / actual.sum()
 
     if show_categories_by == 'train_largest':
         sort_func = lambda tup: tup[0]
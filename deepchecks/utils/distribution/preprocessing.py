@@ -30,7 +30,8 @@ from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.distribution.rare_category_encoder import RareCategoryEncoder
 from deepchecks.utils.typing import Hashable
 
-__all__ = ['ScaledNumerics', 'preprocess_2_cat_cols_to_same_bins', 'value_frequency']
+__all__ = ['ScaledNumerics', 'preprocess_2_cat_cols_to_same_bins', 'preprocess_2_cat_counts_to_same_bins',
+           'value_frequency']
 
 OTHER_CATEGORY_NAME = 'Other rare categories'
 
@@ -159,9 +160,48 @@ def preprocess_2_cat_cols_to_same_bins(dist1: Union[np.ndarray, pd.Series], dist
         list of all categories that the percentages represent.
 
     """
-    dist1_counter, dist2_counter = Counter(dist1), Counter(dist2)
-    size_dist1, size_dist2 = len(dist1), len(dist2)
+    return preprocess_2_cat_counts_to_same_bins(Counter(dist1), Counter(dist2), min_category_size_ratio,
+                                                max_num_categories, sort_by)
+
+
+def preprocess_2_cat_counts_to_same_bins(dist1_counter: Counter, dist2_counter: Counter,
+                                         min_category_size_ratio: float = 0., max_num_categories: int = None,
+                                         sort_by: str = 'dist1') -> Tuple[np.ndarray, np.ndarray, List]:
+    """
+    Preprocess distributions given as the count of each category to the same bins.
+
+    Same as preprocess_2_cat_cols_to_same_bins, for distributions which were already counted.
+
+    Parameters
+    ----------
+    dist1_counter: Counter
+        count of each category in the first distribution.
+    dist2_counter: Counter
+        count of each category in the second distribution.
+    min_category_size_ratio: float, default 0
+        minimum size ratio for categories. Categories with size ratio lower than this number are binned
+        into an "Other" category.
+    max_num_categories: int, default: None
+        max number of allowed categories. If there are more categories than this number, categories are ordered by
+        magnitude and all the smaller categories are binned into an "Other" category.
+    sort_by: str, default: 'dist1'
+        Specify how categories should be sorted, affecting which categories will get into the "Other" category.
+        Possible values are 'dist1', 'dist2' and 'difference'.
+    Returns
+    -------
+    dist1_counts
+        array of percentages of each value in the first distribution.
+    dist2_counts
+        array of percentages of each value in the second distribution.
+    categories_list
+        list of all categories that the percentages represent.
+    """
+    dist1_counter, dist2_counter = Counter(dist1_counter), Counter(dist2_counter)
+    size_dist1, size_dist2 = sum(dist1_counter.values()), sum(dist2_counter.values())
     categories_list = list(set(dist1_counter.keys()) | (set(dist2_counter.keys())))
+    if OTHER_CATEGORY_NAME in categories_list:
+        # Counts which were already binned into the "Other" category are kept in it
+        categories_list.remove(OTHER_CATEGORY_NAME)
 
     if max_num_categories is not None and len(categories_list) > max_num_categories:
         if sort_by == 'dist1':
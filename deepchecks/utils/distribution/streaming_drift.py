@@ -0,0 +1,389 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing mergeable sketches for calculating drift on data streams."""
+import typing as t
+from collections import Counter
+from functools import partial
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+from scipy.stats import wasserstein_distance
+from typing_extensions import Self
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.utils.distribution.drift import _balance_sizes_downsizing, cramers_v, psi
+from deepchecks.utils.distribution.preprocessing import OTHER_CATEGORY_NAME, preprocess_2_cat_counts_to_same_bins
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['QuantileSketch', 'CategoryCounter', 'DriftAccumulator']
+
+
+class QuantileSketch:
+    """Mergeable sketch of the distribution of numerical values, in memory bounded by the sketch size.
+
+    The sketch is a KLL-style hierarchy of compactors: values are added to level 0, and whenever a level holds more
+    than k values, they are sorted and every other value (the odd or the even ones, at random) is promoted to the
+    next level, where each value stands for twice as many values. Sketches of different parts of the data can be
+    merged by merging their levels.
+
+    The sketch is exact until more than k values are added. Each compaction of level h shifts the rank of any value
+    by at most 2^h, so the rank of a value in the sketch differs from its rank in the data by at most
+    ``rank_error_bound`` (a fraction of the number of values), which is (number of levels - 1) / k. As the compacted
+    values are chosen at random the errors mostly cancel out, and the typical error is about 1 / k.
+
+    Parameters
+    ----------
+    k : int , default: 2048
+        Maximal number of values in each level of the sketch.
+    random_state : int , default: 42
+        Random seed for choosing the compacted values.
+    """
+
+    def __init__(self, k: int = 2048, random_state: int = 42):
+        if not isinstance(k, int) or k < 2:
+            raise DeepchecksValueError(f'k must be an integer larger than 1, but got: {k}')
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels: t.List[np.ndarray] = [np.empty(0)]
+        self._random_state = np.random.RandomState(random_state)
+
+    def update(self, values: t.Union[np.ndarray, pd.Series]) -> Self:
+        """Add the given values to the sketch, ignoring missing values."""
+        values = np.asarray(values, dtype='float').reshape(-1)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> Self:
+        """Merge the values of another sketch into this sketch."""
+        if other.k != self.k:
+            raise DeepchecksValueError(f'Can\'t merge sketches of different sizes ({self.k} and {other.k})')
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for level, values in enumerate(other._levels):  # pylint: disable=protected-access
+            if level == len(self._levels):
+                self._levels.append(values)
+            else:
+                self._levels[level] = np.concatenate([self._levels[level], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) > self.k:
+                values = np.sort(values)
+                # An odd value out stays in the level, and every other value of the rest is promoted
+                n_compacted = len(values) - len(values) % 2
+                promoted = values[self._random_state.randint(2):n_compacted:2]
+                self._levels[level] = values[n_compacted:]
+                if level + 1 == len(self._levels):
+                    self._levels.append(promoted)
+                else:
+                    self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    @property
+    def rank_error_bound(self) -> float:
+        """Return the maximal error of the rank of a value in the sketch, as a fraction of the number of values."""
+        return (len(self._levels) - 1) / self.k
+
+    def weighted_values(self) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return the sorted values held by the sketch, and the number of values each of them stands for."""
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level_values), 2 ** level, dtype='float')
+                                  for level, level_values in enumerate(self._levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def cdf(self, x: t.Union[float, np.ndarray]) -> np.ndarray:
+        """Return the estimated fraction of the values which are smaller than or equal to x."""
+        values, weights = self.weighted_values()
+        cumulative_weights = np.concatenate([[0], np.cumsum(weights)])
+        return cumulative_weights[np.searchsorted(values, x, side='right')] / cumulative_weights[-1]
+
+    def quantile(self, q: t.Union[float, np.ndarray]) -> np.ndarray:
+        """Return the estimated q-th quantiles of the values, interpolated linearly as in np.quantile."""
+        values, weights = self.weighted_values()
+        # Each value is placed at the highest rank it stands for, so the ranks of an exact sketch are 0 to n - 1
+        ranks = np.cumsum(weights) - 1
+        return np.interp(np.asarray(q) * ranks[-1], ranks, values)
+
+    def __len__(self) -> int:
+        """Return the number of values added to the sketch."""
+        return self.n
+
+
+class CategoryCounter:
+    """Mergeable counter of categorical values, holding at most max_categories counts.
+
+    Uses the Misra-Gries algorithm: when there are more than max_categories counts, the (max_categories + 1)-th
+    largest count is subtracted from all the counts and non-positive counts are dropped. The counts are exact while
+    there are at most max_categories distinct values, and otherwise each count is smaller than the true count by at
+    most ``count_error_bound`` = n / (max_categories + 1). The values which are no longer counted are treated as the
+    "Other" category when calculating drift.
+
+    Parameters
+    ----------
+    max_categories : int , default: 1000
+        Maximal number of counted categories.
+    """
+
+    def __init__(self, max_categories: int = 1000):
+        if not isinstance(max_categories, int) or max_categories < 1:
+            raise DeepchecksValueError(f'max_categories must be a positive integer, but got: {max_categories}')
+        self.max_categories = max_categories
+        self.n = 0
+        self.n_nulls = 0
+        self.counts: t.Dict[t.Any, int] = {}
+
+    def update(self, values: t.Union[np.ndarray, pd.Series]) -> Self:
+        """Add the given values to the counter, counting missing values separately."""
+        values = pd.Series(np.asarray(values, dtype='object').reshape(-1))
+        value_counts = values.value_counts(dropna=True)
+        self._add(value_counts.to_dict(), n=len(values), n_nulls=len(values) - int(value_counts.sum()))
+        return self
+
+    def merge(self, other: 'CategoryCounter') -> Self:
+        """Merge the counts of another counter into this counter."""
+        self._add(other.counts, n=other.n, n_nulls=other.n_nulls)
+        return self
+
+    def _add(self, counts: t.Dict[t.Any, int], n: int, n_nulls: int):
+        self.n += n
+        self.n_nulls += n_nulls
+        merged = Counter(self.counts)
+        merged.update(counts)
+        if len(merged) > self.max_categories:
+            threshold = sorted(merged.values(), reverse=True)[self.max_categories]
+            merged = {value: count - threshold for value, count in merged.items() if count > threshold}
+        self.counts = dict(merged)
+
+    @property
+    def count_error_bound(self) -> int:
+        """Return the maximal difference between a count and the number of times its value was added."""
+        return self.n // (self.max_categories + 1) if self.n - self.n_nulls > sum(self.counts.values()) else 0
+
+    def to_counter(self, ignore_na: bool = True) -> Counter:
+        """Return the counts, with the uncounted values under the "Other" category."""
+        counter = Counter(self.counts)
+        n_uncounted = self.n - self.n_nulls - sum(self.counts.values())
+        if n_uncounted > 0:
+            counter[OTHER_CATEGORY_NAME] += n_uncounted
+        if not ignore_na and self.n_nulls > 0:
+            counter[np.nan] = self.n_nulls
+        return counter
+
+
+class DriftAccumulator:
+    """Accumulate the distributions of columns from chunks of data, in order to calculate the drift between them.
+
+    Numerical columns are summarized by a :class:`QuantileSketch` and categorical columns by a
+    :class:`CategoryCounter`, so the memory used doesn't depend on the number of rows. Accumulators of different
+    chunks of the same data (e.g. calculated by different workers) can be merged, and the drift of the data
+    accumulated by one accumulator from the data accumulated by a reference (train) accumulator is calculated by
+    :meth:`calc_drift`. The accumulators can be pickled, so the reference accumulator can be built once and saved.
+
+    The drift scores are calculated by the same methods as in the drift checks, with the following error bounds:
+
+    - Kolmogorov-Smirnov: differs from the exact statistic by at most the sum of the ``rank_error_bound`` of the
+      two sketches.
+    - Earth Mover's Distance: as the distributions are scaled to [0, 1], the distance differs from the distance of
+      the same margins of the exact distributions by at most the sum of the ``rank_error_bound`` of the two sketches.
+      The margins themselves are estimated quantiles, which are off by at most the same rank errors.
+    - Cramer's V and PSI: exact while each column has at most max_categories distinct values. Otherwise, each
+      category count is off by at most its ``count_error_bound``, and the uncounted values are in the "Other"
+      category.
+
+    Parameters
+    ----------
+    columns : Mapping[Hashable, str]
+        The type of each accumulated column (either "numerical" or "categorical").
+    k : int , default: 2048
+        Maximal number of values in each level of the quantile sketches of numerical columns.
+    max_categories : int , default: 1000
+        Maximal number of counted categories of each categorical column.
+    random_state : int , default: 42
+        Random seed for the quantile sketches.
+    """
+
+    def __init__(
+            self,
+            columns: t.Mapping[Hashable, str],
+            k: int = 2048,
+            max_categories: int = 1000,
+            random_state: int = 42
+    ):
+        self.columns = dict(columns)
+        self.sketches: t.Dict[Hashable, t.Union[QuantileSketch, CategoryCounter]] = {}
+        for column, column_type in self.columns.items():
+            if column_type == 'numerical':
+                self.sketches[column] = QuantileSketch(k, random_state)
+            elif column_type == 'categorical':
+                self.sketches[column] = CategoryCounter(max_categories)
+            else:
+                raise DeepchecksValueError(f'Unsupported column type for drift: {column_type}')
+
+    def update(self, chunk: pd.DataFrame) -> Self:
+        """Add a chunk of data, containing all the accumulated columns, to the accumulator."""
+        missing_columns = [column for column in self.columns if column not in chunk.columns]
+        if missing_columns:
+            raise DeepchecksValueError(f'The chunk is missing the accumulated columns: {missing_columns}')
+        for column, sketch in self.sketches.items():
+            sketch.update(chunk[column])
+        return self
+
+    def merge(self, other: 'DriftAccumulator') -> Self:
+        """Merge the data accumulated by another accumulator of the same columns into this accumulator."""
+        if other.columns != self.columns:
+            raise DeepchecksValueError('Can\'t merge accumulators of different columns')
+        for column, sketch in self.sketches.items():
+            sketch.merge(other.sketches[column])
+        return self
+
+    def calc_drift(
+            self,
+            reference: 'DriftAccumulator',
+            numerical_drift_method: str = 'KS',
+            categorical_drift_method: str = 'cramers_v',
+            margin_quantile_filter: float = 0.025,
+            max_num_categories_for_drift: t.Optional[int] = None,
+            min_category_size_ratio: float = 0.01,
+            ignore_na: bool = True,
+            min_samples: int = 10,
+            sort_by: str = 'dist1'
+    ) -> t.Dict[Hashable, t.Dict[str, t.Any]]:
+        """Calculate the drift of the accumulated data from the data accumulated by the reference accumulator.
+
+        Parameters
+        ----------
+        reference : DriftAccumulator
+            Accumulator of the reference (train) data, with the same columns.
+        numerical_drift_method : str , default: "KS"
+            decides which method to use on numerical variables. Possible values are:
+            "EMD" for Earth Mover's Distance (EMD), "KS" for Kolmogorov-Smirnov (KS).
+        categorical_drift_method : str , default: "cramers_v"
+            decides which method to use on categorical variables. Possible values are:
+            "cramers_v" for Cramer's V, "PSI" for Population Stability Index (PSI).
+        margin_quantile_filter : float , default: 0.025
+            float in range [0,0.5), representing which margins (high and low quantiles) of the distribution will be
+            filtered out of the EMD calculation.
+        max_num_categories_for_drift : t.Optional[int] , default: None
+            Max number of allowed categories. If there are more, they are binned into an "Other" category.
+        min_category_size_ratio : float , default: 0.01
+            minimum size ratio for categories. Categories with size ratio lower than this number are binned
+            into an "Other" category.
+        ignore_na : bool , default: True
+            For categorical columns only. If True, ignores nones for categorical drift. If False, considers none as a
+            separate category. For numerical columns we always ignore nones.
+        min_samples : int , default: 10
+            Minimum number of samples required to calculate the drift score of a column. Columns with less samples
+            get a drift score of None.
+        sort_by : str , default: "dist1"
+            Specify how categories are sorted when binning them by max_num_categories_for_drift. Possible values are
+            "dist1" (the largest reference categories), "dist2" (the largest categories of this accumulator) and
+            "difference" (the largest difference between categories).
+
+        Returns
+        -------
+        Dict[Hashable, Dict[str, Any]]
+            The drift score and method of each column.
+        """
+        if reference.columns != self.columns:
+            raise DeepchecksValueError('The reference accumulator must have the same columns')
+        if not isinstance(margin_quantile_filter, Number) or not 0 <= margin_quantile_filter < 0.5:
+            raise DeepchecksValueError(
+                f'margin_quantile_filter expected a value in range [0, 0.5), instead got {margin_quantile_filter}')
+
+        results = {}
+        for column, column_type in self.columns.items():
+            reference_sketch, sketch = reference.sketches[column], self.sketches[column]
+            if column_type == 'numerical':
+                if numerical_drift_method.lower() == 'emd':
+                    method = 'Earth Mover\'s Distance'
+                    calc_score = partial(_sketches_emd, margin_quantile_filter=margin_quantile_filter)
+                elif numerical_drift_method.lower() in ['ks', 'kolmogorov-smirnov']:
+                    method = 'Kolmogorov-Smirnov'
+                    calc_score = _sketches_ks
+                else:
+                    raise DeepchecksValueError('Expected numerical_drift_method to be one '
+                                               f'of ["EMD", "KS"], received: {numerical_drift_method}')
+                n_reference, n_samples = reference_sketch.n, sketch.n
+            else:
+                if categorical_drift_method.lower() in ['cramer_v', 'cramers_v']:
+                    method = 'Cramer\'s V'
+                elif categorical_drift_method.lower() == 'psi':
+                    method = 'PSI'
+                else:
+                    raise DeepchecksValueError('Expected categorical_drift_method to be one '
+                                               f'of ["cramers_v", "PSI"], received: {categorical_drift_method}')
+                calc_score = partial(_counters_drift, method=method, ignore_na=ignore_na,
+                                     min_category_size_ratio=min_category_size_ratio,
+                                     max_num_categories=max_num_categories_for_drift, sort_by=sort_by)
+                n_reference = reference_sketch.n - (reference_sketch.n_nulls if ignore_na else 0)
+                n_samples = sketch.n - (sketch.n_nulls if ignore_na else 0)
+
+            score = calc_score(reference_sketch, sketch) if min(n_reference, n_samples) >= min_samples else None
+            results[column] = {'Drift score': score, 'Method': method}
+        return results
+
+
+def _sketches_ks(sketch1: QuantileSketch, sketch2: QuantileSketch) -> float:
+    """Calculate the Kolmogorov-Smirnov statistic of the distributions of two sketches."""
+    # The largest difference between the empirical CDFs is at one of the values, as in the exact calculation
+    values = np.concatenate([sketch1.weighted_values()[0], sketch2.weighted_values()[0]])
+    return float(np.max(np.abs(sketch1.cdf(values) - sketch2.cdf(values))))
+
+
+def _sketches_emd(sketch1: QuantileSketch, sketch2: QuantileSketch, margin_quantile_filter: float) -> float:
+    """Calculate the Earth Mover's Distance of the distributions of two sketches, scaled to [0, 1]."""
+    filtered = []
+    for sketch in (sketch1, sketch2):
+        values, weights = sketch.weighted_values()
+        if margin_quantile_filter != 0:
+            qt_min, qt_max = sketch.quantile([margin_quantile_filter, 1 - margin_quantile_filter])
+            in_margins = (values >= qt_min) & (values <= qt_max)
+            values, weights = values[in_margins], weights[in_margins]
+        filtered.append((values, weights))
+
+    val_min = min(values.min() for values, _ in filtered)
+    val_max = max(values.max() for values, _ in filtered)
+    if val_max == val_min:
+        return 0
+    (values1, weights1), (values2, weights2) = filtered
+    return wasserstein_distance((values1 - val_min) / (val_max - val_min), (values2 - val_min) / (val_max - val_min),
+                                weights1, weights2)
+
+
+def _counters_drift(counter1: CategoryCounter, counter2: CategoryCounter, method: str, ignore_na: bool,
+                    min_category_size_ratio: float, max_num_categories: t.Optional[int], sort_by: str) -> float:
+    """Calculate the Cramer's V or the PSI of the distributions of two category counters."""
+    dist1_counts, dist2_counts, categories = preprocess_2_cat_counts_to_same_bins(
+        counter1.to_counter(ignore_na), counter2.to_counter(ignore_na), min_category_size_ratio, max_num_categories,
+        sort_by
+    )
+    if method == 'PSI':
+        return psi(dist1_counts, dist2_counts, from_freqs=True)
+    if len(categories) == 1:  # If the distributions have the same single value
+        return 0
+    dist1_counts, dist2_counts = _balance_sizes_downsizing(dist1_counts, dist2_counts)
+    return cramers_v(dist1_counts, dist2_counts, from_freqs=True)
@@ -9,15 +9,20 @@
 # ----------------------------------------------------------------------------
 #
 """Module for calculating distance matrix via Gower method."""
-from typing import Hashable, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, List
 
 import numpy as np
 import pandas as pd
 
-from deepchecks.utils.array_math import fast_sum_by_row
+from deepchecks.utils.parallel import effective_n_jobs
 
 
-def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
+# Maximal number of pairwise distances held in memory at once by each worker
+_MAX_DISTANCES_IN_BLOCK = 2 ** 22
+
+
+def gower_matrix(data: np.ndarray, cat_features: np.array, n_jobs: int = 1) -> np.ndarray:
     """
     Calculate distance matrix for a dataset using Gower's method.
 
@@ -33,6 +38,8 @@ def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
         Dataset matrix.
     cat_features: numpy.array
         Boolean array of representing which of the columns are categorical features.
+    n_jobs: int, default 1
+        Number of threads calculating blocks of rows of the matrix concurrently. -1 uses all available CPUs.
 
     Returns
     -------
@@ -42,22 +49,36 @@ def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
     if not isinstance(data, np.ndarray):
         data = np.asarray(data)
 
-    feature_ranges = np.ones(data.shape[1]) * -1
-    feature_ranges[~cat_features] = np.nanmax(data[:, ~cat_features], axis=0) - np.nanmin(data[:, ~cat_features],
-                                                                                          axis=0)
+    # handle categorical - transform to ordinal codes, where nulls are equal to each other (code -1)
+    cat_data = np.column_stack([pd.factorize(data[:, i])[0] for i in np.flatnonzero(cat_features)]) \
+        if cat_features.any() else np.zeros((data.shape[0], 0))
+    numeric_data = data[:, ~cat_features].astype('float64')
+    numeric_feature_ranges = np.nanmax(numeric_data, axis=0) - np.nanmin(numeric_data, axis=0)
 
     result = np.zeros((data.shape[0], data.shape[0]))
-    for i in range(data.shape[0]):
-        for j in range(i, data.shape[0]):
-            value = calculate_distance(data[i, :], data[j, :], feature_ranges)
-            result[i, j] = value
-            result[j, i] = value
+
+    def calculate_block(block: slice):
+        sum_dist = np.zeros((block.stop - block.start, data.shape[0]))
+        num_features = np.full(sum_dist.shape, cat_data.shape[1], dtype='float64')
+        for i in range(numeric_data.shape[1]):
+            feature_dist = np.abs(numeric_data[:, i] - numeric_data[block, i, np.newaxis])
+            # if a numeric feature value is null for one of the two samples, the feature is ignored
+            not_null_locations = ~np.isnan(feature_dist)
+            sum_dist += np.where(not_null_locations, feature_dist / numeric_feature_ranges[i], 0)
+            num_features += not_null_locations
+        for i in range(cat_data.shape[1]):
+            sum_dist += cat_data[:, i] != cat_data[block, i, np.newaxis]
+        result[block] = sum_dist / num_features
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _run_in_blocks(calculate_block, data.shape[0], data.shape[0], n_jobs)
 
     return result
 
 
 def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Hashable], numeric_cols: List[Hashable],
-                                          num_neighbors: int, samples_to_calc_neighbors_for: pd.DataFrame = None):
+                                          num_neighbors: int, samples_to_calc_neighbors_for: pd.DataFrame = None,
+                                          n_jobs: int = 1):
     """
     Calculate distance matrix for a dataset using Gower's method.
 
@@ -66,7 +87,8 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     categorical features it is an indicator whether the values are the same.
     See https://www.jstor.org/stable/2528823 for further details.
     This method minimizes memory usage by saving in memory and returning only the closest neighbors of each sample.
-    In addition, it can deal with missing values.
+    The distances are calculated in blocks of samples at a time, so the memory used by each worker is bounded
+    regardless of the dataset size. In addition, it can deal with missing values.
 
     Parameters
     ----------
@@ -82,6 +104,8 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     samples_to_calc_neighbors_for: pd.DataFrame, default None
         Samples for which to calculate nearest neighbors. If None, calculates for all given samples in data.
         These samples do not have to exist in data, but must share all relevant features.
+    n_jobs: int, default 1
+        Number of threads calculating blocks of samples concurrently. -1 uses all available CPUs.
 
     Returns
     -------
@@ -110,10 +134,6 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     numeric_feature_ranges = np.where(numeric_feature_ranges == 0, 1, numeric_feature_ranges)
     numeric_data = np.nan_to_num(numeric_data, nan=np.inf)
 
-    # do not warn on operations that include usage of math involving inf
-    original_error_state = np.geterr()['invalid']
-    np.seterr(invalid='ignore')
-
     if samples_to_calc_neighbors_for is not None:
         numeric_samples_to_calc_neighbors_for = numeric_data[num_samples:]
         cat_samples_to_calc_neighbors_for = cat_data[num_samples:]
@@ -124,34 +144,53 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
         numeric_samples_to_calc_neighbors_for = numeric_data
         cat_samples_to_calc_neighbors_for = cat_data
 
-    for i in range(num_indices_to_calc):  # TODO: parallelize this loop
-        numeric_sample_i = numeric_samples_to_calc_neighbors_for[i, :]
-        cat_sample_i = cat_samples_to_calc_neighbors_for[i, :]
-        dist_to_sample_i = _calculate_distances_to_sample(
-            categorical_sample=cat_sample_i, numeric_sample=numeric_sample_i, cat_data=cat_data,
+    def calculate_block(block: slice):
+        dist_to_samples = _calculate_distances_to_samples(
+            categorical_samples=cat_samples_to_calc_neighbors_for[block],
+            numeric_samples=numeric_samples_to_calc_neighbors_for[block], cat_data=cat_data,
             numeric_data=numeric_data, numeric_feature_ranges=numeric_feature_ranges, num_features=num_features
         )
         # sort to find the closest samples (including self)
-        min_dist_indexes = np.argpartition(dist_to_sample_i, num_neighbors)[:num_neighbors]
-        min_dist_indexes_ordered = sorted(min_dist_indexes, key=lambda x, arr=dist_to_sample_i: arr[x], reverse=False)
-        indexes[i, :] = min_dist_indexes_ordered
-        distances[i, :] = dist_to_sample_i[min_dist_indexes_ordered]
+        min_dist_indexes = np.argpartition(dist_to_samples, num_neighbors, axis=1)[:, :num_neighbors]
+        min_dist = np.take_along_axis(dist_to_samples, min_dist_indexes, axis=1)
+        order = np.argsort(min_dist, axis=1, kind='stable')
+        indexes[block] = np.take_along_axis(min_dist_indexes, order, axis=1)
+        distances[block] = np.take_along_axis(min_dist, order, axis=1)
+
+    # do not warn on operations that include usage of math involving inf
+    with np.errstate(invalid='ignore'):
+        _run_in_blocks(calculate_block, num_indices_to_calc, num_samples, n_jobs)
 
-    np.seterr(invalid=original_error_state)
     return np.nan_to_num(distances, nan=np.nan, posinf=np.nan, neginf=np.nan), indexes
 
 
-def _calculate_distances_to_sample(categorical_sample: np.ndarray, numeric_sample: np.ndarray, cat_data: np.ndarray,
-                                   numeric_data: np.ndarray, numeric_feature_ranges: np.ndarray, num_features: int):
+def _run_in_blocks(calculate_block: Callable[[slice], None], num_rows: int, row_length: int, n_jobs: int):
+    """Run the calculation over consecutive blocks of rows, so each block holds a bounded number of distances."""
+    block_size = max(1, _MAX_DISTANCES_IN_BLOCK // max(row_length, 1))
+    blocks = [slice(start, min(start + block_size, num_rows)) for start in range(0, num_rows, block_size)]
+    max_workers = effective_n_jobs(n_jobs)
+    if max_workers == 1 or len(blocks) == 1:
+        for block in blocks:
+            calculate_block(block)
+    else:
+        # numpy releases the GIL on the heavy array operations, so threads are enough to use multiple cores
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # consume the iterator in order to raise errors from the workers
+            list(pool.map(calculate_block, blocks))
+
+
+def _calculate_distances_to_samples(categorical_samples: np.ndarray, numeric_samples: np.ndarray,
+                                    cat_data: np.ndarray, numeric_data: np.ndarray,
+                                    numeric_feature_ranges: np.ndarray, num_features: int):
     """
-    Calculate Gower's distance between a single sample to the rest of the samples in the dataset.
+    Calculate Gower's distance between a block of samples to the rest of the samples in the dataset.
 
     Parameters
     ----------
-    categorical_sample
-        The categorical features part of the sample to compare to the rest of the samples.
-    numeric_sample
-        The numeric features part of the sample to compare to the rest of the samples.
+    categorical_samples
+        The categorical features part of the samples to compare to the rest of the samples.
+    numeric_samples
+        The numeric features part of the samples to compare to the rest of the samples.
     cat_data
         The categorical features part of the dataset(after preprocessing).
     numeric_data
@@ -163,21 +202,24 @@ def _calculate_distances_to_sample(categorical_sample: np.ndarray, numeric_sampl
     Returns
     -------
     numpy.ndarray
-        The distances to the rest of the samples.
+        The distances of each of the samples (rows) to the rest of the samples (columns).
     """
-    numeric_feat_dist_to_sample = numeric_data - numeric_sample
-    np.abs(numeric_feat_dist_to_sample, out=numeric_feat_dist_to_sample)
-    # if a numeric feature value is null for one of the two samples, the distance over it is ignored
-    null_dist_locations = np.logical_or(numeric_feat_dist_to_sample == np.inf, numeric_feat_dist_to_sample == np.nan)
-    null_numeric_features_per_sample = fast_sum_by_row(null_dist_locations)
-    numeric_feat_dist_to_sample[null_dist_locations] = 0
-    numeric_feat_dist_to_sample = numeric_feat_dist_to_sample.astype('float64')
-    np.divide(numeric_feat_dist_to_sample, numeric_feature_ranges, out=numeric_feat_dist_to_sample)
-
-    cat_feature_dist_to_sample = (cat_data - categorical_sample) != 0
-
-    dist_to_sample = fast_sum_by_row(cat_feature_dist_to_sample) + fast_sum_by_row(numeric_feat_dist_to_sample)
-    return dist_to_sample / (-null_numeric_features_per_sample + num_features)  # can have inf values
+    dist_to_samples = np.zeros((numeric_samples.shape[0], numeric_data.shape[0]))
+    null_numeric_features_per_pair = np.zeros(dist_to_samples.shape)
+    for i in range(numeric_data.shape[1]):
+        numeric_feat_dist = numeric_data[:, i] - numeric_samples[:, i, np.newaxis]
+        np.abs(numeric_feat_dist, out=numeric_feat_dist)
+        # if a numeric feature value is null for one of the two samples, the distance over it is ignored
+        null_dist_locations = numeric_feat_dist == np.inf
+        null_numeric_features_per_pair += null_dist_locations
+        numeric_feat_dist[null_dist_locations] = 0
+        np.divide(numeric_feat_dist, numeric_feature_ranges[i], out=numeric_feat_dist)
+        dist_to_samples += numeric_feat_dist
+
+    for i in range(cat_data.shape[1]):
+        dist_to_samples += cat_data[:, i] != categorical_samples[:, i, np.newaxis]
+
+    return dist_to_samples / (-null_numeric_features_per_pair + num_features)  # can have inf values
 
 
 def calculate_distance(vec1: np.array, vec2: np.array, range_per_feature: np.array) -> float:
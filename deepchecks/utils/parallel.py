@@ -0,0 +1,40 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Utils for running calculations in parallel."""
+import os
+import typing as t
+
+from deepchecks.core.errors import DeepchecksValueError
+
+__all__ = ['effective_n_jobs']
+
+
+def effective_n_jobs(n_jobs: t.Optional[int]) -> int:
+    """Return the number of workers to use for the given n_jobs, following the joblib convention.
+
+    Parameters
+    ----------
+    n_jobs : Optional[int]
+        Number of workers. None means 1, and negative values mean all the CPUs but (-n_jobs - 1), so -1 uses all
+        the CPUs and -2 all the CPUs but one.
+
+    Returns
+    -------
+    int
+        The number of workers, which is at least 1.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise DeepchecksValueError(f'n_jobs must be a non-zero integer or None, but got: {n_jobs}')
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
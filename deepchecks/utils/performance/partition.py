@@ -11,6 +11,7 @@
 """Module of functions to partition columns into segments."""
 from collections import defaultdict
 from copy import deepcopy
+from functools import partial
 from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
@@ -60,8 +61,16 @@ class DeepchecksFilter:
             return dataframe
 
 
+def _greater_than(df: pd.DataFrame, feature_name: Hashable, threshold: float) -> pd.Series:
+    return df[feature_name] > threshold
+
+
+def _less_or_equal(df: pd.DataFrame, feature_name: Hashable, threshold: float) -> pd.Series:
+    return df[feature_name] <= threshold
+
+
 class DeepchecksBaseFilter(DeepchecksFilter):
-    """Extend DeepchecksFilter class for feature range based filters.
+    """Extend DeepchecksFilter class for feature range based filters. The filters can be pickled.
 
     Parameters
     ----------
@@ -82,14 +91,14 @@ class DeepchecksBaseFilter(DeepchecksFilter):
     def add_filter(self, feature_name: str, threshold: float, greater_then: bool = True):
         """Add a filter by intersecting it with existing filter."""
         if greater_then:
-            filter_func = [lambda df, a=threshold: df[feature_name] > a]
+            filter_func = [partial(_greater_than, feature_name=feature_name, threshold=threshold)]
             if feature_name in self.filters.keys():
                 original_range = self.filters[feature_name]
                 self.filters[feature_name] = [max(threshold, original_range[0]), original_range[1]]
             else:
                 self.filters[feature_name] = [threshold, np.inf]
         else:
-            filter_func = [lambda df, a=threshold: df[feature_name] <= a]
+            filter_func = [partial(_less_or_equal, feature_name=feature_name, threshold=threshold)]
             if feature_name in self.filters.keys():
                 original_range = self.filters[feature_name]
                 self.filters[feature_name] = [original_range[0], min(threshold, original_range[1])]
@@ -21,21 +21,6 @@ from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.vision.metrics_utils.metric_mixin import MetricMixin, ObjectDetectionMetricMixin
 
 
-def _dict_conc(test_list):
-    result = defaultdict(list)
-
-    for i in range(len(test_list)):
-        current = test_list[i]
-        for key, value in current.items():
-            if isinstance(value, list):
-                for j in range(len(value)):
-                    result[key].append(value[j])
-            else:
-                result[key].append(value)
-
-    return result
-
-
 class AveragePrecisionRecall(Metric, MetricMixin):
     """Abstract class to calculate average precision and recall for various vision tasks.
 
@@ -81,7 +66,7 @@ class AveragePrecisionRecall(Metric, MetricMixin):
     def reset(self):
         """Reset metric state."""
         super().reset()
-        self._evals = defaultdict(lambda: {'scores': [], 'matched': [], 'NP': []})
+        self._evals = defaultdict(lambda: {'scores': [], 'matched': [], 'ignored': [], 'NP': []})
         self.i = 0
 
     @reinit__is_reduced
@@ -97,49 +82,30 @@ class AveragePrecisionRecall(Metric, MetricMixin):
         # now reduce accumulations
         sorted_classes = [int(class_id) for class_id in sorted(self._evals.keys())]
         max_class = max(sorted_classes)
+        results_shape = (len(self.iou_thresholds), len(self.area_ranges_names), len(self.max_detections_per_class),
+                         max_class + 1)
+        reses = {'precision': np.full(results_shape, np.nan), 'recall': np.full(results_shape, np.nan)}
+        classes_counts = np.full(results_shape, np.nan)
+
+        # run ap calculation per-class
         for class_id in sorted_classes:
             acc = self._evals[class_id]
-            acc['scores'] = _dict_conc(acc['scores'])
-            acc['matched'] = _dict_conc(acc['matched'])
-            acc['NP'] = _dict_conc(acc['NP'])
-        reses = {'precision': -np.ones((len(self.iou_thresholds),
-                                        len(self.area_ranges_names),
-                                        len(self.max_detections_per_class),
-                                        max_class + 1)),
-                 'recall': -np.ones((len(self.iou_thresholds),
-                                     len(self.area_ranges_names),
-                                     len(self.max_detections_per_class),
-                                     max_class + 1))}
-
-        classes_counts = -np.ones((len(self.iou_thresholds),
-                                   len(self.area_ranges_names),
-                                   len(self.max_detections_per_class),
-                                   max_class + 1))
-
-        for iou_i, min_iou in enumerate(self.iou_thresholds):
             for dets_i, dets in enumerate(self.max_detections_per_class):
                 for area_i, area_size in enumerate(self.area_ranges_names):
-                    precision_list = np.empty(max_class + 1)
-                    precision_list.fill(np.nan)
-                    recall_list = np.empty(max_class + 1)
-                    recall_list.fill(np.nan)
-                    counts_list = np.empty(max_class + 1)
-                    counts_list.fill(np.nan)
-
-                    # run ap calculation per-class
-                    for class_id in sorted_classes:
-                        ev = self._evals[class_id]
-                        class_counts = np.nansum(np.array(ev['NP'][(area_size, dets, min_iou)]))
-                        precision, recall = \
-                            self._compute_ap_recall(np.array(ev['scores'][(area_size, dets, min_iou)]),
-                                                    np.array(ev['matched'][(area_size, dets, min_iou)]),
-                                                    class_counts)
-                        precision_list[class_id] = precision
-                        recall_list[class_id] = recall
-                        counts_list[class_id] = np.nan if recall == -1 else class_counts
-                    reses['precision'][iou_i, area_i, dets_i] = precision_list
-                    reses['recall'][iou_i, area_i, dets_i] = recall_list
-                    classes_counts[iou_i, area_i, dets_i] = counts_list
+                    key = (area_size, dets)
+                    scores = np.concatenate([image_scores[key] for image_scores in acc['scores']])
+                    matched = np.concatenate([image_matched[key] for image_matched in acc['matched']], axis=1)
+                    ignored = np.concatenate([image_ignored[key] for image_ignored in acc['ignored']], axis=1)
+                    class_counts = sum(image_n_positives[key] for image_n_positives in acc['NP'])
+                    for iou_i in range(len(self.iou_thresholds)):
+                        # get score for non-ignored dts
+                        not_ignored = ~ignored[iou_i]
+                        precision, recall = self._compute_ap_recall(scores[not_ignored],
+                                                                    matched[iou_i][not_ignored],
+                                                                    class_counts)
+                        reses['precision'][iou_i, area_i, dets_i, class_id] = precision
+                        reses['recall'][iou_i, area_i, dets_i, class_id] = recall
+                        classes_counts[iou_i, area_i, dets_i, class_id] = np.nan if recall == -1 else class_counts
 
         if self.average == 'weighted':
             classes_counts = self.filter_res(classes_counts,
@@ -179,81 +145,91 @@ class AveragePrecisionRecall(Metric, MetricMixin):
             )
 
             acc = self._evals[class_id]
-            acc['scores'].append(image_evals['scores'])
-            acc['matched'].append(image_evals['matched'])
-            acc['NP'].append(image_evals['NP'])
+            for name, image_value in image_evals.items():
+                acc[name].append(image_value)
 
     def _evaluate_image(self, detections, ground_truths, ious):
-        """Evaluate image."""
+        """Evaluate image.
+
+        Returns the detections scores, and for every iou threshold whether each detection was matched and whether it
+        is ignored, per area range and max detections.
+        """
         # Sort detections by decreasing confidence
-        confidences = self.get_confidences(detections)
-        areas = self.get_detection_areas(detections)
+        confidences = np.asarray(self.get_confidences(detections))
+        areas = np.asarray(self.get_detection_areas(detections))
         sorted_confidence_ids = np.argsort(confidences, kind='stable')[::-1]
-        orig_ious = ious
-        orig_gt = ground_truths
-        ground_truth_area = np.array(self.get_labels_areas(ground_truths))
+        ground_truth_area = np.asarray(self.get_labels_areas(ground_truths))
+        ious = np.asarray(ious).reshape(len(confidences), len(ground_truth_area))
+
+        # The matching is greedy by decreasing confidence, so the matches of the top n detections are the same for
+        # any max detections, and are calculated once for the largest one
+        top_detections_idx = sorted_confidence_ids[:max(self.max_detections_per_class)]
+        top_confidences = confidences[top_detections_idx]
+        top_ious = ious[top_detections_idx]
 
         scores = {}
         matched = {}
+        ignored = {}
         n_gts = {}
-        for top_n_detections in self.max_detections_per_class:
-            for area_size in self.area_ranges_names:
-                # sort list of dts and chop by max dets
-                top_detections_idx = sorted_confidence_ids[:top_n_detections]
-                ious = orig_ious[top_detections_idx]
-                ground_truth_to_ignore = [self._is_ignore_area(gt_area, area_size) for gt_area in ground_truth_area]
-
-                # sort gts by ignore last
-                gt_sort = np.argsort(ground_truth_to_ignore, kind='stable')
-                ground_truths = [orig_gt[idx] for idx in gt_sort]
-                ground_truth_to_ignore = [ground_truth_to_ignore[idx] for idx in gt_sort]
-
-                ious = ious[:, gt_sort]
-                for min_iou in self.iou_thresholds:
-                    detection_matches = \
-                        self._get_best_matches(top_detections_idx, min_iou, ground_truths, ground_truth_to_ignore, ious)
-
-                    # generate ignore list for dts
-                    detections_to_ignore = [
-                        ground_truth_to_ignore[detection_matches[d_idx]] if d_idx in detection_matches
-                        else self._is_ignore_area(areas[real_index], area_size)
-                        for d_idx, real_index in enumerate(top_detections_idx)
-                    ]
-
-                    # get score for non-ignored dts
-                    scores[(area_size, top_n_detections, min_iou)] = \
-                        [confidences[real_index] for d_idx, real_index in enumerate(top_detections_idx)
-                         if not detections_to_ignore[d_idx]]
-                    matched[(area_size, top_n_detections, min_iou)] = \
-                        [d_idx in detection_matches for d_idx, real_index in enumerate(top_detections_idx)
-                         if not detections_to_ignore[d_idx]]
-                    n_gts[(area_size, top_n_detections, min_iou)] = \
-                        len([g_idx for g_idx in range(len(ground_truths)) if not ground_truth_to_ignore[g_idx]])
-        return {'scores': scores, 'matched': matched, 'NP': n_gts}
-
-    def _get_best_matches(self, dt, min_iou, ground_truths, ground_truth_to_ignore, ious):
-        ground_truth_matched = {}
-        detection_matches = {}
-
-        for d_idx in range(len(dt)):
-            # information about best match so far (best_match=-1 -> unmatched)
-            best_iou = min(min_iou, 1 - 1e-10)
-            best_match = -1
-            for g_idx in range(len(ground_truths)):
-                # if this gt already matched, continue
-                if g_idx in ground_truth_matched:
-                    continue
-                # if dt matched and currently on ignore gt, stop
-                # this exists to allow for matching ignored ground truth, so that we ignore this detection
-                if best_match > -1 and ground_truth_to_ignore[g_idx]:
-                    break
-
-                if ious[d_idx, g_idx] >= best_iou:
-                    best_iou = ious[d_idx, g_idx]
-                    best_match = g_idx
-            if best_match != -1:
-                detection_matches[d_idx] = best_match
-                ground_truth_matched[best_match] = d_idx
+        for area_size in self.area_ranges_names:
+            ground_truth_to_ignore = self._is_ignore_area(ground_truth_area, area_size)
+
+            # sort gts by ignore last
+            gt_sort = np.argsort(ground_truth_to_ignore, kind='stable')
+            ground_truth_to_ignore = ground_truth_to_ignore[gt_sort]
+
+            # matched ground truth index per iou threshold and detection, -1 for unmatched detections
+            detection_matches = self._get_best_matches(top_ious[:, gt_sort], ground_truth_to_ignore)
+            is_matched = detection_matches > -1
+
+            # generate ignore list for dts, unmatched dts index the appended False and use their own area
+            detections_to_ignore = np.where(
+                is_matched,
+                np.append(ground_truth_to_ignore, False)[detection_matches],
+                self._is_ignore_area(areas[top_detections_idx], area_size)
+            )
+            n_not_ignored_gts = int(np.count_nonzero(~ground_truth_to_ignore))
+
+            # chop by max dets
+            for top_n_detections in self.max_detections_per_class:
+                scores[(area_size, top_n_detections)] = top_confidences[:top_n_detections]
+                matched[(area_size, top_n_detections)] = is_matched[:, :top_n_detections]
+                ignored[(area_size, top_n_detections)] = detections_to_ignore[:, :top_n_detections]
+                n_gts[(area_size, top_n_detections)] = n_not_ignored_gts
+        return {'scores': scores, 'matched': matched, 'ignored': ignored, 'NP': n_gts}
+
+    def _get_best_matches(self, ious, ground_truth_to_ignore):
+        """Greedily match the detections to the ground truths for all the iou thresholds at once.
+
+        Detections are expected to be sorted by decreasing confidence, and ground truths with the ignored ones last.
+        Returns an array of shape (number of iou thresholds, number of detections) holding the index of the ground
+        truth matched to each detection, or -1 for unmatched detections.
+        """
+        n_detections, n_ground_truths = ious.shape
+        min_ious = np.minimum(self.iou_thresholds, 1 - 1e-10)[:, np.newaxis]
+        detection_matches = np.full((len(min_ious), n_detections), -1)
+        if n_ground_truths == 0:
+            return detection_matches
+
+        ground_truth_matched = np.zeros((len(min_ious), n_ground_truths), dtype=bool)
+        thresholds_idx = np.arange(len(min_ious))
+        for d_idx in range(n_detections):
+            candidates = ~ground_truth_matched & (ious[d_idx] >= min_ious)
+            if not candidates.any():
+                continue
+            # a detection is matched to the not ignored ground truth with the highest iou (the last one on ties), and
+            # only if there is none, to the first ignored ground truth, which causes the detection to be ignored
+            not_ignored_candidates = candidates & ~ground_truth_to_ignore
+            ignored_candidates = candidates & ground_truth_to_ignore
+            masked_ious = np.where(not_ignored_candidates, ious[d_idx], -np.inf)
+            best_not_ignored = n_ground_truths - 1 - np.argmax(masked_ious[:, ::-1], axis=1)
+            first_ignored = np.argmax(ignored_candidates, axis=1)
+            matches = np.where(not_ignored_candidates.any(axis=1), best_not_ignored,
+                               np.where(ignored_candidates.any(axis=1), first_ignored, -1))
+
+            detection_matches[:, d_idx] = matches
+            is_matched = matches > -1
+            ground_truth_matched[thresholds_idx[is_matched], matches[is_matched]] = True
         return detection_matches
 
     def _compute_ap_recall(self, scores, matched, n_positives, recall_thresholds=None):
@@ -284,21 +260,21 @@ class AveragePrecisionRecall(Metric, MetricMixin):
 
             rec_idx = np.searchsorted(rc, recall_thresholds, side='left')
 
-            # get interpolated precision values at the evaluation thresholds
-            i_pr = np.array([i_pr[r] if r < len(i_pr) else 0 for r in rec_idx])
+            # get interpolated precision values at the evaluation thresholds, 0 for thresholds above the max recall
+            i_pr = np.append(i_pr, 0)[np.minimum(rec_idx, len(i_pr))]
 
             return np.mean(i_pr), rc[-1]
         return 0, 0
 
     def _is_ignore_area(self, area_bb, area_size):
-        """Generate ignored gt list by area_range."""
+        """Generate ignored gt list by area_range, for a single area or an array of areas."""
         if area_size == 'small':
-            return not area_bb < self.area_range[0]
+            return np.logical_not(area_bb < self.area_range[0])
         if area_size == 'medium':
-            return not self.area_range[0] <= area_bb <= self.area_range[1]
+            return np.logical_not((self.area_range[0] <= area_bb) & (area_bb <= self.area_range[1]))
         if area_size == 'large':
-            return not area_bb > self.area_range[1]
-        return False
+            return np.logical_not(area_bb > self.area_range[1])
+        return np.zeros_like(area_bb, dtype=bool)
 
     def filter_res(self, res: np.ndarray, iou: float = None, area: str = None, max_dets: int = None):
         """Get the value of a result by the filtering values.
@@ -50,8 +50,53 @@ def jaccard_iou(dt: np.array, gt: np.array):
     return intersection / (dt_area + gt_area - intersection)
 
 
+def jaccard_iou_matrix(detected, ground_truth) -> np.ndarray:
+    """Calculate the jaccard IoU between every detection and every ground truth.
+
+    Parameters
+    ----------
+    detected: Sequence[np.array]
+        Detections in the shape of [x, y, width, height, confidence, class]
+    ground_truth: Sequence[np.array]
+        Ground Truths in the shape of [class, x, y, width, height]
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of shape (len(detected), len(ground_truth)), equal to applying jaccard_iou on every pair.
+    """
+    ious = np.zeros((len(detected), len(ground_truth)))
+    if len(detected) == 0 or len(ground_truth) == 0:
+        return ious
+    detected = np.asarray(detected)
+    ground_truth = np.asarray(ground_truth)
+    x_dt, y_dt, w_dt, h_dt = (detected[:, i, np.newaxis] for i in range(4))
+    x_gt, y_gt, w_gt, h_gt = (ground_truth[np.newaxis, :, i] for i in range(1, 5))
+
+    x2_dt, y2_dt = x_dt + w_dt, y_dt + h_dt
+    x2_gt, y2_gt = x_gt + w_gt, y_gt + h_gt
+
+    # innermost left x, innermost right x and same for y
+    xi = np.where(x_dt > x_gt, x_dt, x_gt)
+    x2i = np.where(x2_dt < x2_gt, x2_dt, x2_gt)
+    yi = np.where(y_dt > y_gt, y_dt, y_gt)
+    y2i = np.where(y2_dt < y2_gt, y2_dt, y2_gt)
+
+    # calculate areas
+    dt_area = w_dt * h_dt
+    gt_area = w_gt * h_gt
+    iwidth = np.where(x2i > xi, x2i - xi, 0)
+    ihight = np.where(y2i > yi, y2i - yi, 0)
+    intersection = iwidth * ihight
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ious[:] = intersection / (dt_area + gt_area - intersection)
+    return ious
+
+
 def compute_pairwise_ious(detected, ground_truth, iou_func):
     """Compute pairwise ious between detections and ground truth."""
+    if iou_func is jaccard_iou:
+        return jaccard_iou_matrix(detected, ground_truth)
     ious = np.zeros((len(detected), len(ground_truth)))
     for g_idx, g in enumerate(ground_truth):
         for d_idx, d in enumerate(detected):
@@ -11,6 +11,7 @@
 """Module for base vision abstractions."""
 # pylint: disable=broad-except,not-callable
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from typing import Dict, Optional, Tuple, Union
 
@@ -21,11 +22,12 @@ from deepchecks.core.checks import DatasetKind
 from deepchecks.core.errors import DeepchecksNotSupportedError
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.utils.ipython import ProgressBarGroup
+from deepchecks.utils.parallel import effective_n_jobs
 from deepchecks.vision._shared_docs import docstrings
 from deepchecks.vision.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
 from deepchecks.vision.context import Context
 from deepchecks.vision.vision_data import VisionData
-from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
+from deepchecks.vision.vision_data.batch_wrapper import iter_prefetched_batches
 
 __all__ = ['Suite']
 
@@ -46,7 +48,9 @@ class Suite(BaseSuite):
             random_state: int = 42,
             with_display: bool = True,
             max_samples: Optional[int] = None,
-            run_single_dataset: Optional[str] = None
+            run_single_dataset: Optional[str] = None,
+            prefetch_batches: int = 0,
+            n_jobs: int = 1
     ) -> SuiteResult:
         """Run all checks.
 
@@ -63,6 +67,12 @@ class Suite(BaseSuite):
             determined by the n_samples argument.
         run_single_dataset: Optional[str], default None
             'Train', 'Test' , or None to run on both train and test.
+        prefetch_batches : int , default: 0
+            Number of batches loaded ahead by a background thread while the checks are updated on the current batch.
+            If 0, the batches are loaded one after another by the main thread.
+        n_jobs : int , default: 1
+            Number of threads used to update the checks on each batch concurrently. -1 uses all cpus.
+            A check that fails on update is isolated into a CheckFailure as when updating sequentially.
 
         Returns
         -------
@@ -104,7 +114,8 @@ class Suite(BaseSuite):
                 self._update_loop(context=context, train_test_checks=train_test_checks,
                                   single_dataset_checks=single_dataset_checks_train, results=results,
                                   dataset_kind=DatasetKind.TRAIN, progressbar_factory=progressbar_factory,
-                                  max_samples=max_samples)
+                                  max_samples=max_samples, prefetch_batches=prefetch_batches,
+                                  n_jobs=n_jobs)
 
             if test_dataset is not None:
                 for name, check in list(single_dataset_checks_test.items()):
@@ -116,7 +127,8 @@ class Suite(BaseSuite):
                 self._update_loop(context=context, train_test_checks=train_test_checks,
                                   single_dataset_checks=single_dataset_checks_test, results=results,
                                   dataset_kind=DatasetKind.TEST, progressbar_factory=progressbar_factory,
-                                  max_samples=max_samples)
+                                  max_samples=max_samples, prefetch_batches=prefetch_batches,
+                                  n_jobs=n_jobs)
 
             # Need to compute only on not SingleDatasetCheck, since they computed inside the loop
             progress_bar = progressbar_factory.create(iterable=list(train_test_checks.items()), unit='Check',
@@ -135,29 +147,48 @@ class Suite(BaseSuite):
 
     @classmethod
     def _update_loop(cls, context: Context, dataset_kind: DatasetKind, results: Dict[Union[str, int], BaseCheckResult],
-                     progressbar_factory: ProgressBarGroup, train_test_checks, single_dataset_checks, max_samples):
+                     progressbar_factory: ProgressBarGroup, train_test_checks, single_dataset_checks, max_samples,
+                     prefetch_batches: int = 0, n_jobs: int = 1):
         checks_to_update = {**train_test_checks, **single_dataset_checks}
         vision_data = context.get_data_by_kind(dataset_kind)
 
+        def update_check(check, batch) -> Optional[Exception]:
+            try:
+                check.update(context, batch, dataset_kind=dataset_kind)
+                return None
+            except Exception as exp:
+                return exp
+
+        max_workers = effective_n_jobs(n_jobs)
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers != 1 else None
+
         # Update loop over the batches
         with progressbar_factory.create_dummy(name='Processing Batches:' + vision_data.name):
-            for batch in vision_data:
-                batch = BatchWrapper(batch, vision_data.task_type, vision_data.number_of_images_cached)
-                vision_data.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
-                for name, check in list(checks_to_update.items()):
-                    try:
-                        check.update(context, batch, dataset_kind=dataset_kind)
-                        if vision_data.number_of_images_cached > np.min((max_samples, check.n_samples or np.inf)):
-                            checks_to_update.pop(name)
-                    except Exception as exp:
-                        results[name] = CheckFailure(check, exp, vision_data.name)
-                        checks_to_update.pop(name)
-                        if name in single_dataset_checks:
-                            single_dataset_checks.pop(name)
+            try:
+                for batch in iter_prefetched_batches(vision_data, prefetch_batches):
+                    vision_data.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
+                    checks = list(checks_to_update.items())
+                    # The checks are independent of each other, so their updates on the batch can run concurrently
+                    if executor is not None and len(checks) > 1:
+                        errors = list(executor.map(update_check, [check for _, check in checks], [batch] * len(checks)))
+                    else:
+                        errors = [update_check(check, batch) for _, check in checks]
+                    for (name, check), exp in zip(checks, errors):
+                        if exp is None:
+                            if vision_data.number_of_images_cached > np.min((max_samples, check.n_samples or np.inf)):
+                                checks_to_update.pop(name)
                         else:
-                            train_test_checks.pop(name)
-                if len(checks_to_update) == 0:
-                    break
+                            results[name] = CheckFailure(check, exp, vision_data.name)
+                            checks_to_update.pop(name)
+                            if name in single_dataset_checks:
+                                single_dataset_checks.pop(name)
+                            else:
+                                train_test_checks.pop(name)
+                    if len(checks_to_update) == 0:
+                        break
+            finally:
+                if executor is not None:
+                    executor.shutdown()
 
         # Compute for single dataset checks
         checks_pbar = progressbar_factory.create(iterable=list(single_dataset_checks.items()), unit='Check',
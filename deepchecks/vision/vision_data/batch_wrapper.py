@@ -9,7 +9,9 @@
 # ----------------------------------------------------------------------------
 #
 """Contains code for BatchWrapper."""
-from typing import Dict, List, Optional, Union
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 
@@ -19,7 +21,12 @@ from deepchecks.vision.utils.image_properties import calc_default_image_properti
 from deepchecks.vision.utils.vision_properties import PropertiesInputType, calc_vision_properties, validate_properties
 from deepchecks.vision.vision_data.utils import BatchOutputFormat, TaskType, sequence_to_numpy
 
-__all__ = ['BatchWrapper']
+if TYPE_CHECKING:
+    from deepchecks.vision.vision_data.vision_data import VisionData
+
+__all__ = ['BatchWrapper', 'iter_prefetched_batches']
+
+_END_OF_BATCHES = object()
 
 
 class BatchWrapper:
@@ -30,6 +37,10 @@ class BatchWrapper:
         self._batch = batch
         self._labels, self._predictions, self._images = None, None, None
         self._embeddings, self._additional_data, = None, None
+        # Checks read the same batch many times, so each numpy conversion is done once and kept with the batch.
+        # The lock makes sure of it when the checks are updated concurrently.
+        self._numpy_cache = {}
+        self._numpy_cache_lock = threading.RLock()
         self._image_identifiers = batch.get('image_identifiers')
         # if there are no image identifiers, use the number of the image in loading process as identifier
         if self._image_identifiers is None:
@@ -37,6 +48,27 @@ class BatchWrapper:
 
         self._vision_properties_cache = dict.fromkeys(PropertiesInputType)
 
+    def _cached_numpy(self, key: str, convert: Callable[[], Any]):
+        if key not in self._numpy_cache:
+            with self._numpy_cache_lock:
+                if key not in self._numpy_cache:
+                    self._numpy_cache[key] = convert()
+        return self._numpy_cache[key]
+
+    def materialize(self) -> 'BatchWrapper':
+        """Convert all the data of the batch to numpy format at once, so later accesses don't convert it again.
+
+        Conversions which fail are not cached, so they are done again, and raise their error, when the data is
+        accessed. That way the error fails only the checks which use that data, as it does without materializing.
+        """
+        for name in ('numpy_images', 'numpy_labels', 'numpy_predictions', 'numpy_embeddings',
+                     'numpy_additional_data', 'numpy_image_identifiers'):
+            try:
+                getattr(self, name)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        return self
+
     def _get_relevant_data_for_properties(self, input_type: PropertiesInputType):
         result = []
         if input_type == PropertiesInputType.PARTIAL_IMAGES:
@@ -101,7 +133,8 @@ class BatchWrapper:
     def numpy_labels(self) -> List[Union[np.ndarray, int]]:
         """Return labels for the batch in numpy format."""
         required_dim = 0 if self._task_type == TaskType.CLASSIFICATION else 2
-        return sequence_to_numpy(self.original_labels, expected_ndim_per_object=required_dim)
+        return self._cached_numpy('labels', lambda: sequence_to_numpy(self.original_labels,
+                                                                      expected_ndim_per_object=required_dim))
 
     @property
     def original_predictions(self):
@@ -121,7 +154,8 @@ class BatchWrapper:
             required_dim = 3
         else:
             required_dim = None
-        return sequence_to_numpy(self.original_predictions, expected_ndim_per_object=required_dim)
+        return self._cached_numpy('predictions', lambda: sequence_to_numpy(self.original_predictions,
+                                                                           expected_ndim_per_object=required_dim))
 
     @property
     def original_images(self):
@@ -133,7 +167,7 @@ class BatchWrapper:
     @property
     def numpy_images(self) -> List[Union[np.ndarray]]:
         """Return images for the batch in numpy format."""
-        return sequence_to_numpy(self.original_images, 'uint8', 3)
+        return self._cached_numpy('images', lambda: sequence_to_numpy(self.original_images, 'uint8', 3))
 
     @property
     def original_embeddings(self):
@@ -145,7 +179,7 @@ class BatchWrapper:
     @property
     def numpy_embeddings(self) -> List[Union[np.ndarray]]:
         """Return embedding for the batch in numpy format."""
-        return sequence_to_numpy(self.original_embeddings, 'float32')
+        return self._cached_numpy('embeddings', lambda: sequence_to_numpy(self.original_embeddings, 'float32'))
 
     @property
     def original_additional_data(self):
@@ -157,7 +191,7 @@ class BatchWrapper:
     @property
     def numpy_additional_data(self):
         """Return additional data for the batch in numpy format."""
-        return sequence_to_numpy(self.original_additional_data)
+        return self._cached_numpy('additional_data', lambda: sequence_to_numpy(self.original_additional_data))
 
     @property
     def original_image_identifiers(self):
@@ -167,7 +201,8 @@ class BatchWrapper:
     @property
     def numpy_image_identifiers(self) -> List[Union[str, int]]:
         """Return image identifiers for the batch in numpy format."""
-        return sequence_to_numpy(self.original_image_identifiers, 'str', 0)
+        return self._cached_numpy('image_identifiers',
+                                  lambda: sequence_to_numpy(self.original_image_identifiers, 'str', 0))
 
     def __len__(self):
         """Return length of batch."""
@@ -175,3 +210,66 @@ class BatchWrapper:
             self.numpy_predictions is not None else self.numpy_labels if self.numpy_labels is not None else \
             self.numpy_embeddings if self.numpy_embeddings is not None else self.numpy_additional_data
         return len(data)
+
+
+def iter_prefetched_batches(vision_data: 'VisionData', prefetch_depth: int = 0) -> Iterator[BatchWrapper]:
+    """Iterate over the batches of the vision data, wrapped in BatchWrapper.
+
+    When prefetch_depth is positive, the batches are loaded and converted to numpy by a background thread which stays
+    up to prefetch_depth batches ahead of the consumer, so preparing the next batches overlaps with processing the
+    current one.
+    Exceptions raised by the batch loader are raised by the iterator, as without prefetching, while failures to convert
+    the data of a batch are raised only when the data is accessed, by the checks using it.
+
+    Parameters
+    ----------
+    vision_data : VisionData
+        The vision data to iterate over.
+    prefetch_depth : int, default: 0
+        Maximal number of batches loaded ahead of the consumer. If 0, the batches are loaded by the calling thread.
+    """
+    if prefetch_depth <= 0:
+        for batch in vision_data:
+            yield BatchWrapper(batch, vision_data.task_type, vision_data.number_of_images_cached)
+        return
+
+    batches_queue = queue.Queue(maxsize=prefetch_depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batches_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def load_batches():
+        # The consumer updates the vision data cache only after processing a batch, so the number of images seen
+        # is counted here in order to give the prefetched batches the same image identifiers
+        images_seen_num = vision_data.number_of_images_cached
+        try:
+            for batch in vision_data:
+                batch = BatchWrapper(batch, vision_data.task_type, images_seen_num)
+                images_seen_num += len(batch)
+                batch.materialize()
+                if not put((batch, None)):
+                    return
+            put((_END_OF_BATCHES, None))
+        except Exception as exp:  # pylint: disable=broad-except
+            put((None, exp))
+
+    loader_thread = threading.Thread(target=load_batches, name='deepchecks-batch-prefetch', daemon=True)
+    loader_thread.start()
+    try:
+        while True:
+            batch, exp = batches_queue.get()
+            if exp is not None:
+                raise exp
+            if batch is _END_OF_BATCHES:
+                return
+            yield batch
+    finally:
+        stop.set()
+        loader_thread.join()
@@ -14,7 +14,7 @@ import typing as t
 import numpy as np
 import pandas as pd
 from hamcrest import (all_of, assert_that, calling, contains_exactly, equal_to, greater_than, has_item, has_length,
-                      has_property, has_string, instance_of, is_, not_none, raises)
+                      has_property, has_string, instance_of, is_, is_not, not_none, raises, same_instance)
 from sklearn.datasets import load_iris, make_classification
 
 from deepchecks.core.errors import DeepchecksValueError
@@ -816,6 +816,70 @@ def test_sample_drop_nan_labels(iris):
     assert_that(sample, has_length(50))
 
 
+def test_sample_with_random_state_is_cached(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target', cat_features=[])
+    # Act
+    sample = dataset.sample(50, random_state=0)
+    # Assert
+    assert_that(dataset.sample(50, random_state=0).data.equals(sample.data), equal_to(True))
+    assert_that(dataset.sample(50, random_state=0), is_not(same_instance(sample)))
+    assert_that(dataset.sample(50, random_state=1).data.equals(sample.data), equal_to(False))
+    assert_that(sample.data.equals(iris.sample(50, random_state=0)), equal_to(True))
+    assert_that(sample.features, equal_to(dataset.features))
+    assert_that(sample.cat_features, equal_to(dataset.cat_features))
+    assert_that(sample.numerical_features, equal_to(dataset.numerical_features))
+    assert_that(sample.label_name, equal_to(dataset.label_name))
+
+
+def test_sample_with_random_state_after_editing_values(iris):
+    # Arrange
+    dataset = Dataset(iris.copy(), label='target', cat_features=[])
+    sample = dataset.sample(50, random_state=0)
+    sample.data['petal length (cm)'] = 0
+    # Act
+    dataset.data['sepal length (cm)'] *= 1000
+    new_sample = dataset.sample(50, random_state=0)
+    # Assert
+    assert_that(new_sample.data.index.tolist(), equal_to(sample.data.index.tolist()))
+    assert_that(new_sample.data['sepal length (cm)'].min(), greater_than(1000))
+    assert_that(new_sample.data['petal length (cm)'].equals(iris.loc[sample.data.index, 'petal length (cm)']),
+                equal_to(True))
+
+
+def test_sample_cache_reset_on_index_change(iris):
+    # Arrange
+    dataset = Dataset(iris.copy(), label='target')
+    sample = dataset.sample(50, random_state=0)
+    # Act
+    dataset.data.index = [f'row-{i}' for i in dataset.data.index]
+    new_sample = dataset.sample(50, random_state=0)
+    # Assert
+    assert_that(new_sample, is_not(same_instance(sample)))
+    assert_that(set(new_sample.data.index).issubset(set(dataset.data.index)), equal_to(True))
+
+
+def test_sample_with_replacement(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    # Act
+    sample = dataset.sample(300, replace=True, random_state=0)
+    # Assert
+    assert_that(sample, has_length(150))
+    assert_that(sample.data.index.is_unique, equal_to(True))
+
+
+def test_sample_with_datetime_from_index():
+    # Arrange
+    df = pd.DataFrame({'a': range(100), 'b': range(100)},
+                      index=pd.date_range('2020-01-01', periods=100, name='date'))
+    dataset = Dataset(df, set_datetime_from_dataframe_index=True, cat_features=[])
+    # Act
+    sample = dataset.sample(10, random_state=0)
+    # Assert
+    assert_that(list(sample.datetime_col), equal_to(list(sample.data.index)))
+
+
 def test__ensure_not_empty_dataset__with_empty_dataset():
     # Assert
     assert_that(
@@ -0,0 +1,71 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Contains unit tests for the lazy import of the deepchecks package."""
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from hamcrest import assert_that, equal_to, less_than
+
+import deepchecks
+from deepchecks.analytics import anonymous_telemetry
+
+
+def test_import_does_not_load_subpackages():
+    # Arrange
+    code = 'import sys, deepchecks; ' \
+           'print(any(m in sys.modules for m in ("deepchecks.tabular", "deepchecks.core", "plotly", "matplotlib")))'
+
+    # Act
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+
+    # Assert
+    assert_that(output.strip(), equal_to('False'))
+
+
+def test_lazy_attributes():
+    from deepchecks.core import CheckResult
+    from deepchecks.tabular import Dataset
+
+    assert_that(deepchecks.CheckResult, equal_to(CheckResult))
+    assert_that(deepchecks.tabular.Dataset, equal_to(Dataset))
+    with pytest.warns(DeprecationWarning, match='Ability to import base tabular functionality'):
+        assert_that(deepchecks.Dataset, equal_to(Dataset))
+    with pytest.raises(AttributeError):
+        _ = deepchecks.NotExistingAttribute
+
+
+def test_validate_latest_version_does_not_block(monkeypatch, tmp_path):
+    # Arrange
+    connection_started = threading.Event()
+    release_connection = threading.Event()
+
+    class SlowConnection:
+        def __init__(self, *args, **kwargs):
+            connection_started.set()
+            release_connection.wait(5)
+            raise ConnectionError()
+
+    monkeypatch.setattr(anonymous_telemetry, 'ANALYTICS_DISABLED', False)
+    monkeypatch.setattr(anonymous_telemetry, 'MODULE_DIR', tmp_path)
+    monkeypatch.setattr(anonymous_telemetry.http.client, 'HTTPSConnection', SlowConnection)
+
+    # Act
+    start = time.time()
+    anonymous_telemetry.validate_latest_version()
+    duration = time.time() - start
+
+    # Assert
+    assert_that(duration, less_than(1))
+    assert_that(connection_started.wait(5))
+    release_connection.set()
@@ -12,7 +12,7 @@
 import pytest
 from hamcrest import *
 
-from transformers import GPT2Tokenizer
+from transformers import BertTokenizerFast, GPT2Tokenizer
 
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.nlp.checks import UnknownTokens
@@ -176,6 +176,51 @@ def test_with_more_robust_tokenizer(dataset_with_unknown_tokens):
     assert_that(len(result.value['unknown_word_details']), equal_to(0))
 
 
+def test_with_fast_tokenizer(dataset_with_reoccurring_unknown_words):
+    # Arrange
+    check = UnknownTokens()
+    fast_check = UnknownTokens(tokenizer=BertTokenizerFast.from_pretrained('bert-base-uncased'))
+
+    # Act
+    result = check.run(dataset=dataset_with_reoccurring_unknown_words)
+    fast_result = fast_check.run(dataset=dataset_with_reoccurring_unknown_words)
+
+    # Assert
+    assert_that(fast_result.value, equal_to(result.value))
+    assert_that(fast_result.value['unknown_word_details'], has_entries({
+        "˚implicit": has_entries({"indexes": contains_exactly(0, 3)}),
+    }))
+
+
+def test_tokenizer_called_once_per_distinct_word(dataset_with_reoccurring_unknown_words):
+    # Arrange
+    class CountingTokenizer:
+        unk_token_id = 0
+        name_or_path = 'counting'
+
+        def __init__(self):
+            self.tokenized_words = []
+
+        def tokenize(self, word):
+            self.tokenized_words.append(word)
+            return [word]
+
+        def convert_tokens_to_ids(self, tokens):
+            return [0 if '˚' in token else 1 for token in tokens]
+
+    tokenizer = CountingTokenizer()
+    check = UnknownTokens(tokenizer=tokenizer)
+
+    # Act
+    result = check.run(dataset=dataset_with_reoccurring_unknown_words)
+
+    # Assert
+    assert_that(tokenizer.tokenized_words, has_length(len(set(tokenizer.tokenized_words))))
+    assert_that(result.value['unknown_word_details'], has_entries({
+        "˚implicit": has_entries({"indexes": contains_exactly(0, 3)}),
+    }))
+
+
 def test_for_illegal_tokenizer(dataset_with_unknown_tokens):
     # Arrange
     tokenizer = 'a'
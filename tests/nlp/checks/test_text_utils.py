@@ -11,7 +11,8 @@
 """Test for the text utils module"""
 from hamcrest import assert_that, equal_to
 
-from deepchecks.nlp.utils.text import break_to_lines_and_trim
+from deepchecks.nlp.utils.text import (TextNormalizer, break_to_lines_and_trim, hash_samples, normalize_samples,
+                                      normalize_text)
 
 
 def test_break_to_lines_and_trim():
@@ -33,3 +34,31 @@ def test_break_to_lines_and_trim():
     # Check that text with no delimiters is broken in the middle of the line:
     res_text = break_to_lines_and_trim(text, max_lines=3, min_line_length=12, max_line_length=13)
     assert_that(res_text, equal_to('This is a ver-<br>y long text t-<br>hat should be...'))
+
+
+def test_normalize_samples():
+    # Arrange
+    samples = ['The Cat, is BLACK!', 'ｆｕｌｌ width', 'a  b\tc']
+
+    # Act
+    normalized = normalize_samples(samples, ignore_whitespace=True)
+
+    # Assert
+    assert_that(normalized, equal_to(['catblack', 'fullwidth', 'bc']))
+    assert_that(normalized, equal_to([normalize_text(sample, ignore_whitespace=True) for sample in samples]))
+    assert_that(TextNormalizer(remove_stops=False)('The Cat, is BLACK!'), equal_to('the cat is black'))
+
+
+def test_normalize_samples_with_n_jobs():
+    # Arrange
+    samples = [f'Sample number {i}, with THE same words.' for i in range(25_000)]
+
+    # Act
+    normalized = normalize_samples(samples, n_jobs=2)
+
+    # Assert
+    assert_that(normalized, equal_to(normalize_samples(samples)))
+
+
+def test_hash_samples_is_stable():
+    assert_that(hash_samples(['abc', 'abd']), equal_to([6455300059550759896, 1518837652572122583]))
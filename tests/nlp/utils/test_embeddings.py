@@ -0,0 +1,152 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test for the embeddings utils"""
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, calling, equal_to, greater_than, has_length, raises
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.nlp.utils.embeddings_store import EmbeddingsStore
+from deepchecks.nlp.utils.llm_utils import _fetch_batches_concurrently, calculate_embeddings_for_text
+
+
+def test_embeddings_store(tmp_path):
+    # Arrange
+    store = EmbeddingsStore(tmp_path / 'embeddings.bin')
+    embeddings = np.arange(12, dtype=np.float32).reshape(4, 3)
+
+    # Act
+    store.add([10, 20, 30, 20], embeddings)
+    store.add([40, 10], np.ones((2, 3)))
+    found, stored = store.get([30, 50, 40, 10])
+
+    # Assert
+    assert_that(len(store), equal_to(4))
+    assert_that(found.tolist(), equal_to([True, False, True, True]))
+    assert_that(stored.tolist(), equal_to([embeddings[2].tolist(), [1, 1, 1], embeddings[0].tolist()]))
+    assert_that(isinstance(store.load(), np.memmap))
+    assert_that(store.load(mmap=False).tolist(), equal_to(store.load().tolist()))
+    assert_that(calling(store.add).with_args([50], np.ones((1, 4))),
+                raises(DeepchecksValueError, 'does not match the dimension of the stored embeddings'))
+
+
+def test_embeddings_store_drops_rows_of_interrupted_add(tmp_path):
+    # Arrange
+    store = EmbeddingsStore(tmp_path / 'embeddings.bin')
+    store.add([10], np.zeros((1, 2)))
+    # Embeddings which were appended without their hashes, as when adding them is interrupted
+    with open(store.path, 'ab') as f:
+        f.write(np.full((3, 2), 7, dtype=np.float32).tobytes())
+
+    # Act
+    store.add([20], np.ones((1, 2)))
+
+    # Assert
+    assert_that(store.load().tolist(), equal_to([[0, 0], [1, 1]]))
+    assert_that(store.path.stat().st_size, equal_to(2 * 2 * 4))
+
+
+def _fake_embed(text, model, n_jobs):  # pylint: disable=unused-argument
+    return np.array([[len(x), 1] for x in text], dtype=np.float32)
+
+
+def test_calculate_embeddings_skips_stored_texts(tmp_path):
+    # Arrange
+    path = tmp_path / 'embeddings.bin'
+    csv_path = tmp_path / 'embeddings.csv'
+    text = pd.Series(['a', 'bb', 'a', 'ccc'], index=[5, 6, 7, 8])
+
+    # Act
+    with patch('deepchecks.nlp.utils.llm_utils._embed', side_effect=_fake_embed) as embed:
+        first = calculate_embeddings_for_text(text, file_path=csv_path, embeddings_store=path)
+        second = calculate_embeddings_for_text(pd.Series(['ccc', 'dddd']), file_path=None, embeddings_store=path)
+
+    # Assert
+    assert_that(embed.call_args_list[0].args[0], has_length(3))
+    assert_that(embed.call_args_list[1].args[0], equal_to(['dddd']))
+    assert_that(list(first.index), equal_to([5, 6, 7, 8]))
+    assert_that(first[0].tolist(), equal_to([1, 2, 1, 3]))
+    assert_that(second[0].tolist(), equal_to([3, 4]))
+    assert_that(len(EmbeddingsStore(path)), equal_to(4))
+    assert_that(pd.read_csv(csv_path, index_col=0)['0'].tolist(), equal_to([1, 2, 1, 3]))
+
+
+def test_calculate_embeddings_without_store(tmp_path):
+    # Arrange
+    path = tmp_path / 'embeddings.csv'
+    text = pd.Series(['a', 'bb'])
+
+    # Act
+    with patch('deepchecks.nlp.utils.llm_utils._embed', side_effect=_fake_embed) as embed:
+        calculate_embeddings_for_text(text, file_path=path)
+        calculate_embeddings_for_text(text, file_path=path)
+
+    # Assert
+    assert_that(embed.call_count, equal_to(2))
+    assert_that(embed.call_args.args[2], equal_to(1))
+    assert_that(pd.read_csv(path, index_col=0)['0'].tolist(), equal_to([1, 2]))
+    assert_that(list(tmp_path.iterdir()), equal_to([path]))
+
+
+class _StubEmbeddingsHandler(BaseHTTPRequestHandler):
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        texts = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['input']
+        time.sleep(0.05)
+        body = json.dumps({'data': [{'index': i, 'embedding': [len(x)]} for i, x in enumerate(texts)]}).encode()
+        with cls.lock:
+            cls.in_flight -= 1
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_fetch_batches_concurrently_against_stub_server():
+    # Arrange
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubEmbeddingsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/embeddings'
+
+    def fetch(batch):
+        request = urllib.request.Request(url, data=json.dumps({'input': batch}).encode(), method='POST')
+        with urllib.request.urlopen(request) as response:
+            return [x['embedding'] for x in json.loads(response.read())['data']]
+
+    batches = [['a' * (i + 1)] * 2 for i in range(8)]
+
+    # Act
+    try:
+        results = _fetch_batches_concurrently(batches, fetch, n_jobs=4, desc='test')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Assert
+    assert_that(results, equal_to([[[i + 1]] * 2 for i in range(8)]))
+    assert_that(_StubEmbeddingsHandler.max_in_flight, greater_than(1))
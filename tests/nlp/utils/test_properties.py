@@ -12,9 +12,11 @@
 from unittest.mock import patch
 
 import pytest
-from hamcrest import assert_that, close_to, equal_to
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, greater_than_or_equal_to
 import numpy as np
-from deepchecks.nlp.utils.text_properties import calculate_default_properties
+from deepchecks.nlp.utils.properties_cache import PropertiesCache
+from deepchecks.nlp.utils.text_properties import (calculate_default_properties, get_transformer_pipelines_throughput,
+                                                  sentiment, toxicity)
 
 def mock_fn(*args, **kwargs):  # pylint: disable=unused-argument
     return [0] * 20_000
@@ -68,4 +70,112 @@ def test_calculate_unique_noun_count_property(tweet_emotion_train_test_textdata)
 
     # Assert
     assert_that(result['Unique Noun Count'][0: 10], equal_to([9, 2, 3, 3, 4, 10, 4, 2, 7, 5]))
-    assert_that(result_none_text['Unique Noun Count'], equal_to([np.nan]))
\ No newline at end of file
+    assert_that(result_none_text['Unique Noun Count'], equal_to([np.nan]))
+
+@patch('deepchecks.nlp.utils.text_properties.PROPERTIES_CHUNK_SIZE', 500)
+def test_calculate_properties_in_chunks(tweet_emotion_train_test_textdata):
+    # Arrange
+    _, test = tweet_emotion_train_test_textdata
+    test_text = list(test.text)
+    properties = ['Text Length', 'Average Word Length', 'Sentiment', 'Subjectivity', 'Lexical Density']
+
+    # Act
+    result, properties_types = calculate_default_properties(test_text, include_properties=properties)
+    result_with_n_jobs = calculate_default_properties(test_text, include_properties=properties, n_jobs=2)[0]
+
+    # Assert
+    assert_that(list(result.keys()), equal_to(properties))
+    assert_that(result_with_n_jobs, equal_to(result))
+    assert_that(result['Sentiment'], equal_to([sentiment([text])[0] for text in test_text]))
+    assert_that(properties_types, equal_to({prop: 'numeric' for prop in properties}))
+
+
+def test_transformer_properties_run_in_length_sorted_batches():
+    # Arrange
+    batches = []
+
+    def classifier(texts, batch_size):
+        batches.append(texts)
+        return [{'label': 'toxic', 'score': len(text) / 100} for text in texts]
+
+    raw_text = ['a' * length for length in [5, 1, 30, 12, 7]]
+
+    # Act
+    with patch('deepchecks.nlp.utils.text_properties.get_transformer_pipeline', return_value=classifier):
+        result = toxicity(raw_text, batch_size=2)
+
+    # Assert
+    assert_that(result, equal_to([0.05, 0.01, 0.3, 0.12, 0.07]))
+    assert_that([[len(text) for text in batch] for batch in batches], equal_to([[1, 5], [7, 12], [30]]))
+    assert_that(get_transformer_pipelines_throughput()['unitary/toxic-bert']['texts'], greater_than_or_equal_to(5))
+
+
+def test_calculate_properties_with_cache(tmp_path):
+    # Arrange
+    cache = PropertiesCache(tmp_path / 'properties.db')
+    raw_text = ['This is a test sentence.', 'Another one!', 'This is a test sentence.']
+    properties = ['Text Length', '% Special Characters']
+
+    # Act
+    result = calculate_default_properties(raw_text, include_properties=properties, cache=cache)[0]
+    with patch('deepchecks.nlp.utils.text_properties.run_available_kwargs', side_effect=mock_fn) as calculate:
+        cached_result = calculate_default_properties(raw_text, include_properties=properties, cache=cache)[0]
+
+    # Assert
+    assert_that(result, equal_to(calculate_default_properties(raw_text, include_properties=properties)[0]))
+    assert_that(cached_result, equal_to(result))
+    assert_that(calculate.call_count, equal_to(0))
+    assert_that(len(cache), equal_to(4))
+
+
+def test_calculate_properties_with_cache_skips_failed_nltk_properties(tmp_path):
+    # Arrange
+    cache = PropertiesCache(tmp_path / 'properties.db')
+    raw_text = ['This is a test sentence.', 'Another one!']
+    properties = ['Lexical Density', 'Text Length']
+
+    # Act
+    with patch('deepchecks.nlp.utils.text_properties.download_nltk_resource', return_value=False), \
+         pytest.warns(UserWarning, match='Failed to calculate property Lexical Density'):
+        result = calculate_default_properties(raw_text, include_properties=properties, cache=cache)[0]
+
+    # Assert
+    assert_that(result.keys(), contains_exactly('Text Length'))
+    assert_that(len(cache), equal_to(2))
+
+
+def test_calculate_properties_with_cache_stores_missing_values(tmp_path):
+    # Arrange
+    cache = PropertiesCache(tmp_path / 'properties.db')
+    raw_text = ['This is a test sentence.', 'Another one!']
+
+    def missing_first_value(method, raw_text, **kwargs):  # pylint: disable=unused-argument
+        return [np.nan] + [1.0] * (len(raw_text) - 1)
+
+    # Act
+    with patch('deepchecks.nlp.utils.text_properties.run_available_kwargs', side_effect=missing_first_value):
+        result = calculate_default_properties(raw_text, include_properties=['Text Length'], cache=cache)[0]
+    with patch('deepchecks.nlp.utils.text_properties.run_available_kwargs', side_effect=mock_fn) as calculate:
+        cached_result = calculate_default_properties(raw_text, include_properties=['Text Length'], cache=cache)[0]
+
+    # Assert
+    assert_that(len(cache), equal_to(2))
+    assert_that(calculate.call_count, equal_to(0))
+    assert_that(np.isnan(cached_result['Text Length'][0]), equal_to(True))
+    assert_that(cached_result['Text Length'][1], equal_to(result['Text Length'][1]))
+
+
+def test_properties_cache_eviction(tmp_path):
+    # Arrange
+    cache = PropertiesCache(tmp_path / 'properties.db', max_entries=3)
+
+    # Act
+    cache.set({'Text Length:v1': {'a': 1, 'b': 2}})
+    cache.get(['a'], ['Text Length:v1'])
+    cache.set({'Text Length:v1': {'c': np.nan, 'd': 4}})
+
+    # Assert
+    assert_that(len(cache), equal_to(3))
+    cached = cache.get(['a', 'b', 'c', 'd'], ['Text Length:v1'])['Text Length:v1']
+    assert_that(sorted(cached.keys()), equal_to(['a', 'c', 'd']))
+    assert_that(np.isnan(cached['c']), equal_to(True))
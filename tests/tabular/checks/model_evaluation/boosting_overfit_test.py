@@ -11,13 +11,16 @@
 """Boosting overfit tests."""
 from statistics import mean
 
-from hamcrest import assert_that, close_to, greater_than, has_length
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, greater_than, has_length, instance_of
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
+from xgboost import XGBRegressor
 
-from deepchecks.tabular.checks.model_evaluation.boosting_overfit import BoostingOverfit
+from deepchecks.tabular.checks.model_evaluation.boosting_overfit import (BoostingOverfit, PartialBoostingModel,
+                                                                          _staged_models, _StagedPredictionsModel)
 from deepchecks.tabular.dataset import Dataset
 from tests.base.utils import equal_condition_result
 
@@ -246,3 +249,35 @@ def test_condition_score_percentage_decline_not_greater_than_not_pass(diabetes,
         name='Test score over iterations is less than 1% from the best score',
         details='Found score decline of -3.64%'
     ))
+
+
+def test_staged_models_match_partial_models(iris_split_dataset_and_model_lgbm, iris_split_dataset_and_model_xgb,
+                                            iris_split_dataset_and_model_cat):
+    for _, test, clf in (iris_split_dataset_and_model_lgbm, iris_split_dataset_and_model_xgb,
+                         iris_split_dataset_and_model_cat):
+        # Arrange
+        data = test.features_columns
+        steps = [1, 2, 5, 10]
+
+        # Act
+        staged_models = _staged_models(clf, data, steps)
+
+        # Assert
+        assert_that(staged_models, contains_exactly(*[instance_of(_StagedPredictionsModel)] * 4))
+        for staged_model, step in zip(staged_models, steps):
+            partial_model = PartialBoostingModel(clf, step)
+            assert_that(np.array_equal(np.ravel(staged_model.predict(data)), np.ravel(partial_model.predict(data))))
+            assert_that(np.allclose(staged_model.predict_proba(data), partial_model.predict_proba(data), atol=1e-5))
+
+
+def test_staged_models_fallback_for_unknown_objective(diabetes_split_dataset_and_model):
+    # Arrange
+    train, test, _ = diabetes_split_dataset_and_model
+    model = XGBRegressor(n_estimators=10, objective='count:poisson')
+    model.fit(train.features_columns, train.label_col)
+
+    # Act
+    staged_models = _staged_models(model, test.features_columns, [1, 5, 10])
+
+    # Assert
+    assert_that(staged_models, contains_exactly(*[instance_of(PartialBoostingModel)] * 3))
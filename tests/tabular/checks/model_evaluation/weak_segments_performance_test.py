@@ -107,6 +107,21 @@ def test_segment_performance_iris_alternative_scorer(iris_split_dataset_and_mode
     assert_that(segments.iloc[0, 0], close_to(0.33, 0.01))
 
 
+def test_segment_performance_with_n_jobs(iris_split_dataset_and_model):
+    # Arrange
+    _, val, model = iris_split_dataset_and_model
+    scorer = {'F1': make_scorer(f1_score, average='micro')}
+
+    # Act
+    result = WeakSegmentsPerformance(alternative_scorer=scorer).run(val, model)
+    parallel_result = WeakSegmentsPerformance(alternative_scorer=scorer, n_jobs=2).run(val, model)
+
+    # Assert
+    assert_that(parallel_result.value['weak_segments_list'].equals(result.value['weak_segments_list']),
+                equal_to(True))
+    assert_that(parallel_result.value['avg_score'], equal_to(result.value['avg_score']))
+
+
 def test_regression_categorical_features_avocado(avocado_split_dataset_and_model, set_numpy_seed):
     # Arrange
     _, val, model = avocado_split_dataset_and_model
@@ -455,4 +455,34 @@ def test_condition_pass_on_duplicates():
         equal_condition_result(is_pass=True,
                                name='Date leakage ratio is less or equal to 0%',
                                details='No leaked dates found')
-    ))
\ No newline at end of file
+    ))
+
+
+def test_duplicates_on_full_datasets_with_timezones():
+    # Arrange
+    train_dates = pd.date_range('2021-10-01', periods=50_000, freq='min', tz='UTC')
+    test_dates = pd.date_range('2021-11-04 03:20', periods=30_000, freq='min', tz='Asia/Jerusalem')
+    train_ds = dataset_from_dict({'col1': train_dates}, 'col1')
+    val_ds = dataset_from_dict({'col1': test_dates}, 'col1')
+    expected_ratio = test_dates.isin(train_dates).mean()
+
+    # Act
+    result = DateTrainTestLeakageDuplicates(n_samples=None, n_to_show=2).run(train_ds, val_ds)
+
+    # Assert
+    assert_that(expected_ratio, greater_than(0))
+    assert_that(result.value, close_to(expected_ratio, 1e-9))
+    assert_that(result.display[1].iloc[0, 0], has_length(2))
+
+
+def test_overlap_on_full_datasets():
+    # Arrange
+    train_ds = dataset_from_dict({'col1': pd.date_range('2021-10-01', periods=50_000, freq='min')}, 'col1')
+    val_ds = dataset_from_dict({'col1': pd.date_range('2021-10-30', periods=20_000, freq='min')}, 'col1')
+    expected_ratio = (val_ds.datetime_col < train_ds.datetime_col.max()).mean()
+
+    # Act
+    result = DateTrainTestLeakageOverlap(n_samples=None).run(train_ds, val_ds)
+
+    # Assert
+    assert_that(result.value, close_to(expected_ratio, 1e-9))
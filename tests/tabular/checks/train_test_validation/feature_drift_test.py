@@ -72,6 +72,23 @@ def test_drift_with_model_n_top(drifted_data_and_model):
     assert_that(result.display, has_length(4))
 
 
+def test_drift_with_n_jobs(drifted_data_and_model):
+    # Arrange
+    train, test, model = drifted_data_and_model
+    check = FeatureDrift(n_top_columns=2)
+    parallel_check = FeatureDrift(n_top_columns=2, n_jobs=2)
+
+    # Act
+    result = check.run(train, test, model)
+    parallel_result = parallel_check.run(train, test, model)
+
+    # Assert
+    assert_that(parallel_result.value, equal_to(result.value))
+    assert_that(parallel_result.display, has_length(len(result.display)))
+    assert_that([display.layout.title.text for display in parallel_result.display if not isinstance(display, str)],
+                equal_to([display.layout.title.text for display in result.display if not isinstance(display, str)]))
+
+
 def test_drift_with_different_sort(drifted_data_and_model):
     # Arrange
     train, test, model = drifted_data_and_model
@@ -95,6 +95,19 @@ def test_show_top_feature_label_correlation_without_display():
     assert_that(result.display, has_length(0))
 
 
+def test_feature_label_correlation_with_n_jobs():
+    # Arrange
+    df, expected = util_generate_dataframe_and_expected()
+    dataset = Dataset(df, label='label')
+
+    # Act
+    result = FeatureLabelCorrelation(n_samples=None, random_state=42, n_jobs=2).run(dataset)
+
+    # Assert
+    assert_that(result.value, has_entries(expected))
+    assert_that(result.value, equal_to(FeatureLabelCorrelation(n_samples=None, random_state=42).run(dataset).value))
+
+
 def test_dataset_wrong_input():
     wrong = 'wrong_input'
     assert_that(
@@ -148,6 +161,18 @@ def test_trainval_show_top_feature_label_correlation():
     assert_that(result.value['train-test difference'], has_entries(expected))
 
 
+def test_trainval_feature_label_correlation_with_n_jobs():
+    # Arrange
+    df, df2, _ = util_generate_second_similar_dataframe_and_expected()
+    train, test = Dataset(df, label='label'), Dataset(df2, label='label')
+
+    # Act
+    result = FeatureLabelCorrelationChange(random_state=42, n_jobs=2).run(train, test)
+
+    # Assert
+    assert_that(result.value, equal_to(FeatureLabelCorrelationChange(random_state=42).run(train, test).value))
+
+
 def test_trainval_dataset_wrong_input():
     wrong = 'wrong_input'
     assert_that(
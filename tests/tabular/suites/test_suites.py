@@ -11,19 +11,22 @@
 """builtin suites tests"""
 
 # pylint: disable=redefined-outer-name
+import threading
 import typing as t
 from datetime import datetime
 
 import pandas as pd
 import pytest
 from catboost import CatBoostClassifier, CatBoostRegressor
-from hamcrest import assert_that, contains_exactly, has_length
+from hamcrest import assert_that, calling, contains_exactly, equal_to, has_length, raises
 from lightgbm import LGBMClassifier, LGBMRegressor
 from sklearn.ensemble import AdaBoostClassifier
 from sklearn.model_selection import train_test_split
 from xgboost import XGBClassifier, XGBRegressor
 
-from deepchecks.tabular import Dataset, suites
+from deepchecks.core import CheckResult
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular import Dataset, SingleDatasetCheck, Suite, suites
 from tests.common import get_expected_results_length, validate_suite_result
 
 
@@ -113,6 +116,98 @@ def test_iris_only_model(iris):
     _test_suite(None, None, model)
 
 
+def test_iris_suite_thread_pool(iris):
+    train, test, model = iris
+    _test_suite(train, test, model, n_jobs=4)
+
+
+def test_iris_suite_process_pool(iris):
+    train, test, model = iris
+    _test_suite(train, test, model, n_jobs=2, executor='process')
+
+
+def test_parallel_suite_keeps_results_order(iris):
+    train, test, model = iris
+    suite = suites.data_integrity()
+    sequential_result = suite.run(train_dataset=train, test_dataset=test, model=model)
+    parallel_result = suite.run(train_dataset=train, test_dataset=test, model=model, n_jobs=4)
+    assert_that([r.get_header() for r in parallel_result.results],
+                contains_exactly(*[r.get_header() for r in sequential_result.results]))
+
+
+def test_process_pool_suite_with_unpicklable_check_runs_in_threads(iris):
+    # Arrange
+    train, test, model = iris
+    suite = suites.data_integrity()
+    next(iter(suite.checks.values())).callback = lambda value: value
+    # Act
+    with pytest.warns(UserWarning, match='running the checks in threads instead'):
+        result = suite.run(train_dataset=train, test_dataset=test, model=model, n_jobs=2, executor='process')
+    # Assert
+    validate_suite_result(result, get_expected_results_length(suite, dict(train_dataset=train, test_dataset=test,
+                                                                          model=model)))
+
+
+def test_process_pool_suite_evaluates_conditions(iris):
+    # Arrange
+    train, test, model = iris
+    suite = suites.data_integrity()
+    # Act
+    sequential_result = suite.run(train_dataset=train, test_dataset=test, model=model)
+    process_result = suite.run(train_dataset=train, test_dataset=test, model=model, n_jobs=2, executor='process')
+    # Assert
+    assert_that([[c.category for c in r.conditions_results] for r in process_result.results if hasattr(r, 'value')],
+                equal_to([[c.category for c in r.conditions_results] for r in sequential_result.results
+                          if hasattr(r, 'value')]))
+    assert_that(all(any(r.check is check for check in suite.checks.values()) for r in process_result.results))
+
+
+# Lock held by another thread of the calling process while the suite runs in a process pool
+_held_lock = threading.Lock()
+
+
+class _AcquireHeldLockCheck(SingleDatasetCheck):
+
+    def run_logic(self, context, dataset_kind) -> CheckResult:
+        acquired = _held_lock.acquire(timeout=10)
+        if acquired:
+            _held_lock.release()
+        return CheckResult(acquired)
+
+
+def test_process_pool_workers_dont_inherit_held_locks(iris):
+    # Arrange
+    train, _, _ = iris
+    acquired, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with _held_lock:
+            acquired.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    acquired.wait()
+    # Act
+    try:
+        result = Suite('locks', _AcquireHeldLockCheck(), _AcquireHeldLockCheck()).run(train_dataset=train, n_jobs=2,
+                                                                                      executor='process')
+    finally:
+        release.set()
+        holder.join()
+    # Assert
+    assert_that([r.value for r in result.results], equal_to([True, True]))
+
+
+def test_parallel_suite_with_invalid_arguments(iris):
+    train, test, model = iris
+    suite = suites.data_integrity()
+    assert_that(calling(suite.run).with_args(train_dataset=train, n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a non-zero integer or None, but got: 0'))
+    assert_that(calling(suite.run).with_args(train_dataset=train, n_jobs=2, executor='gpu'),
+                raises(DeepchecksValueError, r'executor must be one of \[\'thread\', \'process\'\], but got: gpu'))
+
+
 def test_adult_dataset_suite(adult_split_dataset_and_model):
     train, test, model = adult_split_dataset_and_model
     _test_suite(train, test, model)
@@ -0,0 +1,207 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Contains unit tests for the tabular ReferenceProfile."""
+import numpy as np
+import pandas as pd
+import pytest
+from hamcrest import (assert_that, calling, close_to, contains_exactly, contains_string, equal_to, has_length,
+                      instance_of, raises)
+
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
+from deepchecks.tabular import Dataset, ReferenceProfile
+from deepchecks.tabular.checks import FeatureDrift, LabelDrift, MultivariateDrift, PercentOfNulls, PredictionDrift
+from deepchecks.utils.distribution.drift import ColumnDistribution, calc_drift_and_plot
+
+
+@pytest.fixture
+def drifted_datasets():
+    rng = np.random.RandomState(0)
+
+    def create_df(n_samples, shift):
+        df = pd.DataFrame({
+            'numeric': rng.randn(n_samples) + shift,
+            'category': rng.choice(['x', 'y', 'z', None], n_samples, p=[0.4 - shift / 2, 0.3, 0.2, 0.1 + shift / 2]),
+            'integer': rng.randint(0, 5, n_samples).astype(float)
+        })
+        df.loc[rng.choice(n_samples, 20), 'numeric'] = np.nan
+        df['label'] = (df['numeric'].fillna(0) + rng.randn(n_samples) > 0).astype(int)
+        return df
+
+    train = Dataset(create_df(2000, 0), label='label', cat_features=['category'], label_type='binary')
+    test = Dataset(create_df(1000, 0.2), label='label', cat_features=['category'], label_type='binary')
+    return train, test
+
+
+class _Model:
+    classes_ = [0, 1]
+
+    def predict(self, data):
+        return (data['numeric'].fillna(0) > 0).astype(int).to_numpy()
+
+    def predict_proba(self, data):
+        proba = 1 / (1 + np.exp(-data['numeric'].fillna(0).to_numpy()))
+        return np.stack([1 - proba, proba], axis=1)
+
+
+def test_column_distribution():
+    # Arrange
+    column = pd.Series([3, 1, np.nan, 2, 1])
+
+    # Act
+    numerical = ColumnDistribution(column, 'numerical')
+    categorical = ColumnDistribution(column, 'categorical')
+
+    # Assert
+    assert_that(numerical.to_array().tolist(), equal_to([1, 1, 2, 3]))
+    assert_that(sorted(categorical.to_array().tolist()), equal_to([1, 1, 2, 3]))
+    assert_that(categorical.to_array(ignore_na=False), has_length(5))
+    assert_that(dict(categorical.to_counter()), equal_to({1: 2, 2: 1, 3: 1}))
+    assert_that(sum(categorical.to_counter(ignore_na=False).values()), equal_to(5))
+
+
+@pytest.mark.parametrize('method', ['cramers_v', 'PSI'])
+def test_categorical_drift_from_column_distribution_counts(method):
+    # Arrange
+    rng = np.random.RandomState(0)
+    train = pd.Series(rng.choice(['a', 'b', 'c', None], 1000, p=[0.5, 0.3, 0.15, 0.05]))
+    test = pd.Series(rng.choice(['a', 'b', 'c', None], 500, p=[0.3, 0.3, 0.3, 0.1]))
+    distribution = ColumnDistribution(train, 'categorical')
+    distribution.to_array = None  # The counts should be used without expanding them back into values
+
+    # Act
+    score, _, fig = calc_drift_and_plot(train, test, 'col', 'categorical', categorical_drift_method=method,
+                                        max_num_categories_for_drift=2)
+    distribution_score, _, distribution_fig = calc_drift_and_plot(distribution, test, 'col', 'categorical',
+                                                                  categorical_drift_method=method,
+                                                                  max_num_categories_for_drift=2)
+
+    # Assert
+    assert_that(distribution_score, close_to(score, 1e-10))
+    assert_that(distribution_fig.data[2].y, equal_to(fig.data[2].y))
+
+
+def test_reference_profile_metadata(drifted_datasets):
+    # Arrange
+    train, _ = drifted_datasets
+
+    # Act
+    profile = ReferenceProfile(train, n_samples=1500, multivariate_n_samples=500)
+
+    # Assert
+    assert_that(profile, instance_of(Dataset))
+    assert_that(profile.features, contains_exactly('numeric', 'category', 'integer'))
+    assert_that(profile.cat_features, contains_exactly('category'))
+    assert_that(profile.n_samples, equal_to(1500))
+    assert_that(profile.sampled_rows.n_samples, equal_to(500))
+    assert_that(calling(lambda: profile.data), raises(DeepchecksNotSupportedError))
+    assert_that(calling(profile.get_predictions), raises(DeepchecksNotSupportedError, 'pass the model'))
+
+
+@pytest.mark.parametrize('check', [
+    FeatureDrift(),
+    FeatureDrift(numerical_drift_method='EMD', categorical_drift_method='PSI', ignore_na=False),
+    LabelDrift(),
+    PredictionDrift(),
+    PredictionDrift(drift_mode='prediction'),
+])
+def test_drift_checks_on_profile_match_dataset(drifted_datasets, check):
+    # Arrange
+    train, test = drifted_datasets
+    profile = ReferenceProfile(train, model=_Model())
+
+    # Act
+    result = check.run(train, test, _Model())
+    profile_result = check.run(profile, test, _Model())
+
+    # Assert
+    assert_that(profile_result.value, equal_to(result.value))
+    assert_that(profile_result.display, has_length(len(result.display)))
+
+
+def test_multivariate_drift_on_profile(drifted_datasets):
+    # Arrange
+    train, test = drifted_datasets
+    profile = ReferenceProfile(train)
+
+    # Act
+    result = MultivariateDrift().run(train, test)
+    profile_result = MultivariateDrift().run(profile, test)
+
+    # Assert
+    assert_that(profile_result.value['domain_classifier_drift_score'],
+                close_to(result.value['domain_classifier_drift_score'], 0.05))
+
+
+def test_saved_profile(drifted_datasets, tmp_path):
+    # Arrange
+    train, test = drifted_datasets
+    path = tmp_path / 'profile.npz'
+    ReferenceProfile(train).save(path)
+
+    # Act
+    profile = ReferenceProfile.load(path)
+    result = FeatureDrift(ignore_columns=['integer']).run(profile, test)
+
+    # Assert
+    assert_that(result.value.keys(), contains_exactly('numeric', 'category'))
+    assert_that(result.value, equal_to(FeatureDrift(ignore_columns=['integer']).run(train, test).value))
+
+
+def test_saved_profile_with_model_and_datetimes(drifted_datasets, tmp_path):
+    # Arrange
+    train, _ = drifted_datasets
+    data = train.data.copy()
+    data['date'] = pd.date_range('2020-01-01', periods=len(data), freq='H', tz='Europe/Berlin')
+    train = Dataset(data, label='label', cat_features=['category'], datetime_name='date', label_type='binary')
+    path = tmp_path / 'profile.npz'
+    profile = ReferenceProfile(train, model=_Model())
+    profile.save(path)
+
+    # Act
+    loaded = ReferenceProfile.load(path)
+
+    # Assert
+    assert_that(loaded.n_samples, equal_to(profile.n_samples))
+    assert_that(loaded.datetime_name, equal_to('date'))
+    pd.testing.assert_frame_equal(loaded._template.data, profile._template.data)
+    assert_that(np.array_equal(loaded.get_predictions(), profile.get_predictions()), equal_to(True))
+    assert_that(np.array_equal(loaded.get_predictions(proba=True), profile.get_predictions(proba=True)), equal_to(True))
+
+
+def test_load_invalid_profile(tmp_path):
+    # Arrange
+    path = tmp_path / 'profile.npz'
+    np.savez(path, values=np.arange(3))
+
+    # Act & Assert
+    assert_that(calling(ReferenceProfile.load).with_args(path),
+                raises(DeepchecksValueError, 'Expected a file of a ReferenceProfile'))
+
+
+def test_profile_html_repr(drifted_datasets):
+    # Arrange
+    train, _ = drifted_datasets
+
+    # Act
+    html = ReferenceProfile(train).__repr__(fmt='html')
+
+    # Assert
+    assert_that(html, contains_string('Dataset Description'))
+    assert_that(html, contains_string('ReferenceProfile(name='))
+
+
+def test_profile_in_non_drift_check(drifted_datasets):
+    # Arrange
+    train, _ = drifted_datasets
+
+    # Act & Assert
+    assert_that(calling(PercentOfNulls().run).with_args(ReferenceProfile(train)),
+                raises(DeepchecksNotSupportedError, 'doesn\'t hold the data of its dataset'))
@@ -0,0 +1,250 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Contains unit tests for the tabular StreamingDataset."""
+import numpy as np
+import pandas as pd
+import pytest
+from hamcrest import (assert_that, calling, close_to, contains_exactly, contains_string, equal_to, has_item,
+                      has_length, instance_of, is_not, raises, same_instance)
+
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
+from deepchecks.tabular import Dataset, StreamingDataset
+from deepchecks.tabular.checks import DataDuplicates, FeatureDrift, IsSingleValue, MixedNulls, PercentOfNulls
+from deepchecks.tabular.checks.data_integrity import data_duplicates
+
+
+@pytest.fixture
+def df_with_nulls():
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'numeric': rng.randint(0, 3, 1000).astype(float),
+        'category': rng.choice(['x', 'y', 'null', None], 1000),
+        'constant': np.ones(1000),
+        'label': rng.randint(0, 2, 1000)
+    })
+    df.loc[rng.choice(1000, 50), 'numeric'] = np.nan
+    return df
+
+
+def _streaming_dataset(df, chunksize=137, **kwargs):
+    def read_chunks():
+        return (df.iloc[i:i + chunksize] for i in range(0, len(df), chunksize))
+    return StreamingDataset(read_chunks, label='label', cat_features=['category'], label_type='binary', **kwargs)
+
+
+def test_streaming_dataset_metadata(df_with_nulls):
+    # Act
+    dataset = _streaming_dataset(df_with_nulls)
+
+    # Assert
+    assert_that(dataset.is_streaming)
+    assert_that(dataset.features, contains_exactly('numeric', 'category', 'constant'))
+    assert_that(dataset.cat_features, contains_exactly('category'))
+    assert_that(dataset.label_name, equal_to('label'))
+    assert_that(dataset.n_samples, equal_to(1000))
+    assert_that(calling(lambda: dataset.data), raises(DeepchecksNotSupportedError))
+
+
+def test_streaming_dataset_iter_chunks(df_with_nulls):
+    # Arrange
+    dataset = _streaming_dataset(df_with_nulls.reset_index(drop=True), chunksize=400).select(
+        ignore_columns=['constant'])
+
+    # Act
+    chunks = list(dataset.iter_chunks())
+
+    # Assert
+    assert_that(chunks, has_length(3))
+    assert_that(chunks[0], instance_of(Dataset))
+    assert_that(chunks[1].features, contains_exactly('numeric', 'category'))
+    assert_that(list(chunks[2].data.index), equal_to(list(range(800, 1000))))
+
+
+def test_streaming_dataset_sample(df_with_nulls):
+    # Arrange
+    dataset = _streaming_dataset(df_with_nulls)
+
+    # Act
+    sample = dataset.sample(300, random_state=0)
+
+    # Assert
+    assert_that(sample, instance_of(Dataset))
+    assert_that(sample.is_streaming, equal_to(False))
+    assert_that(sample.n_samples, equal_to(300))
+    assert_that(sample.data.index.is_unique)
+    assert_that(sample.data.equals(df_with_nulls.loc[sample.data.index]))
+    sample.data[sample.data.columns[0]] = None
+    assert_that(dataset.sample(300, random_state=0), is_not(same_instance(sample)))
+    assert_that(dataset.sample(300, random_state=0).data.equals(df_with_nulls.loc[sample.data.index]))
+    assert_that(dataset.sample(300, random_state=1).data.index.equals(sample.data.index), equal_to(False))
+    assert_that(dataset.sample(2000, random_state=0).n_samples, equal_to(1000))
+    assert_that(dataset.is_sampled(300), equal_to(True))
+    assert_that(dataset.is_sampled(2000), equal_to(False))
+
+
+def test_streaming_dataset_sample_all_data(df_with_nulls):
+    # Arrange
+    dataset = _streaming_dataset(df_with_nulls)
+
+    # Act
+    sample = dataset.sample(None)
+
+    # Assert
+    assert_that(sample.data.equals(df_with_nulls))
+    assert_that(dataset.is_sampled(None), equal_to(False))
+
+
+def test_streaming_dataset_html_repr(df_with_nulls):
+    # Arrange
+    dataset = _streaming_dataset(df_with_nulls)
+
+    # Act
+    html = dataset.__repr__(fmt='html')
+
+    # Assert
+    assert_that(html, contains_string('Dataset Description'))
+    assert_that(html, contains_string('StreamingDataset'))
+
+
+def test_streaming_dataset_from_csv(df_with_nulls, tmp_path):
+    # Arrange
+    path = tmp_path / 'data.csv'
+    df_with_nulls.to_csv(path, index=False)
+
+    # Act
+    dataset = StreamingDataset(path, chunksize=300, label='label', cat_features=['category'])
+
+    # Assert
+    assert_that(dataset.n_samples, equal_to(1000))
+    assert_that(list(dataset.iter_chunks()), has_length(4))
+
+
+def test_streaming_dataset_from_iterator_is_read_once(df_with_nulls):
+    # Arrange
+    dataset = StreamingDataset(iter([df_with_nulls.iloc[:500], df_with_nulls.iloc[500:]]), label='label')
+
+    # Act
+    chunks = list(dataset.iter_chunks())
+
+    # Assert
+    assert_that(chunks, has_length(2))
+    assert_that(calling(list).with_args(dataset.iter_chunks()),
+                raises(DeepchecksValueError, 'The iterator of chunks was already consumed'))
+
+
+def test_streaming_dataset_with_label_data(df_with_nulls):
+    assert_that(calling(StreamingDataset).with_args([df_with_nulls], label=df_with_nulls['label']),
+                raises(DeepchecksValueError, 'label of a StreamingDataset must be the name of a column in the data'))
+
+
+@pytest.mark.parametrize('check', [PercentOfNulls(), MixedNulls(), IsSingleValue(), DataDuplicates()])
+def test_streaming_checks_match_in_memory_checks(df_with_nulls, check):
+    # Arrange
+    dataset = Dataset(df_with_nulls, label='label', cat_features=['category'], label_type='binary')
+    streaming_dataset = _streaming_dataset(df_with_nulls)
+
+    # Act
+    result = check.run(dataset)
+    streaming_result = check.run(streaming_dataset)
+
+    # Assert
+    if isinstance(result.value, pd.DataFrame):
+        assert_that(streaming_result.value.equals(result.value))
+    elif isinstance(result.value, dict) and 'feature_importance' in result.value:
+        assert_that(streaming_result.value['n_samples'], equal_to(result.value['n_samples']))
+        assert_that(streaming_result.value['columns'], equal_to(result.value['columns']))
+    else:
+        assert_that(streaming_result.value, equal_to(result.value))
+    assert_that(streaming_result.display, has_length(len(result.display)))
+
+
+@pytest.mark.parametrize('check', [IsSingleValue(), DataDuplicates()])
+def test_streaming_checks_with_large_integers(check):
+    # Arrange
+    df = pd.DataFrame({'id': [10 ** 18 + i for i in range(100)], 'label': [0, 1] * 50})
+    dataset = Dataset(df, label='label', cat_features=[], label_type='binary')
+    streaming_dataset = StreamingDataset([df.iloc[:37], df.iloc[37:]], label='label', cat_features=[],
+                                         label_type='binary')
+
+    # Act
+    result = check.run(dataset)
+    streaming_result = check.run(streaming_dataset)
+
+    # Assert
+    assert_that(streaming_result.value, equal_to(result.value))
+
+
+def test_streaming_data_duplicates_in_partitions(df_with_nulls, monkeypatch):
+    # Arrange
+    dataset = Dataset(df_with_nulls, label='label', cat_features=['category'], label_type='binary')
+    streaming_dataset = _streaming_dataset(df_with_nulls)
+    monkeypatch.setattr(data_duplicates, '_MAX_HASHES_IN_MEMORY', 100)
+
+    # Act
+    result = DataDuplicates().run(dataset)
+    streaming_result = DataDuplicates().run(streaming_dataset)
+
+    # Assert
+    assert_that(streaming_result.value, equal_to(result.value))
+    assert_that(streaming_result.display[2].index.get_level_values('Number of Duplicates').tolist(),
+                equal_to(result.display[2].index.get_level_values('Number of Duplicates').tolist()))
+
+
+def test_streaming_data_duplicates_reports_hash_collisions(monkeypatch):
+    # Arrange
+    df = pd.DataFrame({'a': [1, 1, 2, 3], 'label': [0, 0, 0, 1]})
+    dataset = StreamingDataset([df.iloc[:2], df.iloc[2:]], label='label', cat_features=[], label_type='binary')
+    # All the rows but the last share a hash, as if rows 1 and 2 collided
+    monkeypatch.setattr(data_duplicates, 'hash_rows_128', lambda data: pd.MultiIndex.from_arrays(
+        [(data['a'] == 3).to_numpy().astype('uint64'), np.zeros(len(data), dtype='uint64')]))
+
+    # Act
+    with pytest.warns(UserWarning, match='Found 1 rows which share a hash with a different duplicated row'):
+        result = DataDuplicates().run(dataset)
+
+    # Assert
+    assert_that(result.value, equal_to(0.5))
+
+
+def test_streaming_feature_drift(df_with_nulls):
+    # Arrange
+    train = _streaming_dataset(df_with_nulls.iloc[:500])
+    test = _streaming_dataset(df_with_nulls.iloc[500:])
+    in_memory_train = Dataset(df_with_nulls.iloc[:500], label='label', cat_features=['category'], label_type='binary')
+    in_memory_test = Dataset(df_with_nulls.iloc[500:], label='label', cat_features=['category'], label_type='binary')
+
+    # Act
+    result = FeatureDrift(n_samples=300).run(train, test)
+    in_memory_result = FeatureDrift().run(in_memory_train, in_memory_test)
+
+    # Assert
+    assert_that(result.value.keys(), contains_exactly('numeric', 'category', 'constant'))
+    for column, column_result in in_memory_result.value.items():
+        assert_that(result.value[column]['Drift score'], close_to(column_result['Drift score'], 1e-10))
+    assert_that([d for d in result.display if not isinstance(d, str)], has_length(3))
+    assert_that(result.display, has_item(contains_string('The drift scores are calculated over all the data')))
+    assert_that(result.display[-1], contains_string('Note - data sampling: Running on 300 <b>train</b> data samples '
+                                                    'out of 500. Running on 300 <b>test</b> data samples out of 500.'))
+
+
+def test_streaming_feature_drift_without_display(df_with_nulls):
+    # Arrange
+    train = _streaming_dataset(df_with_nulls.iloc[:500])
+    test = _streaming_dataset(df_with_nulls.iloc[500:])
+
+    # Act
+    result = FeatureDrift(n_samples=300).run(train, test, with_display=False)
+
+    # Assert
+    assert_that(result.value.keys(), contains_exactly('numeric', 'category', 'constant'))
+    assert_that(result.display, has_length(0))
+    assert_that(train.is_sampled(300), equal_to(False))
+    assert_that(test.is_sampled(300), equal_to(False))
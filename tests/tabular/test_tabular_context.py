@@ -8,7 +8,14 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
-from deepchecks.tabular import Context
+import math
+
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, equal_to
+from sklearn.tree import DecisionTreeClassifier
+
+from deepchecks.tabular import Context, Dataset
 
 
 def test_task_type_same_with_model_or_y_pred(diabetes_split_dataset_and_model):
@@ -19,3 +26,88 @@ def test_task_type_same_with_model_or_y_pred(diabetes_split_dataset_and_model):
     ctx2 = Context(train, y_pred_train=model.predict(train.features_columns))
     # Assert
     assert ctx1.task_type == ctx2.task_type
+
+
+class _CountingModel:
+    def __init__(self, model):
+        self.model = model
+        self.predict_calls = 0
+        self.predict_proba_calls = 0
+
+    def predict(self, data):
+        self.predict_calls += 1
+        return self.model.predict(data)
+
+    def predict_proba(self, data):
+        self.predict_proba_calls += 1
+        return self.model.predict_proba(data)
+
+
+def test_cached_model_predicts_once_per_dataset(iris_split_dataset_and_model):
+    # Arrange
+    train, test, model = iris_split_dataset_and_model
+    counting_model = _CountingModel(model)
+    ctx = Context(train, test, model=counting_model)
+    _ = ctx.model  # validate model
+    counting_model.predict_calls = counting_model.predict_proba_calls = 0
+    # Act
+    full_pred = ctx.cached_model.predict(test.features_columns)
+    sample = test.sample(20, random_state=0)
+    sample_pred = ctx.cached_model.predict(sample.features_columns)
+    ctx.cached_model.predict_proba(train.features_columns)
+    ctx.cached_model.predict_proba(train.sample(10, random_state=0).features_columns)
+    # Assert
+    assert_that(counting_model.predict_calls, equal_to(1))
+    assert_that(counting_model.predict_proba_calls, equal_to(1))
+    assert_that(list(full_pred), equal_to(list(model.predict(test.features_columns))))
+    assert_that(list(sample_pred), equal_to(list(model.predict(sample.features_columns))))
+
+
+def test_cached_model_predicts_modified_data_with_model(iris_split_dataset_and_model):
+    # Arrange
+    train, test, model = iris_split_dataset_and_model
+    counting_model = _CountingModel(model)
+    ctx = Context(train, test, model=counting_model)
+    _ = ctx.model  # validate model
+    counting_model.predict_calls = counting_model.predict_proba_calls = 0
+    ctx.cached_model.predict(test.features_columns)
+    modified_data = test.features_columns * 10
+    # Act
+    modified_pred = ctx.cached_model.predict(modified_data)
+    # Assert
+    assert_that(counting_model.predict_calls, equal_to(2))
+    assert_that(list(modified_pred), equal_to(list(model.predict(modified_data))))
+
+
+def test_cached_model_with_batch_size(iris_split_dataset_and_model):
+    # Arrange
+    train, test, model = iris_split_dataset_and_model
+    counting_model = _CountingModel(model)
+    ctx = Context(train, test, model=counting_model, inference_batch_size=7)
+    _ = ctx.model  # validate model
+    counting_model.predict_calls = counting_model.predict_proba_calls = 0
+    # Act
+    proba = ctx.cached_model.predict_proba(test.features_columns)
+    # Assert
+    assert_that(counting_model.predict_proba_calls, equal_to(math.ceil(len(test) / 7)))
+    assert_that(np.allclose(proba, model.predict_proba(test.features_columns)), equal_to(True))
+
+
+def test_cached_model_predicts_data_with_an_edited_row_with_model():
+    # Arrange
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({'a': rng.rand(1000), 'b': rng.randint(0, 5, 1000), 'label': rng.randint(0, 2, 1000)})
+    dataset = Dataset(df, label='label', cat_features=[])
+    model = DecisionTreeClassifier(random_state=0).fit(dataset.features_columns, dataset.label_col)
+    counting_model = _CountingModel(model)
+    ctx = Context(dataset, model=counting_model)
+    _ = ctx.model  # validate model
+    counting_model.predict_calls = counting_model.predict_proba_calls = 0
+    ctx.cached_model.predict(dataset.features_columns)
+    edited_data = dataset.features_columns.copy()
+    edited_data.iloc[rng.randint(1000), 0] = 10
+    # Act
+    edited_pred = ctx.cached_model.predict(edited_data)
+    # Assert
+    assert_that(counting_model.predict_calls, equal_to(2))
+    assert_that(list(edited_pred), equal_to(list(model.predict(edited_data))))
@@ -9,11 +9,14 @@
 # ----------------------------------------------------------------------------
 #
 """Tests for dataframes"""
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 from hamcrest import assert_that, close_to, contains_exactly, equal_to
 from scipy.stats import pearsonr
 
-from deepchecks.utils.dataframes import generalized_corrwith, is_float_column
+from deepchecks.utils.dataframes import generalized_corrwith, group_identical_rows, is_float_column
 
 
 def test_generalized_corrwith():
@@ -40,3 +43,23 @@ def test_is_float_column():
 
     col = pd.Series([1, 2, 3, 4, 5.5], dtype='float64')
     assert_that(is_float_column(col), equal_to(True))
+
+
+def test_group_identical_rows():
+    df1 = pd.DataFrame({'a': [1, 1, None, None, 0.0, -0.0], 'b': pd.Categorical(['x', 'x', None, None, 'y', 'y'])})
+    df2 = pd.DataFrame({'a': [1.0, 5.0], 'b': ['x', 'z']})
+
+    groups1, groups2 = group_identical_rows(df1, df2)
+
+    assert_that(groups1.tolist(), equal_to([0, 0, 1, 1, 2, 2]))
+    assert_that(groups2.tolist(), equal_to([0, 3]))
+
+
+def test_group_identical_rows_with_hash_collisions():
+    df = pd.DataFrame({'a': [1, 2, 1, 3, 2], 'b': ['x', 'y', 'x', 'x', 'y']})
+
+    with patch('deepchecks.utils.dataframes.hash_rows',
+               side_effect=lambda df: pd.Series(np.zeros(len(df), dtype=np.uint64), index=df.index)):
+        groups = group_identical_rows(df)[0]
+
+    assert_that(groups.tolist(), equal_to([0, 1, 0, 2, 1]))
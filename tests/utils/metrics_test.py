@@ -9,16 +9,20 @@
 # ----------------------------------------------------------------------------
 #
 """Test metrics utils"""
+import numpy as np
 import pandas as pd
-from hamcrest import assert_that, calling, close_to, has_entries, is_, raises
+import pytest
+from hamcrest import assert_that, calling, close_to, equal_to, has_entries, has_length, is_, raises
+from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import make_scorer
 
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Dataset
-from deepchecks.tabular.metric_utils import DeepcheckScorer
+from deepchecks.tabular.metric_utils import DeepcheckScorer, score_dataset, score_predictions
 from deepchecks.tabular.metric_utils.additional_classification_metrics import (false_negative_rate_metric,
                                                                                false_positive_rate_metric,
                                                                                true_negative_rate_metric)
+from deepchecks.tabular.metric_utils.scorers import binary_scorers_dict, multiclass_scorers_dict
 from deepchecks.tabular.utils.task_inference import get_all_labels, infer_classes_from_model
 from tests.common import is_nan
 
@@ -200,3 +204,54 @@ def test_scorer_with_only_new_labels_in_data(iris: pd.DataFrame, iris_adaboost):
     assert_that(score, has_entries({
         0: is_(0), 1: is_(0), 2: is_(0), 19: is_nan(), 20: is_nan()
     }))
+
+
+def _assert_same_scores(scores, expected_scores):
+    for score, expected_score in zip(scores, expected_scores):
+        if isinstance(expected_score, dict):
+            assert_that(list(score.keys()), equal_to(list(expected_score.keys())))
+            assert_that(np.array_equal(np.asarray(list(score.values()), dtype=float),
+                                       np.asarray(list(expected_score.values()), dtype=float), equal_nan=True),
+                        is_(True))
+        else:
+            assert_that(score, close_to(expected_score, 1e-12))
+
+
+@pytest.mark.parametrize('scorer_names, is_binary', [
+    (sorted(binary_scorers_dict), True),
+    (sorted(multiclass_scorers_dict), False),
+])
+def test_score_dataset_matches_scorers(scorer_names, is_binary, iris: pd.DataFrame):
+    # Arrange
+    iris = iris.copy()
+    if is_binary:
+        iris['target'] = np.where(iris['target'] == 2, 'virginica', 'other')
+    test_ds = Dataset(iris, label='target', cat_features=[])
+    clf = LogisticRegression(max_iter=1000).fit(test_ds.features_columns, test_ds.label_col)
+    scorers = [deepchecks_scorer(name, clf, test_ds) for name in scorer_names]
+
+    # Act
+    scores = score_dataset(scorers, clf, test_ds)
+
+    # Assert
+    assert_that(scores, has_length(len(scorers)))
+    _assert_same_scores(scores, [scorer(clf, test_ds) for scorer in scorers])
+
+
+def test_score_predictions_with_new_and_missing_labels(iris: pd.DataFrame, iris_adaboost):
+    # Arrange
+    iris = iris.copy()
+    iris.loc[:10, 'target'] = 19
+    ds = Dataset(iris, label='target', cat_features=[])
+    scorers = [deepchecks_scorer(name, iris_adaboost, ds)
+               for name in ['accuracy', 'precision_per_class', 'f1_macro', 'recall_weighted', 'roc_auc_per_class']]
+    y_pred = iris_adaboost.predict(ds.features_columns)
+    y_proba = iris_adaboost.predict_proba(ds.features_columns)
+    y_true = pd.concat([ds.label_col.astype('object'), pd.Series([None])], ignore_index=True)
+
+    # Act
+    scores = score_predictions(scorers, y_true, np.append(y_pred, 0), np.vstack([y_proba, [[1, 0, 0]]]))
+
+    # Assert
+    _assert_same_scores(scores, [scorer(iris_adaboost, ds) for scorer in scorers])
+    assert_that(scores[1], has_entries({19: is_nan()}))
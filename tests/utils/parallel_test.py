@@ -0,0 +1,33 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import os
+
+from hamcrest import assert_that, calling, equal_to, raises
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.utils.parallel import effective_n_jobs
+
+
+def test_effective_n_jobs(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+    # Act & Assert
+    assert_that(effective_n_jobs(None), equal_to(1))
+    assert_that(effective_n_jobs(1), equal_to(1))
+    assert_that(effective_n_jobs(3), equal_to(3))
+    assert_that(effective_n_jobs(-1), equal_to(8))
+    assert_that(effective_n_jobs(-2), equal_to(7))
+    assert_that(effective_n_jobs(-20), equal_to(1))
+
+
+def test_effective_n_jobs_zero():
+    assert_that(calling(effective_n_jobs).with_args(0),
+                raises(DeepchecksValueError, 'n_jobs must be a non-zero integer or None, but got: 0'))
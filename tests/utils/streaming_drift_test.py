@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test streaming drift utils"""
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from hamcrest import assert_that, calling, close_to, equal_to, has_entries, less_than_or_equal_to, raises
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.utils.distribution.drift import cramers_v, earth_movers_distance, kolmogorov_smirnov, psi
+from deepchecks.utils.distribution.preprocessing import OTHER_CATEGORY_NAME
+from deepchecks.utils.distribution.streaming_drift import CategoryCounter, DriftAccumulator, QuantileSketch
+
+
+def _create_df(n_samples, shift, random_state):
+    rng = np.random.RandomState(random_state)
+    return pd.DataFrame({
+        'numeric': rng.randn(n_samples) + shift,
+        'category': rng.choice(['a', 'b', 'c'], n_samples, p=[0.5 - shift / 2, 0.3, 0.2 + shift / 2]),
+    })
+
+
+def _accumulate(df, chunk_size, **kwargs):
+    accumulator = DriftAccumulator({'numeric': 'numerical', 'category': 'categorical'}, **kwargs)
+    for start in range(0, len(df), chunk_size):
+        accumulator.update(df.iloc[start:start + chunk_size])
+    return accumulator
+
+
+def test_quantile_sketch_exact_while_small():
+    # Arrange
+    values = np.random.RandomState(0).randn(1000)
+
+    # Act
+    sketch = QuantileSketch(k=2048).update(values[:500]).update(np.append(values[500:], np.nan))
+
+    # Assert
+    assert_that(len(sketch), equal_to(1000))
+    assert_that(sketch.rank_error_bound, equal_to(0))
+    assert_that(sketch.cdf(0.5), equal_to(np.mean(values <= 0.5)))
+    assert_that(sketch.quantile(0.3), close_to(np.quantile(values, 0.3), 1e-12))
+
+
+def test_quantile_sketch_error_bound():
+    # Arrange
+    values = np.random.RandomState(0).exponential(size=200_000)
+    points = np.quantile(values, np.linspace(0.01, 0.99, 99))
+
+    # Act
+    sketch = QuantileSketch(k=256)
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    # Assert
+    assert_that(sketch.rank_error_bound, less_than_or_equal_to(0.05))
+    errors = np.abs(sketch.cdf(points) - np.searchsorted(np.sort(values), points, side='right') / len(values))
+    assert_that(errors.max(), less_than_or_equal_to(sketch.rank_error_bound))
+    assert_that((sketch.min, sketch.max), equal_to((values.min(), values.max())))
+
+
+def test_category_counter_bounded():
+    # Arrange
+    values = np.array(['a'] * 500 + ['b'] * 300 + [f'rare{i}' for i in range(200)] + [None] * 10)
+
+    # Act
+    counter = CategoryCounter(max_categories=10).update(values[:600]).merge(CategoryCounter(10).update(values[600:]))
+
+    # Assert
+    assert_that(len(counter.counts), less_than_or_equal_to(10))
+    assert_that(counter.counts['a'], close_to(500, counter.count_error_bound))
+    assert_that(counter.counts['b'], close_to(300, counter.count_error_bound))
+    assert_that(counter.n_nulls, equal_to(10))
+    assert_that(sum(counter.to_counter().values()), equal_to(1000))
+    assert_that(counter.to_counter()[OTHER_CATEGORY_NAME], less_than_or_equal_to(200 + 2 * counter.count_error_bound))
+
+
+@pytest.mark.parametrize('numerical_drift_method, categorical_drift_method', [('KS', 'cramers_v'), ('EMD', 'PSI')])
+def test_drift_matches_exact_calculation(numerical_drift_method, categorical_drift_method):
+    # Arrange
+    train, test = _create_df(1500, 0, 0), _create_df(1000, 0.2, 1)
+
+    # Act
+    result = _accumulate(test, 128).calc_drift(_accumulate(train, 500), numerical_drift_method,
+                                               categorical_drift_method, min_category_size_ratio=0)
+
+    # Assert
+    if numerical_drift_method == 'KS':
+        numeric_score = kolmogorov_smirnov(train['numeric'].to_numpy(), test['numeric'].to_numpy())
+        category_score = cramers_v(train['category'], test['category'])
+    else:
+        numeric_score = earth_movers_distance(train['numeric'].to_numpy(), test['numeric'].to_numpy(), 0.025)
+        category_score = psi(train['category'], test['category'])
+    assert_that(result['numeric']['Drift score'], close_to(numeric_score, 1e-9))
+    assert_that(result['category']['Drift score'], close_to(category_score, 1e-9))
+
+
+def test_merged_accumulators_within_error_bound():
+    # Arrange
+    train, test = _create_df(100_000, 0, 0), _create_df(60_000, 0.1, 1)
+    reference = _accumulate(train, 10_000, k=512)
+
+    # Act
+    accumulator = _accumulate(test.iloc[:30_000], 5000, k=512).merge(_accumulate(test.iloc[30_000:], 7000, k=512))
+    result = accumulator.calc_drift(reference)
+
+    # Assert
+    error_bound = reference.sketches['numeric'].rank_error_bound + accumulator.sketches['numeric'].rank_error_bound
+    exact_score = kolmogorov_smirnov(train['numeric'].to_numpy(), test['numeric'].to_numpy())
+    assert_that(result['numeric'], has_entries({'Drift score': close_to(exact_score, error_bound),
+                                                'Method': 'Kolmogorov-Smirnov'}))
+    assert_that(result['category']['Drift score'], close_to(cramers_v(train['category'], test['category']), 1e-9))
+
+
+def test_pickled_reference_and_min_samples():
+    # Arrange
+    reference = pickle.loads(pickle.dumps(_accumulate(_create_df(100, 0, 0), 30)))
+
+    # Act
+    result = _accumulate(_create_df(5, 0, 1), 30).calc_drift(reference)
+
+    # Assert
+    assert_that(result['numeric']['Drift score'], equal_to(None))
+    assert_that(result['category']['Drift score'], equal_to(None))
+
+
+def test_accumulator_errors():
+    # Arrange
+    accumulator = DriftAccumulator({'numeric': 'numerical'})
+
+    # Act & Assert
+    assert_that(calling(DriftAccumulator).with_args({'numeric': 'text'}),
+                raises(DeepchecksValueError, 'Unsupported column type for drift: text'))
+    assert_that(calling(accumulator.update).with_args(pd.DataFrame({'other': [1]})),
+                raises(DeepchecksValueError, 'missing the accumulated columns'))
+    assert_that(calling(accumulator.merge).with_args(DriftAccumulator({'other': 'numerical'})),
+                raises(DeepchecksValueError, 'different columns'))
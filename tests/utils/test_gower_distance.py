@@ -11,7 +11,8 @@
 import gower
 import numpy as np
 import pandas as pd
-from hamcrest import assert_that, contains_exactly, equal_to, greater_than, has_item, has_length, less_than_or_equal_to
+from hamcrest import (assert_that, close_to, contains_exactly, equal_to, greater_than, has_item, has_length,
+                     less_than_or_equal_to)
 
 from deepchecks.utils import gower_distance
 
@@ -106,3 +107,36 @@ def test_compare_other_package_iris(iris_dataset):
     for i in range(data.shape[0]):
         closest_to_i = gower.gower_topn(data.iloc[i:i + 1, :4], data.iloc[:, :4], n=3)
         assert (closest_to_i['values'].round(5) == dist[i, :]).all()
+
+
+def test_nearest_neighbors_blocks_and_threads_match_single_block(monkeypatch):
+    # Arrange
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame({'col1': rng.choice(['a', 'b', None], 200),
+                         'col2': rng.normal(size=200),
+                         'col3': rng.integers(0, 10, 200).astype(float)})
+    data.loc[rng.choice(200, 20), 'col2'] = np.nan
+    expected_dist, expected_idx = gower_distance.calculate_nearest_neighbors_distances(
+        data, ['col1'], ['col2', 'col3'], 5)
+    # Act
+    monkeypatch.setattr(gower_distance, '_MAX_DISTANCES_IN_BLOCK', 1000)
+    dist, idx = gower_distance.calculate_nearest_neighbors_distances(data, ['col1'], ['col2', 'col3'], 5, n_jobs=3)
+    # Assert
+    assert_that(np.allclose(dist, expected_dist, equal_nan=True), equal_to(True))
+    assert_that((idx == expected_idx).all(), equal_to(True))
+
+
+def test_full_matrix_matches_pairwise_distance(monkeypatch):
+    # Arrange
+    data = pd.DataFrame({'col1': ['a', 'a', 'a', 'b', 'a', 'a', None, 'a', 'a', 'a', 'a', 'a', 'a', 'b'],
+                         'col2': [1, 2, 1, 1, 5, 1, None, 1, 1, 1, 1, 3, 1, 1000]})
+    is_categorical_arr = np.array([True, False], dtype=bool)
+    data = np.asarray(data)
+    feature_ranges = np.array([-1, 999])
+    # Act
+    monkeypatch.setattr(gower_distance, '_MAX_DISTANCES_IN_BLOCK', 20)
+    dist = gower_distance.gower_matrix(data=data, cat_features=is_categorical_arr, n_jobs=2)
+    # Assert
+    for i in range(data.shape[0]):
+        for j in range(data.shape[0]):
+            assert_that(dist[i, j], close_to(gower_distance.calculate_distance(data[i], data[j], feature_ranges), 1e-9))
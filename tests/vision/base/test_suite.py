@@ -11,15 +11,17 @@
 #
 from collections import defaultdict
 
+import numpy as np
 from hamcrest import assert_that, calling, contains_inanyorder, has_length, instance_of, is_, raises
 
-from deepchecks.core import CheckResult, DatasetKind
+from deepchecks.core import CheckFailure, CheckResult, DatasetKind
 from deepchecks.core.errors import DatasetValidationError, DeepchecksNotSupportedError, DeepchecksValueError
 from deepchecks.vision.base_checks import SingleDatasetCheck, TrainTestCheck
 from deepchecks.vision.datasets.classification import mnist_tensorflow
 from deepchecks.vision.datasets.detection import coco_torch
 from deepchecks.vision.suite import Suite
 from deepchecks.vision.suites.default_suites import full_suite
+from deepchecks.vision.vision_data import VisionData
 from tests.common import get_expected_results_length, validate_suite_result
 
 
@@ -62,6 +64,91 @@ def test_suite_execution():
     assert_that(executions, is_({'initialize_run': 3, 'update': 8, 'compute': 3}))
 
 
+def test_suite_execution_with_prefetch():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+    identifiers = defaultdict(list)
+
+    class DummyCheck(SingleDatasetCheck):
+        def initialize_run(self, context, dataset_kind: DatasetKind):
+            pass
+
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            identifiers[self.prefetch_batches].extend(batch.numpy_image_identifiers)
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(0)
+
+    for prefetch_batches in [0, 3]:
+        check = DummyCheck()
+        check.prefetch_batches = prefetch_batches
+        result = Suite('test', check).run(train_dataset=coco_dataset, prefetch_batches=prefetch_batches)
+        assert_that(result.results[0].value, is_(0))
+
+    assert_that(identifiers[3], has_length(len(identifiers[0])))
+    assert_that(identifiers[3], is_(identifiers[0]))
+
+
+def test_suite_execution_with_prefetch_and_failing_conversion():
+    images = np.zeros((4, 8, 8, 3), dtype=np.uint8)
+    # The embeddings of the second batch can't be converted to floats
+    batches = [{'images': images, 'embeddings': np.zeros((4, 2))},
+               {'images': images, 'embeddings': [['x', 'y']] * 4}]
+    vision_data = VisionData(batches, task_type='other', reshuffle_data=False)
+
+    class EmbeddingsCheck(SingleDatasetCheck):
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            _ = batch.numpy_embeddings
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(0)
+
+    class ImagesCheck(SingleDatasetCheck):
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            _ = batch.numpy_images
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(1)
+
+    for prefetch_batches in [0, 3]:
+        result = Suite('test', EmbeddingsCheck(), ImagesCheck()).run(train_dataset=vision_data,
+                                                                     prefetch_batches=prefetch_batches)
+        assert_that(result.results[0], instance_of(CheckFailure))
+        assert_that(result.results[1].value, is_(1))
+
+
+def test_suite_execution_with_concurrent_updates():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+    executions = defaultdict(int)
+
+    class DummyCheck(SingleDatasetCheck):
+        def initialize_run(self, context, dataset_kind: DatasetKind):
+            pass
+
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            executions[dataset_kind] += 1
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(0)
+
+    class FailingCheck(SingleDatasetCheck):
+        def initialize_run(self, context, dataset_kind: DatasetKind):
+            pass
+
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            raise DeepchecksValueError('bad update')
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(None)
+
+    suite = Suite('test', DummyCheck(), FailingCheck())
+    result = suite.run(train_dataset=coco_dataset, n_jobs=2)
+
+    assert_that(result.results[0].value, is_(0))
+    assert_that(result.results[1].exception, instance_of(DeepchecksValueError))
+    assert_that(result.results[1].exception.message, is_('bad update'))
+    assert_that(executions[DatasetKind.TRAIN], is_(len(coco_dataset)))
+
+
 def test_suite_execution_with_initalize_exeption():
     coco_dataset = coco_torch.load_dataset(object_type='VisionData')
     executions = defaultdict(int)
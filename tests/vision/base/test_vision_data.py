@@ -10,10 +10,12 @@
 #
 #
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 import torch
-from hamcrest import assert_that, calling, equal_to, has_length, is_not, raises
+from hamcrest import assert_that, calling, equal_to, has_length, is_not, raises, same_instance
 from torch.utils.data import DataLoader
 
 from deepchecks.core.errors import DatasetValidationError, ValidationError
@@ -22,7 +24,8 @@ from deepchecks.vision.datasets.detection import coco_torch
 from deepchecks.vision.datasets.segmentation import segmentation_coco
 from deepchecks.vision.utils.test_utils import replace_collate_fn_dataloader
 from deepchecks.vision.vision_data import TaskType, VisionData
-from deepchecks.vision.vision_data.utils import validate_vision_data_compatibility
+from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
+from deepchecks.vision.vision_data.utils import sequence_to_numpy, validate_vision_data_compatibility
 from tests.vision.conftest import run_update_loop
 
 
@@ -296,3 +299,20 @@ def test_shuffling_tf_dataset(tf_coco_visiondata_train, caplog):
     assert_that(caplog.records[0].message, equal_to('Shuffling for tensorflow datasets is not supported. '
                                                     'Make sure that the data used to create the Dataset was shuffled '
                                                     'beforehand and set shuffle_batch_loader=False'))
+
+
+def test_batch_wrapper_converts_to_numpy_once():
+    batch = {'images': [np.zeros((4, 4, 3)), np.ones((4, 4, 3))],
+             'labels': [[[1, 0, 0, 2, 2]], [[0, 1, 1, 2, 2], [2, 0, 0, 1, 1]]]}
+    with patch('deepchecks.vision.vision_data.batch_wrapper.sequence_to_numpy',
+               side_effect=sequence_to_numpy) as convert:
+        batch = BatchWrapper(batch, TaskType.OBJECT_DETECTION, 0).materialize()
+        n_conversions = convert.call_count
+        labels, images = batch.numpy_labels, batch.numpy_images
+
+        assert_that(batch.numpy_labels, same_instance(labels))
+        assert_that(batch.numpy_images, same_instance(images))
+        assert_that(convert.call_count, equal_to(n_conversions))
+    assert_that(images[1].dtype, equal_to(np.uint8))
+    assert_that(labels[1].shape, equal_to((2, 5)))
+    assert_that(list(batch.numpy_image_identifiers), equal_to(['0', '1']))
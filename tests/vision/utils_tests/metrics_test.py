@@ -11,7 +11,7 @@
 from typing import Dict
 
 import numpy as np
-from hamcrest import assert_that, close_to, has_items, has_length
+from hamcrest import assert_that, close_to, equal_to, has_items, has_length
 from ignite.engine import Engine
 from ignite.metrics import Metric
 from numpy import nanmean
@@ -20,6 +20,7 @@ from sklearn.metrics import jaccard_score, make_scorer
 from deepchecks.vision import VisionData
 from deepchecks.vision.metrics_utils import get_scorers_dict
 from deepchecks.vision.metrics_utils.detection_precision_recall import ObjectDetectionAveragePrecision
+from deepchecks.vision.metrics_utils.iou_utils import jaccard_iou, jaccard_iou_matrix
 from deepchecks.vision.metrics_utils.semantic_segmentation_metrics import MeanDice, MeanIoU, per_sample_dice
 from deepchecks.vision.vision_data.utils import sequence_to_numpy
 
@@ -105,6 +106,21 @@ def test_average_precision_thresholds(coco_visiondata_test):
     assert_that(res['ap'], close_to(0.514, 0.001))
 
 
+def test_jaccard_iou_matrix():
+    # Arrange
+    rng = np.random.RandomState(0)
+    detected = np.c_[rng.randint(0, 100, (20, 2)), rng.randint(0, 50, (20, 2)), rng.rand(20), np.zeros(20)]
+    ground_truth = np.c_[np.zeros(8), rng.randint(0, 100, (8, 2)), rng.randint(1, 50, (8, 2))]
+
+    # Act
+    ious = jaccard_iou_matrix(detected, ground_truth)
+
+    # Assert
+    expected = [[jaccard_iou(dt, gt) for gt in ground_truth] for dt in detected]
+    assert_that(np.array_equal(ious, expected, equal_nan=True), equal_to(True))
+    assert_that(jaccard_iou_matrix(detected, []).shape, equal_to((20, 0)))
+
+
 def test_segmentation_metrics(segmentation_coco_visiondata_train):
     dice_per_class = MeanDice()
     dice_micro = MeanDice(average='micro')